@@ -0,0 +1,274 @@
+"""
+Headless batch conversion. Imports every CodeWalker XML file in a directory and exports the imported objects
+again, one file at a time, then writes a JSON summary with the timings and errors of each file.
+
+Run it from Blender in background mode, with the add-on enabled. ``sollumz`` is the module name the add-on is
+installed as, e.g. ``bl_ext.user_default.sollumz`` when installed as an extension:
+
+    blender -b --python-exit-code 1 --python-expr "import sollumz.batch; sollumz.batch.main()" -- \\
+        --input <dir> --output <dir> [--formats ydr,yft] [--recursive] [--summary <file>] [--log-file <file>] \\
+        [--import-setting <name>=<value> ...] [--export-setting <name>=<value> ...]
+
+With ``--recursive``, the subdirectories of the input directory are mirrored in the output directory.
+
+Settings are the names of the import and export settings in the add-on preferences, e.g.
+``--export-setting apply_transforms=True``. They only apply to this run. Without ``--output``, files are only
+imported, which checks that they can be read. Blender exits with code 1 if any file failed.
+"""
+
+import argparse
+import ast
+import json
+import os
+import sys
+import time
+import traceback
+from datetime import datetime
+from typing import Any, Optional
+import bpy
+from .sollumz_helper import find_sollumz_parent
+from .sollumz_operators import IMPORT_XML_TYPES, get_export_filepath, get_exporter, import_file
+from .sollumz_preferences import get_export_settings, get_import_settings, preferences_saving_suspended
+from . import logger
+
+
+SUMMARY_FILE_NAME = "sollumz_batch_summary.json"
+
+
+class BatchJob:
+    """Import and export of a single input file"""
+
+    def __init__(self, input_filepath: str):
+        self.input_filepath = input_filepath
+        self.output_filepaths: list[str] = []
+        self.import_time = 0.0
+        self.export_time = 0.0
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.errors
+
+    def report(self, level: set[str], msg: str):
+        """Receives the messages of ``logger`` while the job runs, in place of an operator"""
+        if "ERROR" in level:
+            self.errors.append(msg)
+        elif "WARNING" in level:
+            self.warnings.append(msg)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "input": self.input_filepath,
+            "outputs": self.output_filepaths,
+            "succeeded": self.succeeded,
+            "import_time": self.import_time,
+            "export_time": self.export_time,
+            "errors": self.errors,
+            "warnings": self.warnings,
+        }
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="sollumz.batch", description="Convert CodeWalker XML files without a UI")
+    parser.add_argument("--input", required=True, help="Directory with the XML files to import")
+    parser.add_argument("--output", help="Directory to export the imported objects to")
+    parser.add_argument("--formats", help="Comma-separated file types to convert, e.g. 'ydr,yft'. Defaults to all")
+    parser.add_argument("--recursive", action="store_true", help="Also convert the files in subdirectories")
+    parser.add_argument("--summary", help=f"JSON summary path. Defaults to {SUMMARY_FILE_NAME} in the output "
+                        "directory, or the input directory without one")
+    parser.add_argument("--log-file", help="Append every message logged while converting to this file. The summary "
+                        "only lists the first ones")
+    parser.add_argument("--import-setting", action="append", default=[], metavar="NAME=VALUE",
+                        help="Import setting to use for this run")
+    parser.add_argument("--export-setting", action="append", default=[], metavar="NAME=VALUE",
+                        help="Export setting to use for this run")
+
+    return parser.parse_args(argv)
+
+
+def parse_setting(setting: str) -> tuple[str, Any]:
+    name, sep, value_str = setting.partition("=")
+    if not sep:
+        raise ValueError(f"Invalid setting '{setting}', expected <name>=<value>!")
+
+    try:
+        value = ast.literal_eval(value_str)
+    except (ValueError, SyntaxError):
+        # Enum values and other strings can be given without quotes
+        value = value_str
+
+    return name.strip(), value
+
+
+def apply_settings(settings: bpy.types.PropertyGroup, settings_strs: list[str]) -> dict[str, Any]:
+    """Set ``settings_strs`` on ``settings``, without saving them to the preferences file. Returns the previous
+    values."""
+    prev_values = {}
+    with preferences_saving_suspended():
+        for setting in settings_strs:
+            name, value = parse_setting(setting)
+            if name not in settings.__annotations__:
+                raise ValueError(f"Unknown setting '{name}'!")
+
+            prev_values[name] = getattr(settings, name)
+            setattr(settings, name, value)
+
+    return prev_values
+
+
+def restore_settings(settings: bpy.types.PropertyGroup, prev_values: dict[str, Any]):
+    with preferences_saving_suspended():
+        for name, value in prev_values.items():
+            setattr(settings, name, value)
+
+
+def get_input_filepaths(directory: str, formats: Optional[list[str]], recursive: bool) -> list[str]:
+    extensions = [xml_type.file_extension for xml_type in IMPORT_XML_TYPES]
+    if formats:
+        extensions = [ext for ext in extensions if ext.split(".")[1] in formats]
+
+    filepaths = []
+    for root, dirs, filenames in os.walk(directory):
+        for filename in sorted(filenames):
+            if any(filename.endswith(ext) for ext in extensions):
+                filepaths.append(os.path.join(root, filename))
+
+        if not recursive:
+            break
+
+        dirs.sort()
+
+    return filepaths
+
+
+def get_job_output_directory(input_filepath: str, input_directory: str, output_directory: str) -> str:
+    """Get the directory to export the objects of ``input_filepath`` to. Subdirectories of the input directory are
+    mirrored in the output directory, so files with the same name in different subdirectories don't overwrite each
+    other."""
+    relative_directory = os.path.relpath(os.path.dirname(os.path.abspath(input_filepath)),
+                                         os.path.abspath(input_directory))
+    if relative_directory == os.curdir:
+        return output_directory
+
+    return os.path.join(output_directory, relative_directory)
+
+
+def run_job(job: BatchJob, output_directory: Optional[str], log_filepath: Optional[str] = None,
+            written_filepaths: Optional[set[str]] = None):
+    prev_objs = set(bpy.data.objects)
+    if written_filepaths is None:
+        written_filepaths = set()
+
+    with logger.buffered_logging(job, log_filepath):
+        try:
+            convert_file(job, output_directory, prev_objs, written_filepaths)
+        except Exception:
+            job.errors.append(traceback.format_exc())
+        finally:
+            # Leave the scene as it was for the next file
+            for obj in [obj for obj in bpy.data.objects if obj not in prev_objs]:
+                bpy.data.objects.remove(obj)
+            bpy.data.orphans_purge(do_recursive=True)
+
+
+def convert_file(job: BatchJob, output_directory: Optional[str], prev_objs: set[bpy.types.Object],
+                 written_filepaths: set[str]):
+    """Import the file of ``job`` and export its objects to ``output_directory``. Objects that would overwrite one of
+    ``written_filepaths`` are reported as errors instead."""
+    start = time.perf_counter()
+    try:
+        import_file(job.input_filepath)
+    finally:
+        job.import_time = time.perf_counter() - start
+
+    if output_directory is None:
+        return
+
+    new_objs = [obj for obj in bpy.data.objects if obj not in prev_objs]
+    parent_objs = {find_sollumz_parent(obj) for obj in new_objs}
+    parent_objs.discard(None)
+
+    start = time.perf_counter()
+    try:
+        for obj in sorted(parent_objs, key=lambda obj: obj.name):
+            exporter = get_exporter(obj)
+            if exporter is None:
+                continue
+
+            file_extension, export_func = exporter
+            filepath = get_export_filepath(obj, output_directory, file_extension)
+            filepath_key = os.path.normcase(os.path.abspath(filepath))
+            if filepath_key in written_filepaths:
+                job.errors.append(f"Could not export '{obj.name}': '{filepath}' was already written in this batch!")
+                continue
+
+            if export_func(obj, filepath):
+                job.output_filepaths.append(filepath)
+                written_filepaths.add(filepath_key)
+    finally:
+        job.export_time = time.perf_counter() - start
+
+
+def run_batch(input_directory: str, output_directory: Optional[str] = None, formats: Optional[list[str]] = None,
+              recursive: bool = False, log_filepath: Optional[str] = None) -> dict[str, Any]:
+    """Convert the files in ``input_directory`` with the current settings. Returns the summary."""
+    if output_directory is not None:
+        os.makedirs(output_directory, exist_ok=True)
+
+    start = time.perf_counter()
+    started_at = datetime.now().isoformat(timespec="seconds")
+    jobs = [BatchJob(filepath) for filepath in get_input_filepaths(input_directory, formats, recursive)]
+    written_filepaths = set()
+
+    for i, job in enumerate(jobs):
+        print(f"[{i + 1}/{len(jobs)}] {job.input_filepath}")
+
+        job_output_directory = None
+        if output_directory is not None:
+            job_output_directory = get_job_output_directory(job.input_filepath, input_directory, output_directory)
+            os.makedirs(job_output_directory, exist_ok=True)
+
+        run_job(job, job_output_directory, log_filepath, written_filepaths)
+
+    num_failed = sum(not job.succeeded for job in jobs)
+
+    return {
+        "started_at": started_at,
+        "time": time.perf_counter() - start,
+        "input_directory": input_directory,
+        "output_directory": output_directory,
+        "num_files": len(jobs),
+        "num_failed": num_failed,
+        "files": [job.to_dict() for job in jobs],
+    }
+
+
+def main(argv: Optional[list[str]] = None):
+    """Entry point, reads the arguments after '--' from the Blender command line if ``argv`` isn't given"""
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    args = parse_args(argv)
+    formats = [fmt.strip().lower() for fmt in args.formats.split(",")] if args.formats else None
+    summary_filepath = args.summary or os.path.join(args.output or args.input, SUMMARY_FILE_NAME)
+
+    import_settings = get_import_settings()
+    export_settings = get_export_settings()
+    prev_import_values = apply_settings(import_settings, args.import_setting)
+    prev_export_values = apply_settings(export_settings, args.export_setting)
+
+    try:
+        summary = run_batch(args.input, args.output, formats, args.recursive, args.log_file)
+    finally:
+        restore_settings(import_settings, prev_import_values)
+        restore_settings(export_settings, prev_export_values)
+
+    with open(summary_filepath, "w") as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"Converted {summary['num_files'] - summary['num_failed']}/{summary['num_files']} files in "
+          f"{summary['time']:.2f} seconds, summary written to '{summary_filepath}'")
+
+    if summary["num_failed"]:
+        sys.exit(1)
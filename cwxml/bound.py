@@ -1,6 +1,5 @@
 from abc import ABC as AbstractClass, abstractmethod
-from collections import defaultdict
-from mathutils import Vector
+import numpy as np
 from xml.etree import ElementTree as ET
 from .element import (
     AttributeProperty,
@@ -105,89 +104,87 @@ class BoundCloth(BoundChild):
     type = "Cloth"
 
 
+def rows_to_text(arr: np.ndarray) -> str:
+    """Format a 2D array as one line of comma-separated values per row, each line followed by a newline."""
+    num_columns = arr.shape[1]
+    components = map(str, arr.ravel().tolist())
+    lines = map(", ".join, zip(*[components] * num_columns))
+
+    return "\n" + "\n".join(lines) + "\n"
+
+
 class VerticesProperty(ElementProperty):
-    value_types = (list)
+    """Holds vertex positions as an (N, 3) float32 array."""
+    value_types = (np.ndarray)
 
     def __init__(self, tag_name: str = "Vertices", value=None):
-        super().__init__(tag_name, value or [])
+        super().__init__(tag_name, value if value is not None else np.empty((0, 3), dtype=np.float32))
 
     @staticmethod
     def from_xml(element: ET.Element):
-        new = VerticesProperty(element.tag, [])
-        text = element.text.strip().split("\n")
-        if len(text) > 0:
-            for line in text:
-                coords = line.strip().split(",")
-                if not len(coords) == 3:
-                    return VerticesProperty.read_value_error(element)
+        new = VerticesProperty(element.tag)
+        text = element.text.strip() if element.text else ""
+
+        if not text:
+            return new
+
+        num_verts = text.count("\n") + 1
+        # Parse as double first, the same as float(), so values round to float32 the same way
+        values = np.fromstring(text.replace(",", " "), sep=" ", dtype=np.float64)
 
-                new.value.append(
-                    Vector((float(coords[0]), float(coords[1]), float(coords[2]))))
+        if values.size != num_verts * 3:
+            return VerticesProperty.read_value_error(element)
+
+        new.value = values.astype(np.float32).reshape((num_verts, 3))
 
         return new
 
     def to_xml(self):
-        element = ET.Element(self.tag_name)
-        text = ["\n"]
-
-        if not self.value:
+        if len(self.value) == 0:
             return
 
-        for vertex in self.value:
-            if not isinstance(vertex, Vector):
-                raise TypeError(
-                    f"VerticesProperty can only contain Vector objects, not '{type(self.value)}'!")
-            for index, component in enumerate(vertex):
-                text.append(str(component))
-                if index < len(vertex) - 1:
-                    text.append(", ")
-            text.append("\n")
-
-        element.text = "".join(text)
+        element = ET.Element(self.tag_name)
+        # Format the float32 values the same as str() on the float they widen to
+        element.text = rows_to_text(np.asarray(self.value, dtype=np.float32).astype(np.float64))
 
         return element
 
 
 class OctantsProperty(ElementProperty):
-    value_types = (dict)
+    """Holds the vertex indices of each octant as an ``(offsets, indices)`` pair of uint32 arrays. The indices of
+    octant ``i`` are ``indices[offsets[i]:offsets[i + 1]]``."""
+    value_types = (tuple)
 
     def __init__(self, tag_name: str = "Octants", value=None):
-        super().__init__(tag_name, value or {})
+        super().__init__(tag_name, value or (np.zeros(1, dtype=np.uint32), np.empty(0, dtype=np.uint32)))
 
     @staticmethod
     def from_xml(element: ET.Element):
-        new = OctantsProperty(element.tag, {})
+        new = OctantsProperty(element.tag)
 
-        if not element.text:
+        if not element.text or not element.text.strip():
             return new
 
-        octants = defaultdict(list)
-        lines = element.text.strip().split("\n")
+        octants = [np.fromstring(line.replace(",", " "), sep=" ", dtype=np.uint32)
+                   for line in element.text.strip().split("\n")]
 
-        for i, line in enumerate(lines):
-            for vert_ind in line.strip().replace(" ", "").split(","):
-                if not vert_ind:
-                    continue
-
-                octants[i].append(int(vert_ind))
-
-        new.value = octants
+        offsets = np.zeros(len(octants) + 1, dtype=np.uint32)
+        np.cumsum([len(indices) for indices in octants], out=offsets[1:])
+        new.value = (offsets, np.concatenate(octants))
 
         return new
 
     def to_xml(self):
         element = ET.Element(self.tag_name)
-
-        element.text = "\n"
+        offsets, indices = self.value
+        offsets = offsets.tolist()
         lines: list[str] = []
 
-        for indices in self.value.values():
-            if not indices:
+        for start, end in zip(offsets, offsets[1:]):
+            if start == end:
                 continue
 
-            str_indices = [str(i) for i in indices]
-
-            lines.append(",".join(str_indices))
+            lines.append(",".join(map(str, indices[start:end].tolist())))
 
         element.text = "\n".join(lines)
 
@@ -269,38 +266,36 @@ class MaterialsList(ListProperty):
 
 
 class VertexColorProperty(ElementProperty):
-    value_types = (list[tuple[int, int, int, int]])
+    """Holds vertex colors as an (N, 4) uint8 RGBA array."""
+    value_types = (np.ndarray)
 
     def __init__(self, tag_name: str = "VertexColours", value=None):
-        super().__init__(tag_name, value or [])
+        super().__init__(tag_name, value if value is not None else np.empty((0, 4), dtype=np.uint8))
 
     @staticmethod
     def from_xml(element: ET.Element):
-        new = VertexColorProperty(element.tag, [])
-        text = element.text.strip().split("\n")
-        if len(text) > 0:
-            for line in text:
-                colors = line.strip().split(",")
-                if len(colors) != 4:
-                    return VertexColorProperty.read_value_error(element)
+        new = VertexColorProperty(element.tag)
+        text = element.text.strip() if element.text else ""
+
+        if not text:
+            return new
 
-                new.value.append((int(colors[0]), int(colors[1]), int(colors[2]), int(colors[3])))
+        num_colors = text.count("\n") + 1
+        values = np.fromstring(text.replace(",", " "), sep=" ", dtype=np.int64)
+
+        if values.size != num_colors * 4:
+            return VertexColorProperty.read_value_error(element)
+
+        new.value = values.astype(np.uint8).reshape((num_colors, 4))
 
         return new
 
     def to_xml(self):
-        element = ET.Element(self.tag_name)
-        element.text = "\n"
-
         if len(self.value) == 0:
             return None
 
-        for color in self.value:
-            for index, component in enumerate(color):
-                element.text += str(int(component))
-                if index < len(color) - 1:
-                    element.text += ", "
-            element.text += "\n"
+        element = ET.Element(self.tag_name)
+        element.text = rows_to_text(np.asarray(self.value, dtype=np.uint8))
 
         return element
 
@@ -0,0 +1,300 @@
+"""Binary cache of parsed XML files"""
+import functools
+import gc
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Optional
+import numpy as np
+from mathutils import Color, Euler, Matrix, Quaternion, Vector
+from .. import logger
+
+# Arrays smaller than this (in bytes) are pickled with the object instead of stored as .npy files
+MIN_NPY_SIZE = 1 << 16
+
+META_FILE_NAME = "meta.json"
+OBJECT_FILE_NAME = "object.pickle"
+# Entries being written are in directories with this suffix
+TMP_SUFFIX = ".tmp"
+# Temporary and incomplete entries younger than this (in seconds) may still be written by another Blender instance
+STALE_ENTRY_AGE = 60 * 60
+
+
+def get_file_hash(filepath: str) -> str:
+    file_hash = hashlib.sha1()
+    with open(filepath, "rb") as f:
+        while chunk := f.read(1 << 20):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+def get_source_hash(directory: str) -> str:
+    """Hash of the Python source files in ``directory``"""
+    source_hash = hashlib.sha1()
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".py"):
+            source_hash.update(name.encode())
+            with open(os.path.join(directory, name), "rb") as f:
+                source_hash.update(f.read())
+
+    return source_hash.hexdigest()
+
+
+@functools.cache
+def get_cache_version() -> str:
+    """Identifies the cwxml code that wrote an entry. Part of the entry keys, so entries written before the cwxml
+    classes (or this module) changed are never read and are evicted as they go unused."""
+    return get_source_hash(os.path.dirname(__file__))
+
+
+def is_stale(path: str) -> bool:
+    try:
+        return time.time() - os.stat(path).st_mtime > STALE_ENTRY_AGE
+    except OSError:
+        return False
+
+
+def new_mathutils_object(type_name: str, *args):
+    return MATHUTILS_TYPES[type_name](*args)
+
+
+MATHUTILS_TYPES = {cls.__name__: cls for cls in (Color, Euler, Matrix, Quaternion, Vector)}
+
+
+def load_entry_array(name: str):
+    """Stands in for arrays stored as .npy files. ``CacheEntryUnpickler`` replaces it with the loader of its entry."""
+    raise pickle.UnpicklingError(f"Array '{name}' can only be loaded from a cache entry!")
+
+
+@contextmanager
+def paused_gc():
+    """Pickling creates or visits a lot of objects at once, don't let the garbage collector scan them over and
+    over"""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+class ElementPickler(pickle.Pickler):
+    """Pickles parsed XML objects. Adds support for mathutils types."""
+
+    def __init__(self, file):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def reducer_override(self, obj):
+        # mathutils types don't support pickling
+        if isinstance(obj, (Vector, Quaternion, Color)):
+            return new_mathutils_object, (type(obj).__name__, tuple(obj))
+        if isinstance(obj, Matrix):
+            return new_mathutils_object, ("Matrix", tuple(tuple(row) for row in obj))
+        if isinstance(obj, Euler):
+            return new_mathutils_object, ("Euler", tuple(obj), obj.order)
+
+        if getattr(obj, "_data_str", None) is not None:
+            # Decode lazily loaded buffers, so the arrays are pickled instead of the text
+            obj.data
+
+        return NotImplemented
+
+
+class CacheEntryPickler(ElementPickler):
+    """Pickles an object graph to ``entry_dir``. Numpy arrays are saved next to it as .npy files."""
+
+    def __init__(self, file, entry_dir: str):
+        super().__init__(file)
+        self.entry_dir = entry_dir
+        self.num_arrays = 0
+
+    def reducer_override(self, obj):
+        if type(obj) is np.ndarray and obj.nbytes >= MIN_NPY_SIZE and not obj.dtype.hasobject:
+            name = f"{self.num_arrays}.npy"
+            np.save(os.path.join(self.entry_dir, name), obj, allow_pickle=False)
+            self.num_arrays += 1
+
+            return load_entry_array, (name,)
+
+        return super().reducer_override(obj)
+
+
+class CacheEntryUnpickler(pickle.Unpickler):
+    def __init__(self, file, entry_dir: str):
+        super().__init__(file)
+        self.entry_dir = entry_dir
+
+    def find_class(self, module_name: str, name: str):
+        if module_name == __name__ and name == load_entry_array.__name__:
+            return self.load_array
+
+        return super().find_class(module_name, name)
+
+    def load_array(self, name: str):
+        # Copy-on-write, callers can modify the arrays without changing the cache
+        return np.load(os.path.join(self.entry_dir, name), mmap_mode="c", allow_pickle=False)
+
+
+class XmlCache:
+    """Stores parsed XML files in ``directory`` so reading an unchanged file again skips parsing it. Entries are
+    keyed on the cwxml code, the file path and the type it was read as, and are used while the size and modification
+    time, or failing that the content hash, of the file match. Least recently used entries are removed once the
+    cache is larger than ``max_size`` bytes."""
+
+    def __init__(self, directory: str, max_size: int):
+        self.directory = directory
+        self.max_size = max_size
+
+    def load(self, cls, filepath: str):
+        """Get the object ``cls.parse_xml_file(filepath)`` returns, from the cache if the file is unchanged"""
+        stat = os.stat(filepath)
+        entry_dir = self.get_entry_dir(cls, filepath)
+        meta = self._read_meta(entry_dir)
+
+        if meta is not None and meta["size"] == stat.st_size:
+            if meta["mtime_ns"] != stat.st_mtime_ns and meta["hash"] == get_file_hash(filepath):
+                # Touched but not modified
+                meta["mtime_ns"] = stat.st_mtime_ns
+
+            if meta["mtime_ns"] == stat.st_mtime_ns:
+                obj = self._read_entry(entry_dir)
+
+                if obj is not None:
+                    meta["last_used"] = time.time()
+                    try:
+                        self._write_meta(entry_dir, meta)
+                    except OSError:
+                        # Entry replaced or removed by another Blender instance meanwhile
+                        pass
+                    return obj
+
+        obj = cls.parse_xml_file(filepath)
+
+        try:
+            self._write_entry(entry_dir, obj, filepath, stat)
+            self.evict()
+        except Exception as e:
+            logger.warning(f"Failed to cache '{filepath}': {e}")
+
+        return obj
+
+    def get_entry_dir(self, cls, filepath: str) -> str:
+        key = f"{get_cache_version()}:{cls.__module__}.{cls.__qualname__}:{os.path.normcase(os.path.abspath(filepath))}"
+        variant = cls.read_variant()
+        if variant:
+            key += f":{variant}"
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest())
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in ``max_size``"""
+        entries = []
+        total_size = 0
+
+        for name in os.listdir(self.directory):
+            entry_dir = os.path.join(self.directory, name)
+            meta = None if name.endswith(TMP_SUFFIX) else self._read_meta(entry_dir)
+
+            if meta is None:
+                # Being written, possibly by another Blender instance sharing the cache, so only removed once it is
+                # old enough to be left over from a failed write
+                if is_stale(entry_dir):
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                continue
+
+            # Entries of other cwxml code may have been written with another layout
+            num_bytes = meta.get("num_bytes", 0)
+            entries.append((meta.get("last_used", 0), num_bytes, entry_dir))
+            total_size += num_bytes
+
+        for _, num_bytes, entry_dir in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            # Can fail on Windows while the memory-mapped arrays of the entry are in use
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= num_bytes
+
+    def _read_entry(self, entry_dir: str):
+        try:
+            with open(os.path.join(entry_dir, OBJECT_FILE_NAME), "rb") as f, paused_gc():
+                return CacheEntryUnpickler(f, entry_dir).load()
+        except Exception:
+            # Missing files or classes that no longer match, read the file again
+            return None
+
+    def _write_entry(self, entry_dir: str, obj, filepath: str, stat: os.stat_result):
+        # Written to a temporary directory first so a failed write never leaves a partial entry. Unique to this
+        # write, other Blender instances can be writing the same entry.
+        tmp_dir = f"{entry_dir}.{uuid.uuid4().hex}{TMP_SUFFIX}"
+        os.makedirs(tmp_dir)
+
+        try:
+            with open(os.path.join(tmp_dir, OBJECT_FILE_NAME), "wb") as f, paused_gc():
+                CacheEntryPickler(f, tmp_dir).dump(obj)
+
+            meta = {
+                "version": get_cache_version(),
+                "path": os.path.abspath(filepath),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "hash": get_file_hash(filepath),
+                "num_bytes": sum(entry.stat().st_size for entry in os.scandir(tmp_dir)),
+                "last_used": time.time(),
+            }
+            self._write_meta(tmp_dir, meta)
+
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _read_meta(self, entry_dir: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(entry_dir, META_FILE_NAME), "r") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        return meta
+
+    def _write_meta(self, entry_dir: str, meta: dict):
+        # Replaced at once, so it is never read half written
+        tmp_path = os.path.join(entry_dir, f"{META_FILE_NAME}.{uuid.uuid4().hex}{TMP_SUFFIX}")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(meta, f)
+
+            os.replace(tmp_path, os.path.join(entry_dir, META_FILE_NAME))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+_active_cache: Optional[XmlCache] = None
+
+
+def get_active_cache() -> Optional[XmlCache]:
+    return _active_cache
+
+
+@contextmanager
+def use_cache(cache: Optional[XmlCache]):
+    """Read XML files through ``cache`` in ``Element.from_xml_file`` while in this context. ``None`` disables
+    caching."""
+    global _active_cache
+
+    prev_cache = _active_cache
+    _active_cache = cache
+
+    try:
+        yield cache
+    finally:
+        _active_cache = prev_cache
@@ -15,6 +15,7 @@ from .element import (
 from xml.etree import ElementTree as ET
 from inspect import isclass
 from math import sqrt
+import numpy as np
 
 
 class YCD:
@@ -125,74 +126,69 @@ class AttributesList(ItemTypeList):
     tag_name = "Attributes"
 
 
-class ValuesBuffer(ElementProperty):
-    value_types = (list)
+class ArrayBuffer(ElementProperty, AbstractClass):
+    """Holds a flat numpy array of channel data, written as rows of 10 space-separated values."""
+    __slots__ = ()
 
-    def __init__(self):
-        super().__init__(tag_name="Values", value=[])
+    columns = 10
+
+    value_types = (np.ndarray)
+
+    @property
+    @abstractmethod
+    def dtype(self) -> type:
+        raise NotImplementedError
+
+    def __init__(self, tag_name: str):
+        super().__init__(tag_name, np.empty(0, dtype=self.dtype))
 
     @classmethod
     def from_xml(cls, element: ET.Element):
         new = cls()
-        text = element.text.strip().split("\n")
-        if len(text) > 0:
-            for line in text:
-                items = line.strip().split(" ")
-                for item in items:
-                    new.value.append(float(item))
+
+        if element.text:
+            new.value = np.fromstring(element.text, dtype=cls.dtype, sep=" ")
 
         return new
 
+    def format_values(self, arr: np.ndarray) -> list[str]:
+        return list(map(str, arr.tolist()))
+
     def to_xml(self):
         element = ET.Element(self.tag_name)
-        columns = 10
-        text = []
+        values = self.format_values(np.asarray(self.value, dtype=self.dtype))
+        rows = [" ".join(values[i:i + self.columns]) for i in range(0, len(values), self.columns)]
+        text = " \n".join(rows)
 
-        for index, value in enumerate(self.value):
-            text.append(str(value))
-            if index < len(self.value) - 1:
-                text.append(" ")
-            if (index + 1) % columns == 0:
-                text.append("\n")
+        if values and len(values) % self.columns == 0:
+            text += "\n"
 
-        element.text = "".join(text)
+        element.text = text
 
         return element
 
 
-class FramesBuffer(ElementProperty):
-    value_types = (list)
+class ValuesBuffer(ArrayBuffer):
+    __slots__ = ()
 
-    def __init__(self):
-        super().__init__(tag_name="Frames", value=[])
+    dtype = np.float32
 
-    @classmethod
-    def from_xml(cls, element: ET.Element):
-        new = cls()
-        text = element.text.strip().split("\n")
-        if len(text) > 0:
-            for line in text:
-                items = line.strip().split(" ")
-                for item in items:
-                    new.value.append(int(item))
+    def __init__(self):
+        super().__init__("Values")
 
-        return new
+    def format_values(self, arr: np.ndarray) -> list[str]:
+        # float32 scalars format to the shortest string that reads back as the same float32, unlike the float
+        # they widen to
+        return list(map(str, arr))
 
-    def to_xml(self):
-        element = ET.Element(self.tag_name)
-        columns = 10
-        text = []
 
-        for index, value in enumerate(self.value):
-            text.append(str(value))
-            if index < len(self.value) - 1:
-                text.append(" ")
-            if (index + 1) % columns == 0:
-                text.append("\n")
+class FramesBuffer(ArrayBuffer):
+    __slots__ = ()
 
-        element.text = "".join(text)
+    dtype = np.uint32
 
-        return element
+    def __init__(self):
+        super().__init__("Frames")
 
 
 class ChannelsList(ItemTypeList):
@@ -253,7 +249,7 @@ class ChannelsList(ItemTypeList):
             self.type = "RawFloat"
 
         def get_value(self, frame_id, channel_values):
-            return self.values[frame_id % len(self.values)]
+            return float(self.values[frame_id % len(self.values)])
 
     class QuantizeFloat(Channel):
         type = "QuantizeFloat"
@@ -266,7 +262,7 @@ class ChannelsList(ItemTypeList):
             self.type = "QuantizeFloat"
 
         def get_value(self, frame_id, channel_values):
-            return self.values[frame_id % len(self.values)]
+            return float(self.values[frame_id % len(self.values)])
 
     class IndirectQuantizeFloat(QuantizeFloat):
         type = "IndirectQuantizeFloat"
@@ -277,7 +273,7 @@ class ChannelsList(ItemTypeList):
             self.type = "IndirectQuantizeFloat"
 
         def get_value(self, frame_id, channel_values):
-            return self.values[(self.frames[frame_id % len(self.frames)]) % len(self.values)]
+            return float(self.values[self.frames[frame_id % len(self.frames)] % len(self.values)])
 
     class LinearFloat(QuantizeFloat):
         type = "LinearFloat"
@@ -3,11 +3,14 @@ import os
 from mathutils import Matrix
 import numpy as np
 from numpy.typing import NDArray
-from ..tools.utils import np_arr_to_str
-from typing import Optional
+from ..tools.utils import np_arr_to_str, np_arr_to_str_chunks
+from typing import Iterator, NamedTuple, Optional
 from abc import ABC as AbstractClass, abstractmethod
 from xml.etree import ElementTree as ET
+from xml.parsers import expat
 from .element import (
+    pop_streamed_children,
+    ElementWriter,
     AttributeProperty,
     FlagsProperty,
     Element,
@@ -44,6 +47,10 @@ class YDD:
     def from_xml_file(filepath):
         return DrawableDictionary.from_xml_file(filepath)
 
+    @staticmethod
+    def from_xml_file_indexed(filepath):
+        return DrawableDictionary.from_xml_file_indexed(filepath)
+
     @staticmethod
     def write_xml(drawable_dict, filepath):
         return drawable_dict.write_xml(filepath)
@@ -427,6 +434,20 @@ class VertexBuffer(ElementTree):
 
         self.layout = VertexLayoutList()
 
+    @property
+    def data(self) -> Optional[NDArray]:
+        """Structured array of the vertices. Data read from XML is decoded on first access."""
+        if self._data_str is not None:
+            self._load_data_from_str(self._data_str)
+
+        return self._data
+
+    @data.setter
+    def data(self, value: Optional[NDArray]):
+        self._data = value
+        # Release the text once decoded or replaced
+        self._data_str = None
+
     @classmethod
     def from_xml(cls, element: ET.Element):
         new = super().from_xml(element)
@@ -440,17 +461,18 @@ class VertexBuffer(ElementTree):
         if data_elem is None or not data_elem.text:
             return new
 
-        new._load_data_from_str(data_elem.text)
+        # Keep the text and only decode it when the data is accessed
+        new._data_str = data_elem.text
 
         return new
 
     def to_xml(self):
+        if self.data is None:
+            return super().to_xml()
+
         self.layout = self.data.dtype.names
         element = super().to_xml()
 
-        if self.data is None:
-            return element
-
         data_elem = ET.Element("Data")
         data_elem.text = self._data_to_str()
 
@@ -462,9 +484,53 @@ class VertexBuffer(ElementTree):
         struct_dtype = np.dtype([self.VERT_ATTR_DTYPES[attr_name]
                                  for attr_name in self.layout])
 
-        self.data = np.loadtxt(io.StringIO(_str), dtype=struct_dtype)
+        try:
+            self.data = np.loadtxt(io.StringIO(_str), dtype=struct_dtype, ndmin=1)
+        except ValueError:
+            # Rows don't match the layout (e.g. a vertex wrapped onto multiple lines), read the values as one stream
+            self.data = self._data_from_values_str(_str, struct_dtype)
+
+    @staticmethod
+    def _data_from_values_str(_str: str, struct_dtype: np.dtype) -> NDArray:
+        """Tokenize the whole block into a flat array and scatter it into the fields of ``struct_dtype``"""
+        values = np.array(_str.split(), dtype=np.float64)
+        num_cols = sum(struct_dtype[name].shape[0] for name in struct_dtype.names)
+
+        if values.size % num_cols != 0:
+            raise ValueError(
+                f"Vertex buffer has {values.size} values, which is not a multiple of the {num_cols} values per vertex in the layout!")
+
+        values = values.reshape((-1, num_cols))
+        data = np.empty(len(values), dtype=struct_dtype)
+
+        col = 0
+        for name in struct_dtype.names:
+            size = struct_dtype[name].shape[0]
+            data[name] = values[:, col:col + size]
+            col += size
+
+        return data
+
+    def stream_children(self, writer: ElementWriter, level: int):
+        if self.data is None:
+            super().stream_children(writer, level)
+            return
+
+        self.layout = self.data.dtype.names
+        super().stream_children(writer, level)
+
+        if len(self.data) < 2:
+            # Fits on one line, written inline
+            writer.leaf("Data", {}, self._data_to_str(), level)
+            return
+
+        writer.leaf_lines("Data", {}, self._data_to_str_chunks(), level)
 
     def _data_to_str(self):
+        return "\n".join(self._data_to_str_chunks())
+
+    def _data_to_str_chunks(self, chunk_rows: int = 4096) -> Iterator[str]:
+        """Format the vertices in chunks of ``chunk_rows`` rows"""
         vert_arr = self.data
 
         FLOAT_FMT = "%.7f"
@@ -481,10 +547,12 @@ class VertexBuffer(ElementTree):
             formats.append(" ".join([attr_fmt] * column.shape[1]))
 
         fmt = ATTR_SEP.join(formats)
-        vert_arr_2d = np.column_stack(
-            [vert_arr[name] for name in vert_arr.dtype.names])
 
-        return np_arr_to_str(vert_arr_2d, fmt)
+        for start in range(0, len(vert_arr), chunk_rows):
+            chunk = vert_arr[start:start + chunk_rows]
+            chunk_2d = np.column_stack([chunk[name] for name in vert_arr.dtype.names])
+
+            yield from np_arr_to_str_chunks(chunk_2d, fmt, chunk_rows)
 
 
 class IndexBuffer(ElementTree):
@@ -494,6 +562,20 @@ class IndexBuffer(ElementTree):
         super().__init__()
         self.data: Optional[NDArray] = None
 
+    @property
+    def data(self) -> Optional[NDArray]:
+        """Array of the indices. Data read from XML is decoded on first access."""
+        if self._data_str is not None:
+            self._load_data_from_str(self._data_str)
+
+        return self._data
+
+    @data.setter
+    def data(self, value: Optional[NDArray]):
+        self._data = value
+        # Release the text once decoded or replaced
+        self._data_str = None
+
     @classmethod
     def from_xml(cls, element: ET.Element):
         new = cls()
@@ -503,9 +585,13 @@ class IndexBuffer(ElementTree):
         if data_elem is None or not data_elem.text:
             return new
 
-        new.data = np.fromstring(data_elem.text, sep=" ", dtype=np.uint32)
+        # Keep the text and only decode it when the data is accessed
+        new._data_str = data_elem.text
         return new
 
+    def _load_data_from_str(self, _str: str):
+        self.data = np.fromstring(_str, sep=" ", dtype=np.uint32)
+
     def to_xml(self):
         element = ET.Element(self.tag_name)
 
@@ -519,6 +605,17 @@ class IndexBuffer(ElementTree):
 
         return element
 
+    def stream_children(self, writer: ElementWriter, level: int):
+        if self.data is None:
+            return
+
+        if len(self.data) == 0:
+            # No lines to stream, to_xml writes the bare newline
+            writer.leaf("Data", {}, self._inds_to_str(), level)
+            return
+
+        writer.leaf_lines("Data", {}, self._inds_to_str_chunks(), level)
+
     def _inds_to_str(self):
         indices_arr = self.data
 
@@ -538,6 +635,18 @@ class IndexBuffer(ElementTree):
 
         return f"{index_buffer_str}\n{last_row_str}"
 
+    def _inds_to_str_chunks(self) -> Iterator[str]:
+        """Same lines as ``_inds_to_str`` in chunks of rows, without the empty line"""
+        indices_arr = self.data
+
+        num_inds = len(indices_arr)
+        num_divisble_inds = num_inds - (num_inds % 24)
+
+        yield from np_arr_to_str_chunks(indices_arr[:num_divisble_inds].reshape((-1, 24)), fmt="%.0u")
+
+        if num_divisble_inds < num_inds:
+            yield np_arr_to_str(indices_arr[num_divisble_inds:], fmt="%.0u")
+
 
 class Geometry(ElementTree):
     tag_name = "Item"
@@ -666,6 +775,90 @@ class Drawable(ElementTree, AbstractClass):
             element.append(bound.to_xml())
         return element
 
+    def stream_children(self, writer: ElementWriter, level: int):
+        super().stream_children(writer, level)
+        for bound in self.bounds:
+            bound.tag_name = "Bounds"
+            bound.stream_xml(writer, level)
+
+
+class DrawableSpan(NamedTuple):
+    """Location of a not yet read drawable in a drawable dictionary file"""
+    name: str
+    # Byte offset of the <Item> start tag
+    start: int
+    # Byte offset of the </Item> end tag
+    end: int
+    # Whether it has a <Skeleton> with bones
+    has_skeleton: bool = False
+
+
+def index_drawable_dictionary(filepath: str) -> list[DrawableSpan]:
+    """Find the name and location of each drawable in the drawable dictionary at ``filepath``. Only scans the tags,
+    nothing is converted."""
+    spans = []
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    depth = 0
+    item_start = 0
+    name_parts = None
+    name = ""
+    # Tags of the open elements inside the drawable
+    path = []
+    has_skeleton = False
+
+    def start_element(tag, attrib):
+        nonlocal depth, item_start, name_parts, name, has_skeleton
+        depth += 1
+        if depth == 2 and tag == "Item":
+            item_start = parser.CurrentByteIndex
+            name = ""
+            has_skeleton = False
+        elif depth == 3 and tag == "Name":
+            name_parts = []
+
+        if depth >= 3:
+            path.append(tag)
+            if depth == 5 and path == ["Skeleton", "Bones", "Item"]:
+                has_skeleton = True
+
+    def end_element(tag):
+        nonlocal depth, name_parts, name
+        if depth >= 3:
+            path.pop()
+
+        if depth == 2 and tag == "Item":
+            spans.append(DrawableSpan(name, item_start, parser.CurrentByteIndex, has_skeleton))
+        elif depth == 3 and name_parts is not None:
+            name = "".join(name_parts).strip()
+            name_parts = None
+        depth -= 1
+
+    def character_data(data):
+        if name_parts is not None:
+            name_parts.append(data)
+
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+
+    with open(filepath, "rb") as file:
+        parser.ParseFile(file)
+
+    return spans
+
+
+def read_drawable_span(filepath: str, span: DrawableSpan) -> "Drawable":
+    with open(filepath, "rb") as file:
+        file.seek(span.start)
+        data = file.read(span.end - span.start)
+        # Rest of the end tag, or of the start tag for <Item />
+        tail = file.read(64)
+
+    data += tail[:tail.index(b">") + 1]
+
+    return Drawable.parse_xml_file(io.BytesIO(data))
+
 
 class DrawableDictionary(MutableSequence, Element):
     tag_name = "DrawableDictionary"
@@ -673,9 +866,19 @@ class DrawableDictionary(MutableSequence, Element):
     def __init__(self, value=None):
         super().__init__()
         self._value = value or []
+        # File the DrawableSpans in _value are read from
+        self._filepath = None
 
     def __getitem__(self, name):
-        return self._value[name]
+        if isinstance(name, slice):
+            return [self[i] for i in range(*name.indices(len(self._value)))]
+
+        drawable = self._value[name]
+        if isinstance(drawable, DrawableSpan):
+            drawable = read_drawable_span(self._filepath, drawable)
+            self._value[name] = drawable
+
+        return drawable
 
     def __setitem__(self, key, value):
         self._value[key] = value
@@ -684,7 +887,8 @@ class DrawableDictionary(MutableSequence, Element):
         del self._value[key]
 
     def __iter__(self):
-        return iter(self._value)
+        for i in range(len(self._value)):
+            yield self[i]
 
     def __len__(self):
         return len(self._value)
@@ -693,12 +897,40 @@ class DrawableDictionary(MutableSequence, Element):
         self._value.insert(index, value)
 
     def sort(self, key):
+        self._value = list(self)
         self._value.sort(key=key)
 
+    def has_skeleton(self, index: int) -> bool:
+        """Whether the drawable at ``index`` has a skeleton with bones, without reading it if it is not read yet"""
+        drawable = self._value[index]
+        if isinstance(drawable, DrawableSpan):
+            return drawable.has_skeleton
+
+        return bool(drawable.skeleton.bones)
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the drawables, without reading the ones that are not read yet"""
+        return [drawable.name for drawable in self._value]
+
+    @classmethod
+    def from_xml_file_indexed(cls, filepath: str):
+        """Read only the names and locations of the drawables at ``filepath``. Each drawable is read from the file
+        the first time it is accessed."""
+        new = cls(index_drawable_dictionary(filepath))
+        new.tag_name = "Item"
+        new._filepath = filepath
+
+        return new
+
     @classmethod
     def from_xml(cls, element: ET.Element):
         new = cls()
         new.tag_name = "Item"
+
+        for _, drawable in pop_streamed_children(element):
+            new.append(drawable)
+
         children = element.findall(new.tag_name)
 
         for child in children:
@@ -707,9 +939,13 @@ class DrawableDictionary(MutableSequence, Element):
 
         return new
 
+    @classmethod
+    def streamed_child_types(cls):
+        return {"Item": Drawable}
+
     def to_xml(self):
         element = ET.Element(self.tag_name)
-        for drawable in self._value:
+        for drawable in self:
             if isinstance(drawable, Drawable):
                 drawable.tag_name = "Item"
                 element.append(drawable.to_xml())
@@ -719,6 +955,17 @@ class DrawableDictionary(MutableSequence, Element):
 
         return element
 
+    def stream_xml(self, writer: ElementWriter, level: int = 0):
+        writer.start(self.tag_name, {}, level)
+        for drawable in self:
+            if not isinstance(drawable, Drawable):
+                raise TypeError(
+                    f"{type(self).__name__}s can only hold '{Drawable.__name__}' objects, not '{type(drawable)}'!")
+
+            drawable.tag_name = "Item"
+            drawable.stream_xml(writer, level + 1)
+        writer.end(self.tag_name, level)
+
 
 class DrawableMatrices(ElementProperty):
     value_types = (list)
@@ -751,14 +998,22 @@ class DrawableMatrices(ElementProperty):
 class BonePropertiesManager:
     dictionary_xml = os.path.join(
         os.path.dirname(__file__), "BoneProperties.xml")
-    bones = {}
+    # None until BoneProperties.xml is read on the first lookup
+    bones: Optional[dict[str, Bone]] = None
 
     @staticmethod
     def load_bones():
         tree = ET.parse(BonePropertiesManager.dictionary_xml)
+        bones = {}
         for node in tree.getroot():
             bone = Bone.from_xml(node)
-            BonePropertiesManager.bones[bone.name] = bone
+            bones[bone.name] = bone
 
+        BonePropertiesManager.bones = bones
+
+    @staticmethod
+    def get_bone(name: str) -> Optional[Bone]:
+        if BonePropertiesManager.bones is None:
+            BonePropertiesManager.load_bones()
 
-BonePropertiesManager.load_bones()
+        return BonePropertiesManager.bones.get(name)
@@ -1,10 +1,16 @@
 """Manages reading/writing Codewalker XML files"""
+import os
+from copy import copy
 from mathutils import Vector, Quaternion, Matrix
 from abc import abstractmethod, ABC as AbstractClass, abstractclassmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterable, Optional
 from xml.etree import ElementTree as ET
-from numpy import float32
+from xml.parsers import expat
+from numpy import float32, ndarray
+from .cache import get_active_cache
+from .parallel import get_active_writer
+from .. import profiling
 
 
 def indent(elem: ET.Element, level=0):
@@ -32,6 +38,99 @@ def indent(elem: ET.Element, level=0):
             elem.text = "\n" + "\n".join(lines) + i
 
 
+# Same escaping ET.ElementTree.write uses, so files written by ElementWriter are identical
+_escape_cdata = ET._escape_cdata
+_escape_attrib = ET._escape_attrib
+
+
+class ElementWriter:
+    """Writes XML to a text file as it is produced, formatted the same as running ``indent`` on the ET tree and
+    writing it with ``ET.ElementTree.write``. ``level`` is the nesting depth of an element, 0 for the root."""
+
+    amount = "  "
+    # Number of pending strings before they are joined and written to the file
+    flush_count = 4096
+
+    def __init__(self, file):
+        self.file = file
+        self._parts = []
+        # Start tag of the last started element, kept open until we know if it has children
+        self._open_tag = None
+
+    def _attrib_str(self, attrib: dict[str, str]) -> str:
+        return "".join(f" {name}=\"{_escape_attrib(value)}\"" for name, value in attrib.items())
+
+    def _begin(self, level: int):
+        parts = self._parts
+        if self._open_tag is not None:
+            parts.append(self._open_tag + ">")
+            self._open_tag = None
+        if level:
+            parts.append("\n" + level * self.amount)
+        if len(parts) >= self.flush_count:
+            self.flush()
+
+    def start(self, tag: str, attrib: dict[str, str], level: int):
+        """Start an element that can have children. Must be closed with ``end``."""
+        self._begin(level)
+        self._open_tag = "<" + tag + self._attrib_str(attrib)
+
+    def end(self, tag: str, level: int):
+        """Close the element last started with ``start`` at this level"""
+        if self._open_tag is not None:
+            # Nothing was written inside the element
+            self._parts.append(self._open_tag + " />")
+            self._open_tag = None
+        elif level:
+            self._parts.append("\n" + level * self.amount + "</" + tag + ">")
+        else:
+            self._parts.append("\n</" + tag + ">\n")
+
+    def leaf(self, tag: str, attrib: dict[str, str], text: Optional[str], level: int):
+        """Write an element without children"""
+        self._begin(level)
+        start = "<" + tag + self._attrib_str(attrib)
+
+        if not text:
+            self._parts.append(start + " />")
+            return
+
+        if "\n" in text and text.strip():
+            # Indent innertext on new lines, like indent does
+            inner = "\n" + (level + 1) * self.amount
+            text = inner + text.strip().replace("\n", inner) + "\n" + level * self.amount
+
+        self._parts.append(start + ">" + _escape_cdata(text) + "</" + tag + ">")
+
+    def leaf_lines(self, tag: str, attrib: dict[str, str], chunks: Iterable[str], level: int):
+        """Write an element without children whose text is ``chunks`` joined with newlines, indented on new lines
+        like ``indent`` does for multiline text. The chunks are written as they are produced, so the whole text is
+        never held in memory. Chunks must not start or end with whitespace."""
+        self._begin(level)
+        self._parts.append("<" + tag + self._attrib_str(attrib) + ">")
+
+        inner = "\n" + (level + 1) * self.amount
+        for chunk in chunks:
+            self._parts.append(inner + _escape_cdata(chunk.replace("\n", inner)))
+            self.flush()
+
+        self._parts.append("\n" + level * self.amount + "</" + tag + ">")
+
+    def element(self, element: ET.Element, level: int):
+        """Write an ET.Element and its children"""
+        if len(element):
+            self.start(element.tag, element.attrib, level)
+            for child in element:
+                self.element(child, level + 1)
+            self.end(element.tag, level)
+        else:
+            self.leaf(element.tag, element.attrib, element.text, level)
+
+    def flush(self):
+        self.file.write("".join(self._parts))
+        self._parts.clear()
+
+
 def get_str_type(value: str):
     """Determine if a string is a bool, int, or float"""
     if isinstance(value, str):
@@ -53,8 +152,81 @@ def get_str_type(value: str):
     return value
 
 
+# Marks a path tree node whose whole subtree is kept
+KEEP_SUBTREE = {}
+
+
+def get_path_tree(paths: Iterable[str]) -> dict:
+    """Nest slash-separated tag paths into a tree of dicts, ``KEEP_SUBTREE`` at the end of each path"""
+    tree = {}
+    for path in paths:
+        node = tree
+        tags = path.strip("/").split("/")
+        for tag in tags[:-1]:
+            child = node.setdefault(tag, {})
+            if child is KEEP_SUBTREE:
+                break
+            node = child
+        else:
+            node[tags[-1]] = KEEP_SUBTREE
+
+    return tree
+
+
+def parse_xml_paths(filepath: str, paths: Iterable[str]) -> ET.Element:
+    """Parse only the elements at ``paths`` (tag paths relative to the root element, e.g. "Drawable/Skeleton")
+    and their ancestors. Everything else is scanned past without building ET.Elements for it."""
+    tree = get_path_tree(paths)
+    builder = ET.TreeBuilder()
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    # Path tree node of each open element, None for skipped elements
+    stack = []
+
+    def start_element(tag, attrib):
+        if not stack:
+            node = tree
+        else:
+            parent = stack[-1]
+            node = parent if parent is KEEP_SUBTREE or parent is None else parent.get(tag)
+
+        stack.append(node)
+        if node is not None:
+            builder.start(tag, attrib)
+
+    def end_element(tag):
+        if stack.pop() is not None:
+            builder.end(tag)
+
+    def character_data(data):
+        if stack[-1] is KEEP_SUBTREE:
+            builder.data(data)
+
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+
+    with open(filepath, "rb") as file:
+        parser.ParseFile(file)
+
+    return builder.close()
+
+
+# Children already converted by ``Element.parse_xml_file`` while streaming, keyed by the parent ET.Element.
+# Only holds entries while a file is being read.
+_streamed_children: dict[ET.Element, list[tuple[str, "Element"]]] = {}
+
+
+def pop_streamed_children(element: ET.Element) -> list[tuple[str, "Element"]]:
+    """Get the (tag, object) pairs of the children of ``element`` that were already converted while
+    streaming the file. Consumed children are no longer present in ``element``."""
+    return _streamed_children.pop(element, [])
+
+
 class Element(AbstractClass):
     """Abstract XML element to base all other XML elements off of"""
+    __slots__ = ()
+
     @property
     @abstractmethod
     def tag_name(self):
@@ -75,46 +247,309 @@ class Element(AbstractClass):
         """Convert object to ET.Element object"""
         raise NotImplementedError
 
+    @classmethod
+    def streamed_child_types(cls) -> Optional[dict[str, type["Element"]]]:
+        """Map child tag names to the Element types ``from_xml`` would convert them to. Children listed here
+        are converted as soon as they are read by ``parse_xml_file`` and handed to ``from_xml`` through
+        ``pop_streamed_children``. Returns None if ``from_xml`` needs the raw children."""
+        return None
+
+    @classmethod
+    def read_variant(cls) -> str:
+        """Identifies the read options that currently change what ``parse_xml_file`` returns for this class, so
+        ``XmlCache`` keeps their results apart. Empty if there are none."""
+        return ""
+
     @classmethod
     def from_xml_file(cls, filepath):
-        """Read XML from filepath"""
-        element_tree = ET.ElementTree()
-        element_tree.parse(filepath)
-        return cls.from_xml(element_tree.getroot())
+        """Read XML from filepath. Goes through the active ``XmlCache`` if there is one."""
+        with profiling.span("read_xml"):
+            profiling.count("bytes_read", os.path.getsize(filepath))
 
-    def write_xml(self, filepath):
-        """Write object as XML to filepath"""
+            cache = get_active_cache()
+            if cache is not None:
+                return cache.load(cls, filepath)
+
+            return cls.parse_xml_file(filepath)
+
+    @classmethod
+    def parse_xml_file(cls, filepath):
+        """Parse XML from filepath. Known elements are converted as their end tags arrive and their
+        ET.Element subtrees are discarded, so the whole file is never held in memory as an ET tree."""
+        global _streamed_children
+
+        prev_streamed_children = _streamed_children
+        _streamed_children = {}
+
+        try:
+            # Stack of (ET.Element, Element type or None, streamed child types of that type or None)
+            stack = []
+            root = None
+
+            for event, elem in ET.iterparse(filepath, events=("start", "end")):
+                if event == "start":
+                    if not stack:
+                        stack.append((elem, cls, cls.streamed_child_types()))
+                        continue
+
+                    child_types = stack[-1][2]
+                    elem_type = child_types.get(elem.tag) if child_types else None
+                    elem_child_types = elem_type.streamed_child_types() if elem_type else None
+
+                    if elem_child_types is None:
+                        # Leaf elements are small, leave them for the single pass of their parent's from_xml
+                        elem_type = None
+
+                    stack.append((elem, elem_type, elem_child_types))
+                    continue
+
+                elem, elem_type, _ = stack.pop()
+
+                if not stack:
+                    root = elem
+                    break
+
+                if elem_type is None:
+                    continue
+
+                parent = stack[-1][0]
+                obj = elem_type.from_xml(elem)
+                _streamed_children.setdefault(parent, []).append((elem.tag, obj))
+
+                parent.remove(elem)
+
+            return cls.from_xml(root)
+        finally:
+            _streamed_children = prev_streamed_children
+
+    @classmethod
+    def parse_xml_file_paths(cls, filepath, paths: Iterable[str]):
+        """Parse only the elements at ``paths`` from filepath, see ``parse_xml_paths``. Properties outside of them
+        keep their defaults. Not cached, the result depends on ``paths``."""
+        return cls.from_xml(parse_xml_paths(filepath, paths))
+
+    def stream_xml(self, writer: ElementWriter, level: int = 0):
+        """Write object through writer. Same output as ``to_xml``, types that hold many children override this to
+        write them one by one instead of building the ET tree first."""
         element = self.to_xml()
-        indent(element)
-        elementTree = ET.ElementTree(element)
-        elementTree.write(filepath, encoding="UTF-8", xml_declaration=True)
+        if element is not None:
+            writer.element(element, level)
+
+    def write_xml(self, filepath):
+        """Write object as XML to filepath. Goes through the active ``XmlWriterPool`` if there is one."""
+        with profiling.span("write_xml"):
+            writer_pool = get_active_writer()
+            if writer_pool is not None:
+                writer_pool.write_xml(self, filepath)
+                return
+
+            self.write_xml_file(filepath)
+            profiling.count("bytes_written", os.path.getsize(filepath))
+
+    def write_xml_file(self, filepath):
+        """Write object as XML to filepath, in this process"""
+        # Write to a temporary file first so a failed export doesn't leave a truncated file behind
+        tmp_filepath = f"{filepath}.tmp"
+        try:
+            with open(tmp_filepath, "w", encoding="UTF-8", errors="xmlcharrefreplace", newline="\n") as file:
+                file.write("<?xml version='1.0' encoding='UTF-8'?>\n")
+                writer = ElementWriter(file)
+                self.stream_xml(writer)
+                writer.flush()
+            os.replace(tmp_filepath, filepath)
+        except BaseException:
+            if os.path.exists(tmp_filepath):
+                os.remove(tmp_filepath)
+            raise
+
+
+class PropertyDescriptor:
+    """Class-level access to a property that ElementTree classes declare in ``__init__``. The property object in the
+    instance's ``_elements`` is the only place its value is stored, reading the attribute returns that value and
+    assigning it sets that value. Installed by ``ElementTree.get_schema``."""
+    __slots__ = ("name", "class_value")
+
+    def __init__(self, name: str, class_value: Any):
+        self.name = name
+        # The class attribute it replaces, e.g. the ``type`` used to pick a subclass when reading
+        self.class_value = class_value
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.class_value
+
+        try:
+            return instance._elements[self.name].value
+        except KeyError:
+            # Read in __init__ before the property is declared
+            return self.class_value
+
+    def __set__(self, instance, value):
+        set_property(instance._elements, self.name, value)
+
+
+class ChildDescriptor(PropertyDescriptor):
+    """Class-level access to a child element that ElementTree classes declare in ``__init__``"""
+    __slots__ = ()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.class_value
+
+        obj = instance._elements.get(self.name, self.class_value)
+        if isinstance(obj, (ElementProperty, AttributeProperty)):
+            return obj.value
+
+        return obj
+
+
+def set_property(elements: dict[str, Any], name: str, value):
+    """Assign to the property ``name`` stored in ``elements``. Property objects declare or replace the property,
+    other values are set as the value of the property object if there is one."""
+    obj = elements.get(name)
+    if isinstance(obj, (ElementProperty, AttributeProperty)) and not isinstance(value, (ElementProperty, AttributeProperty)):
+        obj.value = value
+    else:
+        elements[name] = value
+
+
+def get_class_attribute(cls: type, name: str) -> Any:
+    """Get the attribute ``name`` of ``cls`` or its bases without invoking descriptors"""
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name]
+
+    return None
+
+
+class PropertyRecorder:
+    """Mixin of the prototype that ``ElementTree.get_schema`` instantiates to find the properties of a class. Its
+    ``__init__`` runs before the class has descriptors for them, so assignments are recorded in the instance dict
+    in declaration order."""
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value) -> None:
+        attr = get_class_attribute(type(self), name)
+        if hasattr(attr, "__set__") and not isinstance(attr, PropertyDescriptor):
+            # Python properties and slots
+            object.__setattr__(self, name, value)
+            return
+
+        set_property(self.__dict__, name, value)
+
+    def __getattribute__(self, name: str):
+        props = object.__getattribute__(self, "__dict__")
+        if name in props:
+            value = props[name]
+            return value.value if isinstance(value, (ElementProperty, AttributeProperty)) else value
+
+        return object.__getattribute__(self, name)
+
+
+@dataclass(frozen=True)
+class ElementTreeSchema:
+    """Properties of an ElementTree class, compiled once from a prototype instance"""
+    # Maps child tag names to (attribute name, property class)
+    children: dict[str, tuple[str, type[Element]]]
+    # Maps XML attribute names to attribute names
+    attributes: dict[str, str]
+    # Maps child tag names to property classes, None if the class cannot be instantiated
+    child_types: Optional[dict[str, type[Element]]]
+
+
+_schemas: dict[type, ElementTreeSchema] = {}
 
 
 class ElementTree(Element):
-    """XML element that contains children defined by it's properties"""
+    """XML element that contains children defined by it's properties. Properties are declared by assigning
+    property objects (ElementProperty, AttributeProperty) or child elements to attributes in ``__init__``."""
+    # Property objects and child elements by attribute name, in declaration order
+    __slots__ = ("_elements", "__dict__")
+
+    @classmethod
+    def get_schema(cls) -> ElementTreeSchema:
+        """Get the schema of this class. Built on first use by instantiating the class once."""
+        schema = _schemas.get(cls)
+        if schema is not None:
+            return schema
+
+        children = {}
+        attributes = {}
+
+        try:
+            recorder_cls = type(cls.__name__, (PropertyRecorder, cls), {"__module__": cls.__module__})
+            prototype = object.__new__(recorder_cls)
+            prototype._elements = {}
+            prototype.__init__()
+        except TypeError:
+            # Abstract class, these are only read through a custom from_xml of their container
+            schema = ElementTreeSchema(children, attributes, None)
+        else:
+            for prop_name, obj_element in vars(prototype).items():
+                if isinstance(obj_element, Element):
+                    children.setdefault(obj_element.tag_name, (prop_name, type(obj_element)))
+                elif isinstance(obj_element, AttributeProperty):
+                    attributes.setdefault(obj_element.name, prop_name)
+                else:
+                    continue
+
+                is_property = isinstance(obj_element, (ElementProperty, AttributeProperty))
+                descriptor_cls = PropertyDescriptor if is_property else ChildDescriptor
+                class_attr = get_class_attribute(cls, prop_name)
+                if type(class_attr) is not descriptor_cls:
+                    if isinstance(class_attr, PropertyDescriptor):
+                        class_attr = class_attr.class_value
+
+                    setattr(cls, prop_name, descriptor_cls(prop_name, class_attr))
+
+            child_types = {tag: prop_type for tag, (_, prop_type) in children.items()}
+            schema = ElementTreeSchema(children, attributes, child_types)
+
+        _schemas[cls] = schema
+        return schema
 
     @classmethod
     def from_xml(cls: Element, element: ET.Element):
         """Convert ET.Element object to ElementTree"""
         new = cls()
+        schema = cls.get_schema()
 
-        for prop_name, obj_element in vars(new).items():
-            if isinstance(obj_element, Element):
-                child = element.find(obj_element.tag_name)
-                if child is not None and obj_element.tag_name == child.tag:
-                    # Add element to object if tag is defined in class definition
-                    setattr(new, prop_name, type(obj_element).from_xml(child))
-            elif isinstance(obj_element, AttributeProperty):
+        if new.tag_name == element.tag:
+            for name, value in element.attrib.items():
                 # Add attribute to element if attribute is defined in class definition
-                if obj_element.name in element.attrib and new.tag_name == element.tag:
-                    obj_element.value = element.get(obj_element.name)
+                prop_name = schema.attributes.get(name)
+                if prop_name is not None:
+                    setattr(new, prop_name, value)
+
+        read_tags = set()
+
+        for child in element:
+            tag = child.tag
+            # Add element to object if tag is defined in class definition. Only the first child with a tag is read.
+            if tag in read_tags or tag not in schema.children:
+                continue
+
+            prop_name, prop_type = schema.children[tag]
+            setattr(new, prop_name, prop_type.from_xml(child))
+            read_tags.add(tag)
+
+        for tag, obj in pop_streamed_children(element):
+            if tag in read_tags or tag not in schema.children:
+                continue
+
+            setattr(new, schema.children[tag][0], obj)
+            read_tags.add(tag)
 
         return new
 
+    @classmethod
+    def streamed_child_types(cls):
+        return cls.get_schema().child_types
+
     def to_xml(self):
         """Convert ElementTree to ET.Element object"""
         root = ET.Element(self.tag_name)
-        for child in vars(self).values():
+        for child in self._elements.values():
             if isinstance(child, Element):
                 element = child.to_xml()
                 if element is not None:
@@ -124,63 +559,120 @@ class ElementTree(Element):
 
         return root
 
-    def __getattribute__(self, key: str, onlyValue: bool = True):
-        obj = None
-        # Try and see if key exists
-        try:
-            obj = object.__getattribute__(self, key)
-            if isinstance(obj, (ElementProperty, AttributeProperty)) and onlyValue:
-                # If the property is an ElementProperty or AttributeProperty, and onlyValue is true, return just the value of the Element property
-                return obj.value
-            else:
-                return obj
-        except AttributeError:
-            # Key doesn't exist, return None
-            return None
+    def stream_xml(self, writer: ElementWriter, level: int = 0):
+        cls = type(self)
+        if cls.to_xml is not ElementTree.to_xml and cls.stream_children is ElementTree.stream_children:
+            # Custom to_xml, can only know what it writes by calling it
+            super().stream_xml(writer, level)
+            return
 
-    def __setattr__(self, name: str, value) -> None:
-        # Get the full object
-        obj = self.__getattribute__(name, False)
-        if obj is not None and isinstance(obj, (ElementProperty, AttributeProperty)) and not isinstance(value, (ElementProperty, AttributeProperty)):
-            # If the object is an ElementProperty or AttributeProperty, set it's value
-            obj.value = value
-            super().__setattr__(name, obj)
-        else:
-            super().__setattr__(name, value)
+        attrib = {child.name: str(child.value)
+                  for child in self._elements.values() if isinstance(child, AttributeProperty)}
+
+        writer.start(self.tag_name, attrib, level)
+        self.stream_children(writer, level + 1)
+        writer.end(self.tag_name, level)
+
+    def stream_children(self, writer: ElementWriter, level: int):
+        """Write the child elements through writer. Subclasses with a custom ``to_xml`` that adds children
+        should override this too."""
+        for child in self._elements.values():
+            if isinstance(child, Element):
+                child.stream_xml(writer, level)
+
+    def __new__(cls, *args, **kwargs):
+        if cls not in _schemas:
+            # Install the property descriptors before the first instance declares its properties
+            cls.get_schema()
+
+        new = super().__new__(cls)
+        new._elements = {}
+        return new
+
+    def __getattr__(self, name: str):
+        # Only called when the attribute doesn't exist, return None
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return None
+
+    def __copy__(self):
+        new = type(self).__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        # Own property objects so setting a value on the copy doesn't change the original, children are shared
+        new._elements = {name: copy(obj) if isinstance(obj, (ElementProperty, AttributeProperty)) else obj
+                         for name, obj in self._elements.items()}
+        return new
 
     def get_element(self, key):
-        obj = self.__getattribute__(key, False)
+        obj = self._elements.get(key)
 
         if isinstance(obj, ElementProperty):
             return obj
 
 
-@dataclass
+def get_typed_value(value: str, value_type: Optional[type]):
+    """Convert a string to ``value_type``. Falls back to ``get_str_type`` if there is no type or the string
+    isn't valid for it."""
+    if value_type is str:
+        return value
+
+    if value_type is bool:
+        value_lower = value.lower()
+        if value_lower == "true":
+            return True
+        elif value_lower == "false":
+            return False
+    elif value_type is int or value_type is float:
+        try:
+            return value_type(value)
+        except ValueError:
+            pass
+
+    return get_str_type(value)
+
+
+ATTRIBUTE_VALUE_TYPES = (bool, int, float, str)
+
+
+@dataclass(slots=True)
 class AttributeProperty:
+    """XML attribute. Strings assigned to it, such as the attribute text when reading XML, are converted to
+    ``value_type`` once when set. ``value_type`` defaults to the type of the default value."""
     name: str
     _value: Any = None
+    value_type: Optional[type] = None
+
+    def __post_init__(self):
+        if self.value_type is None and type(self._value) in ATTRIBUTE_VALUE_TYPES:
+            self.value_type = type(self._value)
 
     @property
     def value(self):
-        return get_str_type(self._value)
+        return self._value
 
     @value.setter
     def value(self, value):
+        if isinstance(value, str):
+            value = get_typed_value(value, self.value_type)
+
         self._value = value
 
 
 class ElementProperty(Element, AbstractClass):
+    # Subclasses that don't add attributes should define empty __slots__ to not get an instance dict
+    __slots__ = ("tag_name", "value")
+
     @property
     @abstractmethod
     def value_types(self):
         raise NotImplementedError
 
-    tag_name = None
-
     def __init__(self, tag_name, value):
         super().__init__()
         self.tag_name = tag_name
-        if value and not isinstance(value, self.value_types):
+        # Arrays don't have a truth value, check their type even when empty
+        if (isinstance(value, ndarray) or value) and not isinstance(value, self.value_types):
             raise TypeError(
                 f"Value of {type(self).__name__} must be one of {self.value_types}, not {type(value)}!")
         self.value = value
@@ -208,12 +700,22 @@ class ListProperty(ElementProperty, AbstractClass):
     def from_xml(cls, element: ET.Element):
         new = cls(element.tag)
 
+        new.value.extend(obj for _, obj in pop_streamed_children(element))
+
         children = element.findall(new.list_type.tag_name)
 
         for child in children:
             new.value.append(new.list_type.from_xml(child))
         return new
 
+    @classmethod
+    def streamed_child_types(cls):
+        if getattr(cls.from_xml, "__func__", None) is not ListProperty.from_xml.__func__:
+            # Custom from_xml, may pick item types based on the raw elements
+            return None
+
+        return {cls.list_type.tag_name: cls.list_type}
+
     def to_xml(self):
         element = ET.Element(self.tag_name)
 
@@ -233,6 +735,26 @@ class ListProperty(ElementProperty, AbstractClass):
 
         return None
 
+    def stream_xml(self, writer: ElementWriter, level: int = 0):
+        if type(self).to_xml not in (ListProperty.to_xml, ListPropertyRequired.to_xml):
+            # Custom to_xml
+            super().stream_xml(writer, level)
+            return
+
+        if not self.value and not isinstance(self, ListPropertyRequired):
+            return
+
+        attrib = {child.name: str(child.value)
+                  for child in vars(self).values() if isinstance(child, AttributeProperty)}
+
+        writer.start(self.tag_name, attrib, level)
+        for item in self.value or []:
+            if not isinstance(item, self.list_type):
+                raise TypeError(
+                    f"{type(self).__name__} can only hold objects of type '{self.list_type.__name__}', not '{type(item)}'")
+            item.stream_xml(writer, level + 1)
+        writer.end(self.tag_name, level)
+
 
 class ListPropertyRequired(ListProperty):
     """Same as ListProperty but returns an empty element rather then None in case the passed element's value is empty or None"""
@@ -259,6 +781,7 @@ class ListPropertyRequired(ListProperty):
 
 
 class TextProperty(ElementProperty):
+    __slots__ = ()
     value_types = (str)
 
     def __init__(self, tag_name: str = "Name", value=None):
@@ -279,6 +802,7 @@ class TextProperty(ElementProperty):
 
 class TextPropertyRequired(ElementProperty):
     """Same as TextProperty but returns an empty element rather then None in case the passed element's value is empty or None"""
+    __slots__ = ()
     value_types = (str)
 
     def __init__(self, tag_name: str = "Name", value=None):
@@ -297,6 +821,7 @@ class TextPropertyRequired(ElementProperty):
 
 
 class ColorProperty(ElementProperty):
+    __slots__ = ()
     value_types = (list)
 
     def __init__(self, tag_name: str, value=None):
@@ -314,6 +839,7 @@ class ColorProperty(ElementProperty):
 
 
 class Vector2Property(ElementProperty):
+    __slots__ = ()
     value_types = (Vector)
 
     def __init__(self, tag_name: str, value=None):
@@ -333,6 +859,7 @@ class Vector2Property(ElementProperty):
 
 
 class VectorProperty(ElementProperty):
+    __slots__ = ()
     value_types = (Vector)
 
     def __init__(self, tag_name: str, value=None):
@@ -350,6 +877,7 @@ class VectorProperty(ElementProperty):
 
 
 class Vector4Property(ElementProperty):
+    __slots__ = ()
     value_types = (Vector)
 
     def __init__(self, tag_name: str, value=None):
@@ -368,6 +896,7 @@ class Vector4Property(ElementProperty):
 
 
 class QuaternionProperty(ElementProperty):
+    __slots__ = ()
     value_types = (Quaternion)
 
     def __init__(self, tag_name: str, value=None):
@@ -389,6 +918,7 @@ class QuaternionProperty(ElementProperty):
 
 
 class MatrixProperty(ElementProperty):
+    __slots__ = ()
     value_types = (Matrix)
 
     def __init__(self, tag_name: str, value=None):
@@ -423,6 +953,7 @@ class MatrixProperty(ElementProperty):
 
 
 class Matrix33Property(ElementProperty):
+    __slots__ = ()
     value_types = (Matrix)
 
     def __init__(self, tag_name: str, value=None):
@@ -457,6 +988,7 @@ class Matrix33Property(ElementProperty):
 
 
 class FlagsProperty(ElementProperty):
+    __slots__ = ()
     value_types = (list)
 
     def __init__(self, tag_name: str = "Flags", value=None):
@@ -491,6 +1023,7 @@ class FlagsProperty(ElementProperty):
 
 
 class ValueProperty(ElementProperty):
+    __slots__ = ()
     value_types = (int, str, bool, float)
 
     def __init__(self, tag_name: str, value=0):
@@ -514,6 +1047,7 @@ class ValueProperty(ElementProperty):
 
 
 class StringValueProperty(ElementProperty):
+    __slots__ = ()
     value_types = (str)
 
     def __init__(self, tag_name: str, value=""):
@@ -532,6 +1066,7 @@ class StringValueProperty(ElementProperty):
 
 class TextListProperty(ElementProperty):
     """Separates each word of an element's text into a list"""
+    __slots__ = ()
     value_types = (list)
 
     def __init__(self, tag_name, value=None):
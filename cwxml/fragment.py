@@ -25,6 +25,10 @@ class YFT:
     def from_xml_file(filepath):
         return Fragment.from_xml_file(filepath)
 
+    @staticmethod
+    def from_xml_file_paths(filepath, paths):
+        return Fragment.parse_xml_file_paths(filepath, paths)
+
     @staticmethod
     def write_xml(fragment, filepath):
         return fragment.write_xml(filepath)
@@ -36,6 +40,12 @@ class BoneTransform(MatrixProperty):
     def __init__(self, tag_name: str, value=None):
         super().__init__(tag_name, value or Matrix())
 
+    @classmethod
+    def from_xml(cls, element: ET.Element):
+        # Stored as 3x4, like the exporter writes them
+        matrix = MatrixProperty.from_xml(element).value
+        return cls(element.tag, Matrix(matrix[:3]))
+
 
 class BoneTransformsList(ListProperty):
     list_type = BoneTransform
@@ -73,6 +83,10 @@ class Transform(MatrixProperty):
     def __init__(self, tag_name: str, value=None):
         super().__init__(tag_name, value or Matrix())
 
+    @classmethod
+    def from_xml(cls, element: ET.Element):
+        return cls(element.tag, MatrixProperty.from_xml(element).value)
+
 
 class TransformsList(ListProperty):
     list_type = Transform
@@ -169,6 +183,13 @@ class PhysicsLOD(ElementTree):
         self.groups = GroupsList()
         self.children = ChildrenList()
 
+    @classmethod
+    def from_xml(cls, element: ET.Element):
+        new = super().from_xml(element)
+        # Keep the LOD1/LOD2/LOD3 tag it was read from
+        new.tag_name = element.tag
+        return new
+
 
 class Physics(ElementTree):
     tag_name = "Physics"
@@ -0,0 +1,168 @@
+"""Parse and write XML files in worker processes"""
+import io
+import multiprocessing
+import os
+import pickle
+import sys
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Optional
+from .cache import ElementPickler, XmlCache, paused_gc, use_cache
+
+
+def can_use_worker_processes() -> bool:
+    """Worker processes are forked from this one, as Blender's mathutils can't be imported in a new Python
+    process. Only available on Linux, Windows can't fork and forking Blender on macOS can crash it."""
+    return sys.platform.startswith("linux") and "fork" in multiprocessing.get_all_start_methods()
+
+
+def parse_and_pickle(parse: Callable[[str], Any], filepath: str) -> bytes:
+    file = io.BytesIO()
+    # The cache active when the worker was forked is only written by the main process, workers writing and
+    # evicting it at the same time would remove each other's entries
+    with paused_gc(), use_cache(None):
+        ElementPickler(file).dump(parse(filepath))
+
+    return file.getvalue()
+
+
+def parse_xml_files_in_processes(parse: Callable[[str], Any], filepaths: list[str],
+                                 max_workers: Optional[int] = None) -> Iterator[tuple[str, Any, Optional[Exception]]]:
+    """Run ``parse(filepath)`` for each of ``filepaths`` in worker processes. Yields (filepath, object, error)
+    tuples in the order the files finish, the object is None if parsing failed. Files that haven't started are
+    cancelled if the caller stops early."""
+    max_workers = min(max_workers or os.cpu_count() or 1, len(filepaths))
+
+    with ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("fork")) as executor:
+        futures = {executor.submit(parse_and_pickle, parse, filepath): filepath for filepath in filepaths}
+
+        try:
+            for future in as_completed(futures):
+                try:
+                    with paused_gc():
+                        obj = pickle.loads(future.result())
+                except Exception as e:
+                    yield futures[future], None, e
+                    continue
+
+                yield futures[future], obj, None
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+class PreparsedFiles:
+    """Hands out objects that were already parsed, e.g. by ``parse_xml_files_in_processes``, to
+    ``Element.from_xml_file`` when activated with ``use_cache``. Each object is handed out once. Other files are
+    read through ``cache``. Data prepared from parts of the objects along with them, such as the mesh data of
+    drawables, is handed out by ``pop_prepared``."""
+
+    def __init__(self, cache: Optional[XmlCache] = None):
+        self.cache = cache
+        self.objects: dict[str, Any] = {}
+        # (part, data) pairs by id of the part, holding the part keeps the id from being reused
+        self.prepared: dict[int, tuple[Any, Any]] = {}
+
+    def add(self, filepath: str, obj, prepared: Iterable[tuple[Any, Any]] = ()):
+        """Add the object parsed from ``filepath``, and (part of ``obj``, data) pairs prepared from it"""
+        self.objects[self.get_key(filepath)] = obj
+        for part, data in prepared:
+            self.prepared[id(part)] = (part, data)
+
+    def load(self, cls, filepath: str):
+        obj = self.objects.pop(self.get_key(filepath), None)
+        if isinstance(obj, cls):
+            return obj
+
+        if self.cache is not None:
+            return self.cache.load(cls, filepath)
+
+        return cls.parse_xml_file(filepath)
+
+    def pop_prepared(self, part) -> Optional[Any]:
+        """Get the data prepared from ``part``, None if there is none"""
+        part_and_data = self.prepared.pop(id(part), None)
+        if part_and_data is None or part_and_data[0] is not part:
+            return None
+
+        return part_and_data[1]
+
+    def get_key(self, filepath: str) -> str:
+        return os.path.normcase(os.path.abspath(filepath))
+
+
+def unpickle_and_write(data: bytes, filepath: str):
+    with paused_gc():
+        obj = pickle.loads(data)
+
+    obj.write_xml_file(filepath)
+
+
+class XmlWriterPool:
+    """Writes XML files in worker processes. Objects are pickled when queued, so they can be changed or freed right
+    after. Once ``max_pending`` files are queued, ``write_xml`` waits for one of them to be written, which caps the
+    memory held by the queue."""
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.max_workers * 2
+        self.executor = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context("fork"))
+        self.pending: dict[Future, str] = {}
+        self.finished: list[tuple[str, Optional[Exception]]] = []
+
+    def write_xml(self, obj, filepath: str):
+        while len(self.pending) >= self.max_pending:
+            self._wait(FIRST_COMPLETED)
+
+        file = io.BytesIO()
+        with paused_gc():
+            ElementPickler(file).dump(obj)
+
+        self.pending[self.executor.submit(unpickle_and_write, file.getvalue(), filepath)] = filepath
+
+    def pop_finished(self, wait_all: bool = False) -> list[tuple[str, Optional[Exception]]]:
+        """Get the (filepath, error) pairs of the files written since the last call. Waits for all queued files if
+        ``wait_all`` is set."""
+        if wait_all:
+            self._wait(ALL_COMPLETED)
+        else:
+            self._collect([future for future in self.pending if future.done()])
+
+        finished = self.finished
+        self.finished = []
+
+        return finished
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def _wait(self, return_when: str):
+        done, _ = wait(self.pending, return_when=return_when)
+        self._collect(done)
+
+    def _collect(self, futures: list[Future]):
+        for future in futures:
+            filepath = self.pending.pop(future)
+            self.finished.append((filepath, future.exception()))
+
+
+_active_writer: Optional[XmlWriterPool] = None
+
+
+def get_active_writer() -> Optional[XmlWriterPool]:
+    return _active_writer
+
+
+@contextmanager
+def use_writer(writer: Optional[XmlWriterPool]):
+    """Write XML files through ``writer`` in ``Element.write_xml`` while in this context. ``None`` writes them
+    directly."""
+    global _active_writer
+
+    prev_writer = _active_writer
+    _active_writer = writer
+
+    try:
+        yield writer
+    finally:
+        _active_writer = prev_writer
@@ -1,5 +1,6 @@
 import xml.etree.ElementTree as ET
 import os
+import copy
 from abc import ABC, abstractmethod
 from .element import (
     ElementTree,
@@ -224,10 +225,13 @@ class ShaderDef(ElementTree):
 
 class ShaderManager:
     shaderxml = os.path.join(os.path.dirname(__file__), "Shaders.xml")
-    # Map shader filenames to base shader names
-    _shaders_base_names: dict[ShaderDef, str] = {}
+    # Map shader filenames to their base shader name and render bucket. None until Shaders.xml is read.
+    _shader_filenames: Optional[dict[str, tuple[str, int]]] = None
+    _shader_filenames_by_hash: dict[int, str] = {}
+    # Elements of the base shaders, only converted to ShaderDefs when first looked up
+    _base_shader_elements: dict[str, ET.Element] = {}
+    _base_shaders: dict[str, ShaderDef] = {}
     _shaders: dict[str, ShaderDef] = {}
-    _shaders_by_hash: dict[int, ShaderDef] = {}
 
     terrains = ["terrain_cb_w_4lyr.sps", "terrain_cb_w_4lyr_lod.sps", "terrain_cb_w_4lyr_spec.sps", "terrain_cb_w_4lyr_spec_pxm.sps", "terrain_cb_w_4lyr_pxm_spm.sps",
                 "terrain_cb_w_4lyr_pxm.sps", "terrain_cb_w_4lyr_cm_pxm.sps", "terrain_cb_w_4lyr_cm_tnt.sps", "terrain_cb_w_4lyr_cm_pxm_tnt.sps", "terrain_cb_w_4lyr_cm.sps",
@@ -278,40 +282,81 @@ class ShaderManager:
 
     @staticmethod
     def load_shaders():
+        """Index the shader filenames in Shaders.xml"""
         tree = ET.parse(ShaderManager.shaderxml)
+        shader_filenames = {}
+        shader_filenames_by_hash = {}
+        base_shader_elements = {}
 
         for node in tree.getroot():
             base_name = node.find("Name").text
+            base_shader_elements[base_name] = node
             for filename_elem in node.findall("./FileName//*"):
                 filename = filename_elem.text
 
                 if filename is None:
                     continue
 
-                filename_hash = jenkhash.Generate(filename)
                 render_bucket = int(filename_elem.attrib["bucket"])
+                shader_filenames[filename] = (base_name, render_bucket)
+                shader_filenames_by_hash[jenkhash.Generate(filename)] = filename
 
-                shader = ShaderDef.from_xml(node)
-                shader.filename = filename
-                shader.render_bucket = render_bucket
-                ShaderManager._shaders[filename] = shader
-                ShaderManager._shaders_by_hash[filename_hash] = shader
-                ShaderManager._shaders_base_names[shader] = base_name
+        ShaderManager._shader_filenames = shader_filenames
+        ShaderManager._shader_filenames_by_hash = shader_filenames_by_hash
+        ShaderManager._base_shader_elements = base_shader_elements
+        ShaderManager._base_shaders = {}
+        ShaderManager._shaders = {}
 
     @staticmethod
-    def find_shader(filename: str) -> Optional[ShaderDef]:
-        shader = ShaderManager._shaders.get(filename, None)
-        if shader is None and filename.startswith("hash_"):
+    def get_shader_filenames() -> list[str]:
+        if ShaderManager._shader_filenames is None:
+            ShaderManager.load_shaders()
+
+        return list(ShaderManager._shader_filenames)
+
+    @staticmethod
+    def _resolve_filename(filename: str) -> Optional[str]:
+        if ShaderManager._shader_filenames is None:
+            ShaderManager.load_shaders()
+
+        if filename in ShaderManager._shader_filenames:
+            return filename
+
+        if filename.startswith("hash_"):
             filename_hash = int(filename[5:], 16)
-            shader = ShaderManager._shaders_by_hash.get(filename_hash, None)
-        return shader
+            return ShaderManager._shader_filenames_by_hash.get(filename_hash, None)
+
+        return None
 
     @staticmethod
-    def find_shader_base_name(filename: str) -> Optional[str]:
-        shader = ShaderManager.find_shader(filename)
+    def _get_base_shader(base_name: str) -> ShaderDef:
+        shader = ShaderManager._base_shaders.get(base_name, None)
         if shader is None:
+            shader = ShaderDef.from_xml(ShaderManager._base_shader_elements[base_name])
+            ShaderManager._base_shaders[base_name] = shader
+
+        return shader
+
+    @staticmethod
+    def find_shader(filename: str) -> Optional[ShaderDef]:
+        filename = ShaderManager._resolve_filename(filename)
+        if filename is None:
             return None
-        return ShaderManager._shaders_base_names[shader]
 
+        shader = ShaderManager._shaders.get(filename, None)
+        if shader is None:
+            base_name, render_bucket = ShaderManager._shader_filenames[filename]
+            # Filenames of the same base shader only differ in these, share everything else
+            shader = copy.copy(ShaderManager._get_base_shader(base_name))
+            shader.filename = TextProperty("Name", filename)
+            shader.render_bucket = render_bucket
+            ShaderManager._shaders[filename] = shader
 
-ShaderManager.load_shaders()
+        return shader
+
+    @staticmethod
+    def find_shader_base_name(filename: str) -> Optional[str]:
+        filename = ShaderManager._resolve_filename(filename)
+        if filename is None:
+            return None
+        return ShaderManager._shader_filenames[filename][0]
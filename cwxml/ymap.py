@@ -1,8 +1,12 @@
 from abc import ABC as AbstractClass, abstractmethod
-from typing import Union, Type
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Union, Type
 from xml.etree import ElementTree as ET
+import numpy as np
+from mathutils import Quaternion, Vector
 from .element import (
     AttributeProperty,
+    ElementWriter,
     ElementProperty,
     ElementTree,
     ListProperty,
@@ -16,6 +20,7 @@ from .element import (
     ListPropertyRequired,
     ElementProperty,
     Vector4Property,
+    pop_streamed_children,
 )
 
 
@@ -424,10 +429,343 @@ class Entity(ElementTree):
         self.tint_value = ValueProperty("tintValue", 0)
 
 
+# Numeric columns of ``EntityTable``. String columns hold indices into the table's ``strings``.
+ENTITY_TABLE_DTYPE = np.dtype([
+    ("type", np.uint32),
+    ("archetype_name", np.uint32),
+    ("flags", np.int64),
+    ("guid", np.int64),
+    ("position", np.float32, (3,)),
+    # x, y, z, w like the XML, not the w, x, y, z order of Quaternion
+    ("rotation", np.float32, (4,)),
+    ("scale_xy", np.float32),
+    ("scale_z", np.float32),
+    ("parent_index", np.int32),
+    ("lod_dist", np.float32),
+    ("child_lod_dist", np.float32),
+    ("lod_level", np.uint32),
+    ("num_children", np.int32),
+    ("priority_level", np.uint32),
+    ("ambient_occlusion_multiplier", np.int32),
+    ("artificial_ambient_occlusion", np.int32),
+    ("tint_value", np.int32),
+])
+
+ENTITY_STRING_COLUMNS = ("type", "archetype_name", "lod_level", "priority_level")
+
+# (tag, column, kind) of the entity children, in the order Entity writes them
+ENTITY_ITEM_FIELDS = (
+    ("archetypeName", "archetype_name", "text"),
+    ("flags", "flags", "int"),
+    ("guid", "guid", "int"),
+    ("position", "position", "vector"),
+    ("rotation", "rotation", "quaternion"),
+    ("scaleXY", "scale_xy", "float"),
+    ("scaleZ", "scale_z", "float"),
+    ("parentIndex", "parent_index", "int"),
+    ("lodDist", "lod_dist", "float"),
+    ("childLodDist", "child_lod_dist", "float"),
+    ("lodLevel", "lod_level", "text"),
+    ("numChildren", "num_children", "int"),
+    ("priorityLevel", "priority_level", "text"),
+    ("extensions", None, "extensions"),
+    ("ambientOcclusionMultiplier", "ambient_occlusion_multiplier", "int"),
+    ("artificialAmbientOcclusion", "artificial_ambient_occlusion", "int"),
+    ("tintValue", "tint_value", "int"),
+)
+
+ENTITY_ITEM_FIELD_INDICES = {tag: i for i, (tag, _, _) in enumerate(ENTITY_ITEM_FIELDS)}
+
+
+def read_entity_item(element: ET.Element) -> tuple:
+    """Read an entity ``<Item>`` into a tuple of its type followed by the values of ``ENTITY_ITEM_FIELDS``, None
+    for missing children."""
+    values = [None] * len(ENTITY_ITEM_FIELDS)
+
+    for child in element:
+        i = ENTITY_ITEM_FIELD_INDICES.get(child.tag)
+        # Only the first child with a tag is read
+        if i is None or values[i] is not None:
+            continue
+
+        kind = ENTITY_ITEM_FIELDS[i][2]
+        if kind == "text":
+            values[i] = child.text or ""
+        elif kind == "int" or kind == "float":
+            value = child.get("value")
+            if value is None:
+                ElementProperty.read_value_error(child)
+            values[i] = value
+        elif kind == "vector":
+            values[i] = (child.get("x", 0), child.get("y", 0), child.get("z", 0))
+        elif kind == "quaternion":
+            if not all(x in child.attrib for x in ("x", "y", "z", "w")):
+                QuaternionProperty.read_value_error(child)
+            values[i] = (child.get("x"), child.get("y"), child.get("z"), child.get("w"))
+        else:
+            extensions = ExtensionsList.from_xml(child)
+            values[i] = extensions if extensions.value else None
+
+    return (element.get("type", "CEntityDef"), *values)
+
+
+class EntityTableItem:
+    """Reads entity items while streaming a file into an ``EntityTable``, see ``Element.parse_xml_file``"""
+
+    @staticmethod
+    def streamed_child_types():
+        return {}
+
+    @staticmethod
+    def from_xml(element: ET.Element):
+        return read_entity_item(element)
+
+
+def format_value_column(column: np.ndarray) -> list[str]:
+    """Format values the same as ``ValueProperty``, whole floats are written as ints"""
+    if column.dtype.kind != "f":
+        return list(map(str, column.tolist()))
+
+    is_int = np.isfinite(column) & (np.trunc(column) == column)
+    int_values = np.where(is_int, column, 0).astype(np.int64).tolist()
+
+    return [str(int_value) if whole else str(value)
+            for value, int_value, whole in zip(column, int_values, is_int.tolist())]
+
+
+class EntityTable:
+    """Columnar alternative to a list of ``Entity``. Numeric values are stored in the ``data`` structured array
+    (see ``ENTITY_TABLE_DTYPE``) and strings are interned in ``strings``. ``extensions`` only holds the entities
+    that have any, by row. Indexing or iterating the table creates ``Entity`` objects on demand."""
+
+    def __init__(self, data: Optional[np.ndarray] = None, strings: Optional[list[str]] = None,
+                 extensions: Optional[dict[int, ExtensionsList]] = None):
+        self.data = data if data is not None else np.zeros(0, dtype=ENTITY_TABLE_DTYPE)
+        self.strings = strings if strings is not None else [""]
+        self.extensions = extensions if extensions is not None else {}
+        self._string_indices = {string: i for i, string in enumerate(self.strings)}
+
+    def intern(self, string: str) -> int:
+        i = self._string_indices.get(string)
+        if i is None:
+            i = len(self.strings)
+            self.strings.append(string)
+            self._string_indices[string] = i
+
+        return i
+
+    def get_strings(self, column: str) -> list[str]:
+        """Get the values of a string column"""
+        strings = self.strings
+        return [strings[i] for i in self.data[column].tolist()]
+
+    @classmethod
+    def from_items(cls, items: list[tuple]) -> "EntityTable":
+        """Create a table from tuples returned by ``read_entity_item``"""
+        table = cls()
+        data = np.zeros(len(items), dtype=ENTITY_TABLE_DTYPE)
+        data["parent_index"] = -1
+        data["rotation"][:, 3] = 1.0
+        intern = table.intern
+
+        for i, (tag, column, kind) in enumerate(ENTITY_ITEM_FIELDS, start=1):
+            values = [item[i] for item in items]
+            rows = [row for row, value in enumerate(values) if value is not None]
+            if not rows:
+                continue
+
+            present = [values[row] for row in rows]
+
+            if kind == "text":
+                data[column][rows] = [intern(value) for value in present]
+            elif kind == "int":
+                data[column][rows] = [int(value) if value.lstrip("-").isdigit() else int(float(value))
+                                      for value in present]
+            elif kind == "float" or kind == "vector" or kind == "quaternion":
+                # Parse as double first, the same as float(), so values round to float32 the same way
+                data[column][rows] = np.array(present, dtype=np.float64)
+            else:
+                table.extensions = dict(zip(rows, present))
+
+        data["type"] = [intern(item[0]) for item in items]
+        table.data = data
+
+        return table
+
+    @classmethod
+    def from_entities(cls, entities: Iterable[Entity]) -> "EntityTable":
+        items = []
+        for entity in entities:
+            rotation = entity.rotation
+            items.append((
+                entity.type,
+                entity.archetype_name,
+                str(int(entity.flags)),
+                str(int(entity.guid)),
+                tuple(entity.position),
+                (rotation.x, rotation.y, rotation.z, rotation.w),
+                entity.scale_xy,
+                entity.scale_z,
+                str(int(entity.parent_index)),
+                entity.lod_dist,
+                entity.child_lod_dist,
+                entity.lod_level,
+                str(int(entity.num_children)),
+                entity.priority_level,
+                entity.get_element("extensions") if entity.extensions else None,
+                str(int(entity.ambient_occlusion_multiplier)),
+                str(int(entity.artificial_ambient_occlusion)),
+                str(int(entity.tint_value)),
+            ))
+
+        return cls.from_items(items)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index: int) -> Entity:
+        row = self.data[index]
+        strings = self.strings
+
+        entity = Entity()
+        entity.type = strings[row["type"]]
+        entity.archetype_name = strings[row["archetype_name"]]
+        entity.flags = int(row["flags"])
+        entity.guid = int(row["guid"])
+        entity.position = Vector(row["position"].tolist())
+        x, y, z, w = row["rotation"].tolist()
+        entity.rotation = Quaternion((w, x, y, z))
+        entity.scale_xy = float(row["scale_xy"])
+        entity.scale_z = float(row["scale_z"])
+        entity.parent_index = int(row["parent_index"])
+        entity.lod_dist = float(row["lod_dist"])
+        entity.child_lod_dist = float(row["child_lod_dist"])
+        entity.lod_level = strings[row["lod_level"]]
+        entity.num_children = int(row["num_children"])
+        entity.priority_level = strings[row["priority_level"]]
+        extensions = self.extensions.get(index if index >= 0 else index + len(self.data))
+        if extensions is not None:
+            entity.extensions = extensions
+        entity.ambient_occlusion_multiplier = int(row["ambient_occlusion_multiplier"])
+        entity.artificial_ambient_occlusion = int(row["artificial_ambient_occlusion"])
+        entity.tint_value = int(row["tint_value"])
+
+        return entity
+
+    def __iter__(self) -> Iterator[Entity]:
+        for i in range(len(self.data)):
+            yield self[i]
+
+    def to_entities(self) -> list[Entity]:
+        return list(self)
+
+    def get_extents(self, radii: Optional[np.ndarray] = None) -> tuple[np.ndarray, np.ndarray]:
+        """Get the min and max corners of the entity positions, each expanded by its radius in ``radii`` if
+        given"""
+        positions = self.data["position"]
+        radii = np.zeros(len(positions), dtype=np.float32) if radii is None else radii
+        return (positions - radii[:, None]).min(axis=0), (positions + radii[:, None]).max(axis=0)
+
+    def get_streaming_extents(self, radii: Optional[np.ndarray] = None) -> tuple[np.ndarray, np.ndarray]:
+        """Get the extents of the area the entities are streamed in, their extents expanded by their LOD distance"""
+        lod_dist = self.data["lod_dist"]
+        return self.get_extents(lod_dist if radii is None else radii + lod_dist)
+
+    def stream_items(self, writer: ElementWriter, level: int):
+        """Write the entities as ``<Item>`` elements, the same as streaming the ``Entity`` objects"""
+        data = self.data
+        strings = self.strings
+        columns = {}
+
+        for tag, column, kind in ENTITY_ITEM_FIELDS:
+            if kind == "text":
+                columns[column] = [strings[i] for i in data[column].tolist()]
+            elif kind == "int" or kind == "float":
+                columns[column] = format_value_column(data[column])
+            elif kind == "vector" or kind == "quaternion":
+                values = data[column]
+                columns[column] = list(zip(*(map(str, values[:, i]) for i in range(values.shape[1]))))
+
+        types = [strings[i] for i in data["type"].tolist()]
+        extensions = self.extensions
+        child_level = level + 1
+
+        for row in range(len(data)):
+            writer.start("Item", {"type": types[row]}, level)
+
+            for tag, column, kind in ENTITY_ITEM_FIELDS:
+                if kind == "text":
+                    text = columns[column][row]
+                    if text:
+                        writer.leaf(tag, {}, text, child_level)
+                elif kind == "int" or kind == "float":
+                    writer.leaf(tag, {"value": columns[column][row]}, None, child_level)
+                elif kind == "vector":
+                    x, y, z = columns[column][row]
+                    writer.leaf(tag, {"x": x, "y": y, "z": z}, None, child_level)
+                elif kind == "quaternion":
+                    x, y, z, w = columns[column][row]
+                    writer.leaf(tag, {"x": x, "y": y, "z": z, "w": w}, None, child_level)
+                elif kind == "extensions" and row in extensions:
+                    extensions[row].stream_xml(writer, child_level)
+
+            writer.end("Item", level)
+
+
+_use_entity_tables = False
+
+
+def entity_tables_enabled() -> bool:
+    return _use_entity_tables
+
+
+@contextmanager
+def use_entity_tables(enabled: bool = True):
+    """Read entity lists as ``EntityTable`` instead of lists of ``Entity`` while in this context"""
+    global _use_entity_tables
+
+    prev_enabled = _use_entity_tables
+    _use_entity_tables = enabled
+
+    try:
+        yield
+    finally:
+        _use_entity_tables = prev_enabled
+
+
 class EntityList(ListPropertyRequired):
+    """Holds a list of ``Entity``, or an ``EntityTable`` if read inside ``use_entity_tables``"""
     list_type = Entity
     tag_name = "entities"
 
+    @classmethod
+    def streamed_child_types(cls):
+        if _use_entity_tables:
+            return {Entity.tag_name: EntityTableItem}
+
+        return {Entity.tag_name: Entity}
+
+    @classmethod
+    def from_xml(cls, element: ET.Element):
+        if not _use_entity_tables:
+            return super().from_xml(element)
+
+        new = cls()
+        items = [item for _, item in pop_streamed_children(element)]
+        items.extend(read_entity_item(child) for child in element.findall(Entity.tag_name))
+        new.value = EntityTable.from_items(items)
+
+        return new
+
+    def stream_xml(self, writer: ElementWriter, level: int = 0):
+        if not isinstance(self.value, EntityTable):
+            super().stream_xml(writer, level)
+            return
+
+        writer.start(self.tag_name, {}, level)
+        self.value.stream_items(writer, level + 1)
+        writer.end(self.tag_name, level)
+
 
 class ContainerLodsList(ElementTree):
     """This is not used by GTA5 but added for completion"""
@@ -640,3 +978,7 @@ class CMapData(ElementTree, AbstractClass):
         # self.lod_lights = LODLightsSOAProperty()
         # self.distant_lod_lights = DistantLODLightsSOAProperty()
         self.block = Block()
+
+    @classmethod
+    def read_variant(cls) -> str:
+        return "entity_tables" if entity_tables_enabled() else ""
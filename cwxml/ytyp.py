@@ -9,7 +9,7 @@ from .element import (
     ValueProperty,
     VectorProperty
 )
-from .ymap import EntityList, ExtensionsList
+from .ymap import EntityList, ExtensionsList, entity_tables_enabled
 from numpy import float32
 
 
@@ -317,3 +317,7 @@ class CMapTypes(ElementTree):
         # TODO: Investigate: Not used in any ytyp file in the game?
         # self.dependencies = DependenciesListProperty()
         self.composite_entity_type = CompositeEntityTypeList()
+
+    @classmethod
+    def read_variant(cls) -> str:
+        return "entity_tables" if entity_tables_enabled() else ""
@@ -1,32 +1,132 @@
 """
-Logging module to easily log messages from operators that are extended into many functions. 
+Logging module to easily log messages from operators that are extended into many functions.
+
+Inside ``buffered_logging`` the messages are collected instead of reported one by one. Repeated messages are
+reported once with the number of times they were logged, and only the first ``max_reported`` warnings and infos are
+reported to the operator when the context ends, so imports that log thousands of warnings don't flood the info log.
 """
 
+import time
 from bpy.types import Operator
-from typing import Optional
+from contextlib import contextmanager
+from typing import Optional, TextIO
 
 _logging_operator: Optional[Operator] = None
 _NO_LOGGING_OPERATOR_WARNING = "LOGGER WARNING: No active logging operator has been set!"
 
+MAX_REPORTED_MESSAGES = 50
 
-def _log(msg: str, level: str):
-    print(f"{level}: {msg}")
 
-    if _logging_operator is None:
+class MessageBuffer:
+    """Messages logged during an operator run, with the number of times each was logged"""
+
+    def __init__(self, log_file: Optional[TextIO] = None):
+        self.counts: dict[tuple[str, str], int] = {}
+        self.log_file = log_file
+
+    def add(self, msg: str, level: str):
+        key = (level, msg)
+        count = self.counts.get(key, 0)
+        self.counts[key] = count + 1
+
+        if count == 0:
+            print(f"{level}: {msg}")
+
+        if self.log_file is not None:
+            self.log_file.write(f"{time.strftime('%H:%M:%S')} {level}: {msg}\n")
+
+    def get_num_logged(self, level: str) -> int:
+        return sum(count for (msg_level, _), count in self.counts.items() if msg_level == level)
+
+    def get_reports(self, max_reported: int = MAX_REPORTED_MESSAGES) -> list[tuple[str, str]]:
+        """Get the (level, message) pairs to report, in the order they were first logged. Errors are always
+        reported, followed by a summary if any message was left out or repeated."""
+        reports = []
+        num_unreported = 0
+        num_reported = 0
+        for (level, msg), count in self.counts.items():
+            if level != "ERROR":
+                if num_reported >= max_reported:
+                    num_unreported += count
+                    continue
+
+                num_reported += 1
+
+            reports.append((level, msg if count == 1 else f"{msg} (x{count})"))
+
+        num_messages = sum(self.counts.values())
+        if num_unreported or num_messages > len(self.counts):
+            summary = (f"{num_messages} messages logged ({self.get_num_logged('WARNING')} warnings, "
+                       f"{self.get_num_logged('ERROR')} errors), {len(self.counts)} unique")
+            if num_unreported:
+                summary += f". {num_unreported} not shown, see the system console"
+                if self.log_file is not None:
+                    summary += f" or '{self.log_file.name}'"
+
+            reports.append(("WARNING" if num_unreported else "INFO", summary))
+
+        return reports
+
+
+_message_buffer: Optional[MessageBuffer] = None
+
+
+def _report(msg: str, level: str, operator: Optional[Operator]):
+    if operator is None:
         print(_NO_LOGGING_OPERATOR_WARNING)
         return
 
     try:
-        _logging_operator.report({level}, msg)
+        operator.report({level}, msg)
     except ReferenceError:
         print(_NO_LOGGING_OPERATOR_WARNING)
 
 
+def _log(msg: str, level: str):
+    if _message_buffer is not None:
+        _message_buffer.add(msg, level)
+        return
+
+    print(f"{level}: {msg}")
+    _report(msg, level, _logging_operator)
+
+
 def set_logging_operator(operator: Operator):
     global _logging_operator
     _logging_operator = operator
 
 
+@contextmanager
+def buffered_logging(operator: Operator, log_filepath: Optional[str] = None,
+                     max_reported: int = MAX_REPORTED_MESSAGES):
+    """Collect the messages logged in this context and report them to ``operator`` when it ends. Every message is
+    also appended to ``log_filepath``, if given."""
+    global _logging_operator, _message_buffer
+
+    prev_operator = _logging_operator
+    prev_buffer = _message_buffer
+    log_file = open(log_filepath, "a", encoding="utf-8") if log_filepath else None
+    buffer = MessageBuffer(log_file)
+    _logging_operator = operator
+    _message_buffer = buffer
+
+    if log_file is not None:
+        log_file.write(f"--- {getattr(operator, 'bl_idname', type(operator).__name__)} "
+                       f"{time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
+
+    try:
+        yield buffer
+    finally:
+        _message_buffer = prev_buffer
+        _logging_operator = prev_operator
+
+        if log_file is not None:
+            log_file.close()
+
+        for level, msg in buffer.get_reports(max_reported):
+            _report(msg, level, operator)
+
+
 def info(msg: str):
     _log(msg, "INFO")
 
@@ -0,0 +1,171 @@
+"""
+Timing of the phases of imports and exports. Phases are marked with ``span``, which can be nested, and ``count``
+adds to counters of the innermost phase, such as the vertices or bytes written. Both do nothing unless a ``Profile``
+is active, see ``use_profile``. The import and export operators activate one when profiling is enabled in the
+add-on preferences.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import NamedTuple, Optional
+
+
+class Span:
+    """A timed phase. ``end`` is None while it is running."""
+    __slots__ = ("name", "start", "end", "counters", "children")
+
+    def __init__(self, name: str, start: float):
+        self.name = name
+        self.start = start
+        self.end: Optional[float] = None
+        self.counters: dict[str, int] = {}
+        self.children: list[Span] = []
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+
+class PhaseStats(NamedTuple):
+    """Totals of all spans with the same path of names"""
+    path: tuple[str, ...]
+    calls: int
+    total_time: float
+    self_time: float
+    counters: dict[str, int]
+
+
+class Profile:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.spans: list[Span] = []
+        self._stack: list[Span] = []
+
+    def begin(self, name: str) -> Span:
+        span = Span(name, time.perf_counter())
+        siblings = self._stack[-1].children if self._stack else self.spans
+        siblings.append(span)
+        self._stack.append(span)
+
+        return span
+
+    def end(self):
+        self._stack.pop().end = time.perf_counter()
+
+    def count(self, name: str, value: int = 1):
+        if not self._stack:
+            return
+
+        counters = self._stack[-1].counters
+        counters[name] = counters.get(name, 0) + value
+
+    def get_breakdown(self) -> list[PhaseStats]:
+        """Get the totals of each phase, depth-first in the order they first ran"""
+        stats: dict[tuple[str, ...], list] = {}
+
+        def add_span(span: Span, parent_path: tuple[str, ...]):
+            path = parent_path + (span.name,)
+            duration = span.duration
+            child_time = sum(child.duration for child in span.children)
+
+            if path not in stats:
+                stats[path] = [0, 0.0, 0.0, {}]
+
+            phase = stats[path]
+            phase[0] += 1
+            phase[1] += duration
+            phase[2] += duration - child_time
+            for name, value in span.counters.items():
+                phase[3][name] = phase[3].get(name, 0) + value
+
+            for child in span.children:
+                add_span(child, path)
+
+        for span in self.spans:
+            add_span(span, ())
+
+        return [PhaseStats(path, *values) for path, values in stats.items()]
+
+    def format_breakdown(self) -> str:
+        total_time = sum(span.duration for span in self.spans) or 1.0
+        lines = [f"{'Phase':<48} {'Calls':>6} {'Total':>10} {'Self':>10} {'%':>6}  Counters"]
+
+        for phase in self.get_breakdown():
+            name = "  " * (len(phase.path) - 1) + phase.path[-1]
+            counters = ", ".join(f"{name}={value}" for name, value in phase.counters.items())
+            lines.append(f"{name:<48} {phase.calls:>6} {phase.total_time:>9.3f}s {phase.self_time:>9.3f}s "
+                         f"{phase.total_time / total_time:>6.1%}  {counters}")
+
+        return "\n".join(lines)
+
+    def to_chrome_trace(self) -> dict:
+        """Get the spans in the Chrome trace event format, viewable in chrome://tracing or Perfetto"""
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "Sollumz"}}]
+
+        def add_span(span: Span):
+            events.append({
+                "name": span.name,
+                "ph": "X",
+                "pid": pid,
+                "tid": 0,
+                "ts": (span.start - self.start) * 1e6,
+                "dur": span.duration * 1e6,
+                "args": span.counters,
+            })
+
+            for child in span.children:
+                add_span(child)
+
+        for span in self.spans:
+            add_span(span)
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, filepath: str):
+        with open(filepath, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+_active_profile: Optional[Profile] = None
+
+
+def get_active_profile() -> Optional[Profile]:
+    return _active_profile
+
+
+@contextmanager
+def use_profile(profile: Optional[Profile]):
+    """Record spans to ``profile`` while in this context. ``None`` disables profiling."""
+    global _active_profile
+
+    prev_profile = _active_profile
+    _active_profile = profile
+
+    try:
+        yield profile
+    finally:
+        _active_profile = prev_profile
+
+
+@contextmanager
+def span(name: str):
+    """Time the code in this context, or the decorated function, as a phase of the active profile"""
+    profile = _active_profile
+    if profile is None:
+        yield
+        return
+
+    profile.begin(name)
+    try:
+        yield
+    finally:
+        profile.end()
+
+
+def count(name: str, value: int = 1):
+    """Add ``value`` to the counter ``name`` of the innermost running span"""
+    if _active_profile is not None:
+        _active_profile.count(name, value)
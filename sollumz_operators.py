@@ -1,6 +1,6 @@
 import traceback
 import os
-from typing import Optional
+from typing import Callable, Iterator, Optional
 import bpy
 import time
 from collections import defaultdict
@@ -9,15 +9,18 @@ from bpy_extras.io_utils import ImportHelper
 from mathutils import Matrix, Quaternion
 from .sollumz_helper import SOLLUMZ_OT_base, find_sollumz_parent
 from .sollumz_properties import SollumType, SOLLUMZ_UI_NAMES, BOUND_TYPES, TimeFlags, ArchetypeType, LODLevel
-from .sollumz_preferences import get_export_settings
-from .cwxml.drawable import YDR, YDD
-from .cwxml.fragment import YFT
+from .sollumz_preferences import get_addon_preferences, get_export_settings, get_import_settings, get_log_filepath, get_profiles_directory_path, get_xml_cache_directory_path
+from .cwxml.drawable import YDR, YDD, Drawable, DrawableDictionary, index_drawable_dictionary
+from .cwxml.fragment import YFT, Fragment
 from .cwxml.bound import YBN
 from .cwxml.navmesh import YNV
 from .cwxml.clipdictionary import YCD
 from .cwxml.ytyp import YTYP
-from .cwxml.ymap import YMAP
+from .cwxml.ymap import YMAP, use_entity_tables
+from .cwxml.cache import XmlCache, use_cache
+from .cwxml.parallel import PreparsedFiles, XmlWriterPool, can_use_worker_processes, parse_xml_files_in_processes, use_writer
 from .ydr.ydrimport import import_ydr
+from .ydr.model_data import get_model_data
 from .ydr.ydrexport import export_ydr
 from .ydd.yddimport import import_ydd
 from .ydd.yddexport import export_ydd
@@ -35,7 +38,8 @@ from .tools.ytyphelper import ytyp_from_objects
 from .ybn.properties import BoundProperties
 from .ybn.properties import BoundFlags
 
-from . import logger
+from . import logger, profiling
+from .profiling import Profile, use_profile
 
 
 class TimedOperator:
@@ -49,12 +53,151 @@ class TimedOperator:
 
     def execute(self, context: bpy.types.Context):
         self._start = time.time()
-        return self.execute_timed(context)
+
+        addon_prefs = get_addon_preferences(context)
+        log_filepath = get_log_filepath() if addon_prefs.write_log_file else None
+        if not addon_prefs.profile_import_export:
+            with logger.buffered_logging(self, log_filepath):
+                return self.execute_timed(context)
+
+        profile = Profile()
+        with logger.buffered_logging(self, log_filepath), use_profile(profile), profiling.span(self.bl_idname):
+            result = self.execute_timed(context)
+
+        print(f"Profile of {self.bl_idname}:\n{profile.format_breakdown()}")
+
+        if addon_prefs.write_profile_trace:
+            filepath = os.path.join(get_profiles_directory_path(),
+                                    f"{self.bl_idname}_{time.strftime('%Y%m%d_%H%M%S')}.json")
+            profile.write_chrome_trace(filepath)
+            self.report({"INFO"}, f"Profile trace saved to '{filepath}'")
+
+        return result
 
     def execute_timed(self, context: bpy.types.Context):
         ...
 
 
+IMPORT_XML_TYPES = (YDR, YDD, YFT, YBN, YNV, YCD, YMAP)
+
+
+def read_import_file(filepath: str):
+    """Parse ``filepath`` the way its import reads it"""
+    if YMAP.file_extension in filepath:
+        with use_entity_tables():
+            return YMAP.from_xml_file(filepath)
+
+    for xml_type in IMPORT_XML_TYPES:
+        if xml_type.file_extension in filepath:
+            return xml_type.from_xml_file(filepath)
+
+
+def get_drawable_xmls(obj) -> list[Drawable]:
+    """Get the drawables the import of ``obj`` creates meshes from"""
+    if isinstance(obj, Drawable):
+        return [obj]
+
+    if isinstance(obj, DrawableDictionary):
+        return list(obj)
+
+    if isinstance(obj, Fragment):
+        drawable_xmls = [obj.drawable]
+        if obj.physics is not None:
+            drawable_xmls.extend(child_xml.drawable for child_xml in obj.physics.lod1.children)
+
+        return drawable_xmls
+
+    return []
+
+
+def prepare_import_file(filepath: str):
+    """Parse ``filepath`` and get the mesh data of its drawables. Used to prepare the files in worker processes.
+    Returns the parsed object and (drawable, model data) pairs."""
+    obj = read_import_file(filepath)
+
+    return obj, [(drawable_xml, get_model_data(drawable_xml)) for drawable_xml in get_drawable_xmls(obj)]
+
+
+def import_file(filepath: str, drawable_names: Optional[set[str]] = None) -> bool:
+    """Import ``filepath`` with the importer of its file type. Returns False if the type isn't supported."""
+    if YDR.file_extension in filepath:
+        import_ydr(filepath)
+    elif YDD.file_extension in filepath:
+        import_ydd(filepath, drawable_names)
+    elif YFT.file_extension in filepath:
+        import_yft(filepath)
+    elif YBN.file_extension in filepath:
+        import_ybn(filepath)
+    elif YNV.file_extension in filepath:
+        import_ynv(filepath)
+    elif YCD.file_extension in filepath:
+        import_ycd(filepath)
+    elif YMAP.file_extension in filepath:
+        import_ymap(filepath)
+    else:
+        return False
+
+    return True
+
+
+def get_exporter(obj: bpy.types.Object) -> Optional[tuple[str, Callable[[bpy.types.Object, str], bool]]]:
+    """Get the file extension and export function for ``obj``, None if it can't be exported"""
+    if obj.sollum_type == SollumType.DRAWABLE:
+        return YDR.file_extension, export_ydr
+    elif obj.sollum_type == SollumType.DRAWABLE_DICTIONARY:
+        return YDD.file_extension, export_ydd
+    elif obj.sollum_type == SollumType.FRAGMENT:
+        return YFT.file_extension, export_yft
+    elif obj.sollum_type == SollumType.CLIP_DICTIONARY:
+        return YCD.file_extension, export_ycd
+    elif obj.sollum_type in BOUND_TYPES:
+        return YBN.file_extension, export_ybn
+    elif obj.sollum_type == SollumType.YMAP:
+        return YMAP.file_extension, export_ymap
+
+    return None
+
+
+def get_export_filepath(obj: bpy.types.Object, directory: str, extension: str) -> str:
+    name = remove_number_suffix(obj.name.lower())
+
+    return os.path.join(directory, name + extension)
+
+
+class SOLLUMZ_PG_picked_drawable(bpy.types.PropertyGroup):
+    selected: bpy.props.BoolProperty(name="Import", default=False)
+
+
+class SOLLUMZ_OT_list_ydd_drawables(bpy.types.Operator):
+    """List the drawables of the selected drawable dictionary to pick the ones to import"""
+    bl_idname = "sollumz.list_ydd_drawables"
+    bl_label = "List Drawables"
+    bl_options = {"INTERNAL"}
+
+    @classmethod
+    def poll(cls, context):
+        space = context.space_data
+        return (space is not None and space.type == "FILE_BROWSER" and
+                space.active_operator is not None and hasattr(space.active_operator, "drawables"))
+
+    def execute(self, context):
+        params = context.space_data.params
+        directory = params.directory.decode() if isinstance(params.directory, bytes) else params.directory
+        filepath = os.path.join(directory, params.filename)
+
+        if not filepath.endswith(YDD.file_extension) or not os.path.isfile(filepath):
+            self.report({"WARNING"}, "Select a drawable dictionary first!")
+            return {"CANCELLED"}
+
+        drawables = context.space_data.active_operator.drawables
+        drawables.clear()
+        for span in index_drawable_dictionary(filepath):
+            drawable = drawables.add()
+            drawable.name = span.name
+
+        return {"FINISHED"}
+
+
 class SOLLUMZ_OT_import(bpy.types.Operator, ImportHelper, TimedOperator):
     """Imports xml files exported by codewalker"""
     bl_idname = "sollumz.import"
@@ -73,9 +216,52 @@ class SOLLUMZ_OT_import(bpy.types.Operator, ImportHelper, TimedOperator):
         maxlen=255,
     )
 
+    drawables: bpy.props.CollectionProperty(
+        name="Drawables",
+        description="Drawables to import from drawable dictionaries",
+        type=SOLLUMZ_PG_picked_drawable,
+        options={"SKIP_SAVE"},
+    )
+    drawables_index: bpy.props.IntProperty(options={"HIDDEN", "SKIP_SAVE"})
+
     def draw(self, context):
         pass
 
+    def get_picked_drawable_names(self, context) -> Optional[set[str]]:
+        """Names of the drawables checked in the list, or None to import all drawables. Nothing checked also imports
+        all of them."""
+        if not get_import_settings(context).ydd_pick_drawables:
+            return None
+
+        return {drawable.name for drawable in self.drawables if drawable.selected} or None
+
+    def iter_parsed_files(self, context, filepaths: list[str], preparsed: PreparsedFiles) -> Iterator[tuple[str, Optional[Exception]]]:
+        """Yield (filepath, parse error) pairs in the order the files are ready to import. With parallel parsing
+        enabled, the files are read and the mesh data of their drawables is prepared in worker processes first, and
+        added to ``preparsed`` as they finish."""
+        import_settings = get_import_settings(context)
+        pooled_filepaths = []
+
+        if import_settings.parallel_parse and can_use_worker_processes():
+            # Picked drawables are read on demand instead
+            skip_ydd = self.get_picked_drawable_names(context) is not None
+            pooled_filepaths = [filepath for filepath in filepaths if any(
+                xml_type.file_extension in filepath for xml_type in IMPORT_XML_TYPES) and not (skip_ydd and YDD.file_extension in filepath)]
+
+        if len(pooled_filepaths) > 1:
+            for filepath, prepared, error in parse_xml_files_in_processes(prepare_import_file, pooled_filepaths):
+                if prepared is not None:
+                    obj, model_datas = prepared
+                    preparsed.add(filepath, obj, model_datas)
+
+                yield filepath, error
+        else:
+            pooled_filepaths = []
+
+        for filepath in filepaths:
+            if filepath not in pooled_filepaths:
+                yield filepath, None
+
     def execute_timed(self, context):
         logger.set_logging_operator(self)
 
@@ -83,35 +269,30 @@ class SOLLUMZ_OT_import(bpy.types.Operator, ImportHelper, TimedOperator):
             self.report({"INFO"}, "No file selected for import!")
             return {"CANCELLED"}
 
-        for file in self.files:
-            directory = os.path.dirname(self.filepath)
-            filepath = os.path.join(directory, file.name)
-
-            try:
-
-                if YDR.file_extension in filepath:
-                    import_ydr(filepath)
-                elif YDD.file_extension in filepath:
-                    import_ydd(filepath)
-                elif YFT.file_extension in filepath:
-                    import_yft(filepath)
-                elif YBN.file_extension in filepath:
-                    import_ybn(filepath)
-                elif YNV.file_extension in filepath:
-                    import_ynv(filepath)
-                elif YCD.file_extension in filepath:
-                    import_ycd(filepath)
-                elif YMAP.file_extension in filepath:
-                    import_ymap(filepath)
-                else:
-                    continue
+        import_settings = get_import_settings(context)
+        xml_cache = None
+        if import_settings.use_xml_cache:
+            xml_cache = XmlCache(get_xml_cache_directory_path(), import_settings.xml_cache_max_size * 1024 * 1024)
 
-                self.report({"INFO"}, f"Successfully imported '{filepath}'")
-            except:
-                self.report({"ERROR"},
-                            f"Error importing: {filepath} \n {traceback.format_exc()}")
+        directory = os.path.dirname(self.filepath)
+        filepaths = [os.path.join(directory, file.name) for file in self.files]
+        preparsed = PreparsedFiles(xml_cache)
 
-                return {"CANCELLED"}
+        with use_cache(preparsed):
+            for filepath, error in self.iter_parsed_files(context, filepaths, preparsed):
+                try:
+                    if error is not None:
+                        raise error
+
+                    if not import_file(filepath, self.get_picked_drawable_names(context)):
+                        continue
+
+                    self.report({"INFO"}, f"Successfully imported '{filepath}'")
+                except:
+                    self.report({"ERROR"},
+                                f"Error importing: {filepath} \n {traceback.format_exc()}")
+
+                    return {"CANCELLED"}
 
         self.report(
             {"INFO"}, f"Imported in {self.time_elapsed} seconds")
@@ -168,52 +349,69 @@ class SOLLUMZ_OT_export(bpy.types.Operator, TimedOperator):
 
             return {"CANCELLED"}
 
-        for obj in objs:
-            filepath = None
-            try:
-                success = False
-                if obj.sollum_type == SollumType.DRAWABLE:
-                    filepath = self.get_filepath(obj, YDR.file_extension)
-                    success = export_ydr(obj, filepath)
-                elif obj.sollum_type == SollumType.DRAWABLE_DICTIONARY:
-                    filepath = self.get_filepath(obj, YDD.file_extension)
-                    success = export_ydd(obj, filepath)
-                elif obj.sollum_type == SollumType.FRAGMENT:
-                    filepath = self.get_filepath(obj, YFT.file_extension)
-                    success = export_yft(obj, filepath)
-                elif obj.sollum_type == SollumType.CLIP_DICTIONARY:
-                    filepath = self.get_filepath(obj, YCD.file_extension)
-                    success = export_ycd(obj, filepath)
-                elif obj.sollum_type in BOUND_TYPES:
-                    filepath = self.get_filepath(obj, YBN.file_extension)
-                    success = export_ybn(obj, filepath)
-                elif obj.sollum_type == SollumType.YMAP:
-                    filepath = self.get_filepath(obj, YMAP.file_extension)
-                    success = export_ymap(obj, filepath)
-                else:
-                    continue
-
-                if success:
-                    self.report({"INFO"}, f"Successfully exported '{filepath}'")
-            except:
-                self.report({"ERROR"},
-                            f"Error exporting: {filepath or obj.name} \n {traceback.format_exc()}")
+        # Objects are converted on the main thread, the pool formats and writes the files while the next one is
+        # converted
+        writer_pool = None
+        if export_settings.parallel_write and len(objs) > 1 and can_use_worker_processes():
+            writer_pool = XmlWriterPool()
 
+        try:
+            with use_writer(writer_pool):
+                for obj in objs:
+                    filepath = None
+                    try:
+                        exporter = get_exporter(obj)
+                        if exporter is None:
+                            continue
+
+                        file_extension, export_func = exporter
+                        filepath = get_export_filepath(obj, self.directory, file_extension)
+                        success = export_func(obj, filepath)
+
+                        if success and writer_pool is None:
+                            self.report({"INFO"}, f"Successfully exported '{filepath}'")
+                    except:
+                        self.report({"ERROR"},
+                                    f"Error exporting: {filepath or obj.name} \n {traceback.format_exc()}")
+
+                        return {"CANCELLED"}
+
+                    if writer_pool is not None and not self.report_written_files(writer_pool.pop_finished()):
+                        return {"CANCELLED"}
+
+                if export_settings.export_with_ytyp:
+                    ytyp = ytyp_from_objects(objs)
+                    filepath = os.path.join(
+                        self.directory, f"{ytyp.name}.ytyp.xml")
+                    ytyp.write_xml(filepath)
+
+                    if writer_pool is None:
+                        self.report(
+                            {"INFO"}, f"Successfully exported '{filepath}' (auto-generated)")
+
+            if writer_pool is not None and not self.report_written_files(writer_pool.pop_finished(wait_all=True)):
                 return {"CANCELLED"}
-
-            if export_settings.export_with_ytyp:
-                ytyp = ytyp_from_objects(objs)
-                filepath = os.path.join(
-                    self.directory, f"{ytyp.name}.ytyp.xml")
-                ytyp.write_xml(filepath)
-                self.report(
-                    {"INFO"}, f"Successfully exported '{filepath}' (auto-generated)")
+        finally:
+            if writer_pool is not None:
+                writer_pool.shutdown()
 
         self.report(
             {"INFO"}, f"Exported in {self.time_elapsed} seconds")
 
         return {"FINISHED"}
 
+    def report_written_files(self, written_files: list[tuple[str, Optional[Exception]]]) -> bool:
+        """Report the files written by the writer pool. Returns False if writing one of them failed."""
+        for filepath, error in written_files:
+            if error is not None:
+                self.report({"ERROR"},
+                            f"Error exporting: {filepath} \n {''.join(traceback.format_exception(error))}")
+                return False
+
+            self.report({"INFO"}, f"Successfully exported '{filepath}'")
+
+        return True
+
     def collect_objects(self, context: bpy.types.Context) -> list[bpy.types.Object]:
         export_settings = get_export_settings()
 
@@ -238,11 +436,6 @@ class SOLLUMZ_OT_export(bpy.types.Operator, TimedOperator):
 
         return list(parent_objs)
 
-    def get_filepath(self, obj: bpy.types.Object, extension: str):
-        name = remove_number_suffix(obj.name.lower())
-
-        return os.path.join(self.directory, name + extension)
-
 
 class SOLLUMZ_OT_paint_vertices(SOLLUMZ_OT_base, bpy.types.Operator):
     """Paint All Vertices Of Selected Object"""
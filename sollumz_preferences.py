@@ -4,12 +4,19 @@ import ast
 from typing import Any
 from .sollumz_properties import SollumType
 from configparser import ConfigParser
+from contextlib import contextmanager
 from typing import Optional
 
 PREFS_FILE_NAME = "sollumz_prefs.ini"
 
+# Set while settings are changed only for the current run, see ``preferences_saving_suspended``
+_saving_suspended = False
+
 
 def _save_preferences(self, context):
+    if _saving_suspended:
+        return
+
     addon_prefs = get_addon_preferences(context)
     prefs_path = get_prefs_path()
 
@@ -108,6 +115,41 @@ class SollumzExportSettings(bpy.types.PropertyGroup):
         update=_save_preferences
     )
 
+    parallel_write: bpy.props.BoolProperty(
+        name="Write Files in Parallel",
+        description="When exporting multiple objects, write the files in worker processes, one per CPU core. Only "
+        "available on Linux",
+        default=False,
+        update=_save_preferences
+    )
+
+    weld_tolerance: bpy.props.FloatProperty(
+        name="Weld Tolerance",
+        description="Also merge vertices whose normals and UVs differ by less than this. Positions and other "
+        "attributes still have to be equal. 0 merges only identical vertices",
+        default=0.0,
+        min=0.0,
+        max=0.1,
+        precision=5,
+        step=0.01,
+        update=_save_preferences
+    )
+
+    optimize_vertex_cache: bpy.props.BoolProperty(
+        name="Optimize Vertex Cache",
+        description="Reorder the triangles and vertices of each geometry so the GPU transforms fewer vertices per "
+        "triangle. The cache miss ratio before and after is logged. Slower to export",
+        default=False,
+        update=_save_preferences
+    )
+
+    reduce_overdraw: bpy.props.BoolProperty(
+        name="Reduce Overdraw",
+        description="Also draw the outward facing groups of triangles first, so they hide more of the rest",
+        default=False,
+        update=_save_preferences
+    )
+
     apply_transforms: bpy.props.BoolProperty(
         name="Apply Parent Transforms",
         description="Apply Drawable/Fragment scale and rotation",
@@ -153,6 +195,13 @@ class SollumzImportSettings(bpy.types.PropertyGroup):
         update=_save_preferences
     )
 
+    ydd_pick_drawables: bpy.props.BoolProperty(
+        name="Pick Drawables",
+        description="Only import the drawables checked in the list from the selected .ydd.xml files. Other drawables are not read from the files. If none are checked, all are imported",
+        default=False,
+        update=_save_preferences
+    )
+
     ymap_skip_missing_entities: bpy.props.BoolProperty(
         name="Skip Missing Entities",
         description="If enabled, missing entities wont be created as an empty object",
@@ -194,6 +243,29 @@ class SollumzImportSettings(bpy.types.PropertyGroup):
         default=False,
     )
 
+    parallel_parse: bpy.props.BoolProperty(
+        name="Parse Files in Parallel",
+        description="When importing multiple files, parse the XML and prepare the mesh data in worker processes, one "
+        "per CPU core. Blender objects are still created one file at a time. Only available on Linux",
+        default=False,
+        update=_save_preferences
+    )
+
+    use_xml_cache: bpy.props.BoolProperty(
+        name="Cache Parsed Files",
+        description="Keep a binary copy of imported XML files so importing an unchanged file again skips parsing it",
+        default=False,
+        update=_save_preferences
+    )
+
+    xml_cache_max_size: bpy.props.IntProperty(
+        name="Max Cache Size (MB)",
+        description="Least recently used files are removed from the cache once it is larger than this",
+        default=2048,
+        min=16,
+        update=_save_preferences
+    )
+
     ytyp_mlo_instance_entities: bpy.props.BoolProperty(
         name="Instance MLO Entities",
         description=(
@@ -241,6 +313,29 @@ class SollumzAddonPreferences(bpy.types.AddonPreferences):
         update=_save_preferences
     )
 
+    profile_import_export: bpy.props.BoolProperty(
+        name="Profile Import/Export",
+        description="Print the time spent in each phase of imports and exports to the system console",
+        default=False,
+        update=_save_preferences
+    )
+
+    write_profile_trace: bpy.props.BoolProperty(
+        name="Save Profile Traces",
+        description="Also save each profile as a Chrome trace file in the Sollumz config directory, viewable in "
+        "chrome://tracing or Perfetto",
+        default=False,
+        update=_save_preferences
+    )
+
+    write_log_file: bpy.props.BoolProperty(
+        name="Save Log File",
+        description="Append every message logged by imports and exports to sollumz.log in the Sollumz config "
+        "directory. Only the first messages are shown in the info log",
+        default=False,
+        update=_save_preferences
+    )
+
     export_settings: bpy.props.PointerProperty(
         type=SollumzExportSettings, name="Export Settings")
     import_settings: bpy.props.PointerProperty(
@@ -253,6 +348,11 @@ class SollumzAddonPreferences(bpy.types.AddonPreferences):
         layout.prop(self, "extra_color_swatches")
         layout.prop(self, "sollumz_icon_header")
         layout.prop(self, "use_text_name_as_mat_name")
+        layout.prop(self, "profile_import_export")
+        row = layout.row()
+        row.enabled = self.profile_import_export
+        row.prop(self, "write_profile_trace")
+        layout.prop(self, "write_log_file")
 
     def register():
         _load_preferences()
@@ -270,6 +370,19 @@ def get_export_settings(context: Optional[bpy.types.Context] = None) -> SollumzE
     return get_addon_preferences(context or bpy.context).export_settings
 
 
+@contextmanager
+def preferences_saving_suspended():
+    """Don't write the preferences file when settings change in this block, e.g. for settings that only apply to a
+    single batch conversion."""
+    global _saving_suspended
+    prev_suspended = _saving_suspended
+    _saving_suspended = True
+    try:
+        yield
+    finally:
+        _saving_suspended = prev_suspended
+
+
 def _load_preferences():
     # Preferences are loaded via an ini file in <user_blender_path>/<version>/config/sollumz_prefs.ini
     addon_prefs = get_addon_preferences(bpy.context)
@@ -335,6 +448,18 @@ def get_config_directory_path() -> str:
     return bpy.utils.user_resource(resource_type='CONFIG', path="sollumz", create=True)
 
 
+def get_xml_cache_directory_path() -> str:
+    return os.path.join(get_config_directory_path(), "xml_cache")
+
+
+def get_log_filepath() -> str:
+    return os.path.join(get_config_directory_path(), "sollumz.log")
+
+
+def get_profiles_directory_path() -> str:
+    return bpy.utils.user_resource(resource_type='CONFIG', path=os.path.join("sollumz", "profiles"), create=True)
+
+
 def register():
     bpy.utils.register_class(SollumzAddonPreferences)
 
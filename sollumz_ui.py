@@ -6,6 +6,7 @@ from .sollumz_properties import SollumType, MaterialType
 from .lods import (SOLLUMZ_OT_SET_LOD_HIGH, SOLLUMZ_OT_SET_LOD_MED, SOLLUMZ_OT_SET_LOD_LOW, SOLLUMZ_OT_SET_LOD_VLOW,
                    SOLLUMZ_OT_SET_LOD_VERY_HIGH, SOLLUMZ_OT_HIDE_COLLISIONS, SOLLUMZ_OT_HIDE_SHATTERMAPS, SOLLUMZ_OT_HIDE_OBJECT, SOLLUMZ_OT_SHOW_COLLISIONS, SOLLUMZ_OT_SHOW_SHATTERMAPS)
 from .icons import icon_manager
+from .cwxml.parallel import can_use_worker_processes
 
 def draw_list_with_add_remove(layout: bpy.types.UILayout, add_operator: str, remove_operator: str, *temp_list_args, **temp_list_kwargs):
     """Draw a UIList with an add and remove button on the right column. Returns the left column."""
@@ -149,6 +150,24 @@ class SOLLUMZ_PT_import_ydd(bpy.types.Panel, SollumzImportSettingsPanel):
 
     def draw_settings(self, layout: bpy.types.UILayout, settings: SollumzImportSettings):
         layout.prop(settings, "import_ext_skeleton")
+        layout.prop(settings, "ydd_pick_drawables")
+
+    def draw(self, context):
+        SollumzImportSettingsPanel.draw(self, context)
+
+        import_op = context.space_data.active_operator
+        col = self.layout.column()
+        col.enabled = self.get_settings(context).ydd_pick_drawables
+        col.operator("sollumz.list_ydd_drawables", icon="FILE_REFRESH")
+        col.template_list(SOLLUMZ_UL_picked_drawables.bl_idname, "",
+                          import_op, "drawables", import_op, "drawables_index", rows=5)
+
+
+class SOLLUMZ_UL_picked_drawables(bpy.types.UIList):
+    bl_idname = "SOLLUMZ_UL_picked_drawables"
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        layout.prop(item, "selected", text=item.name)
 
 
 class SOLLUMZ_UL_armature_list(bpy.types.UIList):
@@ -186,6 +205,22 @@ class SOLLUMZ_PT_import_ymap(bpy.types.Panel, SollumzImportSettingsPanel):
         layout.prop(settings, "ymap_car_generators")
 
 
+class SOLLUMZ_PT_import_cache(bpy.types.Panel, SollumzImportSettingsPanel):
+    bl_label = "Performance"
+    bl_order = 4
+
+    def draw_settings(self, layout: bpy.types.UILayout, settings: SollumzImportSettings):
+        row = layout.row()
+        row.enabled = can_use_worker_processes()
+        row.prop(settings, "parallel_parse")
+        if not row.enabled:
+            layout.label(text="Parallel parsing is only available on Linux", icon="INFO")
+        layout.prop(settings, "use_xml_cache")
+        row = layout.row()
+        row.enabled = settings.use_xml_cache
+        row.prop(settings, "xml_cache_max_size")
+
+
 class SOLLUMZ_PT_export_include(bpy.types.Panel, SollumzExportSettingsPanel):
     bl_label = "Include"
     bl_order = 0
@@ -193,6 +228,11 @@ class SOLLUMZ_PT_export_include(bpy.types.Panel, SollumzExportSettingsPanel):
     def draw_settings(self, layout: bpy.types.UILayout, settings: SollumzExportSettings):
         row = layout.row(heading="Limit To")
         row.prop(settings, "limit_to_selected", text="Selected Objects")
+        row = layout.row()
+        row.enabled = can_use_worker_processes()
+        row.prop(settings, "parallel_write")
+        if not row.enabled:
+            layout.label(text="Parallel writing is only available on Linux", icon="INFO")
 
 
 class SOLLUMZ_PT_export_drawable(bpy.types.Panel, SollumzExportSettingsPanel):
@@ -202,6 +242,11 @@ class SOLLUMZ_PT_export_drawable(bpy.types.Panel, SollumzExportSettingsPanel):
     def draw_settings(self, layout: bpy.types.UILayout, settings: SollumzExportSettings):
         layout.prop(settings, "apply_transforms")
         layout.prop(settings, "export_with_ytyp")
+        layout.prop(settings, "weld_tolerance")
+        layout.prop(settings, "optimize_vertex_cache")
+        row = layout.row()
+        row.enabled = settings.optimize_vertex_cache
+        row.prop(settings, "reduce_overdraw")
 
 
 class SOLLUMZ_PT_export_fragment(bpy.types.Panel, SollumzExportSettingsPanel):
@@ -0,0 +1,378 @@
+"""Generators of large synthetic assets for the benchmarks. The drawable and fragment are built from the test
+assets, the rest from scratch. All sizes are multiplied by ``scale`` so smaller assets can be used for quick runs."""
+
+import copy
+import json
+import os
+from typing import Callable, NamedTuple
+import numpy as np
+from mathutils import Matrix, Quaternion, Vector
+from ..shared import SOLLUMZ_TEST_ASSETS_DIR
+from ...cwxml.element import Element
+from ...cwxml.drawable import YDR, Bone, Drawable, DrawableModel, Geometry, VertexBuffer
+from ...cwxml.fragment import YFT, BoneTransform, Fragment, Transform
+from ...cwxml.ymap import YMAP, CMapData, Entity, use_entity_tables
+from ...cwxml.clipdictionary import YCD, Animation, ChannelsList, ClipDictionary, ClipsList
+from ...cwxml.bound import YBN, BoundFile, BoundGeometryBVH, Material, PolyTriangle
+
+
+SKINNED_DRAWABLE_NUM_VERTS = 1_000_000
+SKINNED_DRAWABLE_NUM_GEOMETRIES = 16
+SKINNED_DRAWABLE_NUM_BONES = 128
+FRAGMENT_NUM_CHILDREN = 200
+MAP_DATA_NUM_ENTITIES = 100_000
+CLIP_DICTIONARY_NUM_BONES = 500
+CLIP_DICTIONARY_NUM_FRAMES = 120
+BVH_NUM_POLYS = 50_000
+
+ASSETS_INFO_FILE_NAME = "benchmark_assets.json"
+
+
+class BenchmarkAsset(NamedTuple):
+    name: str
+    file_extension: str
+    create: Callable[[float], Element]
+    # Reads the file the way the importer does
+    read: Callable[[str], Element]
+
+    @property
+    def file_type(self) -> str:
+        return self.file_extension.split(".")[1]
+
+    def get_filepath(self, directory: str) -> str:
+        return os.path.join(directory, f"{self.name}{self.file_extension}")
+
+
+def scaled(count: int, scale: float) -> int:
+    return max(1, round(count * scale))
+
+
+def create_grid(side: int) -> tuple[np.ndarray, np.ndarray]:
+    """Get the positions and triangle indices of a square grid with ``side`` x ``side`` vertices"""
+    x, y = np.meshgrid(np.linspace(-1, 1, side, dtype=np.float32), np.linspace(-1, 1, side, dtype=np.float32))
+    positions = np.column_stack((x.ravel(), y.ravel(), np.zeros(side * side, dtype=np.float32)))
+
+    corners = (np.arange(side - 1)[None, :] + np.arange(side - 1)[:, None] * side).ravel()
+    quads = np.column_stack((corners, corners + 1, corners + side + 1, corners + side))
+    indices = quads[:, [0, 1, 2, 0, 2, 3]].ravel().astype(np.uint32)
+
+    return positions, indices
+
+
+def create_skinned_vertex_buffer(num_verts: int, num_bones: int, offset: float) -> tuple[np.ndarray, np.ndarray]:
+    positions, indices = create_grid(max(2, int(np.ceil(np.sqrt(num_verts)))))
+    positions[:, 2] = offset
+    num_verts = len(positions)
+
+    data = np.empty(num_verts, dtype=np.dtype([VertexBuffer.VERT_ATTR_DTYPES[name] for name in (
+        "Position", "BlendWeights", "BlendIndices", "Normal", "Colour0", "TexCoord0")]))
+
+    # Each vertex is weighted between the two bones closest to it along the x axis
+    bone_pos = (positions[:, 0] + 1) / 2 * (num_bones - 1)
+    bone_index = np.minimum(bone_pos.astype(np.uint32), num_bones - 2)
+    weight = np.round((1 - (bone_pos - bone_index)) * 255).astype(np.uint32)
+
+    data["Position"] = positions
+    data["BlendWeights"] = 0
+    data["BlendWeights"][:, 0] = weight
+    data["BlendWeights"][:, 1] = 255 - weight
+    data["BlendIndices"] = 0
+    data["BlendIndices"][:, 0] = bone_index
+    data["BlendIndices"][:, 1] = np.minimum(bone_index + 1, num_bones - 1)
+    data["Normal"] = (0, 0, 1)
+    data["Colour0"] = 255
+    data["TexCoord0"] = (positions[:, :2] + 1) / 2
+
+    return data, indices
+
+
+def create_bone(name: str, index: int, parent_index: int, translation: Vector) -> Bone:
+    bone = Bone()
+    bone.name = name
+    bone.tag = index
+    bone.index = index
+    bone.parent_index = parent_index
+    bone.flags = ["RotX", "RotY", "RotZ", "TransX", "TransY", "TransZ"]
+    bone.translation = translation
+    bone.rotation = Quaternion()
+    bone.scale = Vector((1, 1, 1))
+
+    return bone
+
+
+def create_skinned_drawable(scale: float = 1.0) -> Drawable:
+    """Drawable with a single skinned model of ``SKINNED_DRAWABLE_NUM_VERTS`` vertices"""
+    drawable = Drawable.from_xml_file(os.path.join(SOLLUMZ_TEST_ASSETS_DIR, "sollumz_cube.ydr.xml"))
+    drawable.name = "benchmark_skinned"
+    drawable.shader_group.texture_dictionary = []
+
+    num_bones = SKINNED_DRAWABLE_NUM_BONES
+    bones = [create_bone("root", 0, -1, Vector())]
+    for i in range(1, num_bones):
+        bones.append(create_bone(f"bone_{i}", i, 0, Vector(((i / (num_bones - 1)) * 2 - 1, 0, 0))))
+    for bone, next_bone in zip(bones[1:], bones[2:]):
+        bone.sibling_index = next_bone.index
+    drawable.skeleton.bones = bones
+
+    num_geoms = SKINNED_DRAWABLE_NUM_GEOMETRIES
+    num_geom_verts = scaled(SKINNED_DRAWABLE_NUM_VERTS, scale) // num_geoms
+    template_geom = drawable.drawable_models_high[0].geometries[0]
+
+    model = DrawableModel()
+    model.render_mask = 255
+    model.has_skin = 1
+    model.matrix_count = num_bones
+
+    for i in range(num_geoms):
+        geom: Geometry = copy.deepcopy(template_geom)
+        geom.bone_ids = list(range(num_bones))
+        geom.vertex_buffer.data, geom.index_buffer.data = create_skinned_vertex_buffer(
+            num_geom_verts, num_bones, i * 0.1)
+        geom.bounding_box_min = Vector((-1, -1, 0))
+        geom.bounding_box_max = Vector((1, 1, i * 0.1))
+        model.geometries.append(geom)
+
+    drawable.drawable_models_high = [model]
+
+    return drawable
+
+
+def decode_geometries(drawable: Drawable):
+    """Decode the lazily loaded vertex and index buffers, so reading includes them"""
+    for geom in drawable.all_geoms:
+        geom.vertex_buffer.data
+        geom.index_buffer.data
+
+
+def read_drawable(filepath: str) -> Drawable:
+    drawable = Drawable.parse_xml_file(filepath)
+    decode_geometries(drawable)
+
+    return drawable
+
+
+def create_fragment(scale: float = 1.0) -> Fragment:
+    """Fragment with ``FRAGMENT_NUM_CHILDREN`` physics children, each with its own bone, group, model and bound"""
+    fragment = Fragment.from_xml_file(os.path.join(SOLLUMZ_TEST_ASSETS_DIR, "sollumz_cube.yft.xml"))
+    fragment.name = "benchmark_fragment"
+    drawable = fragment.drawable
+    drawable.shader_group.texture_dictionary = []
+    lod = fragment.physics.lod1
+
+    template_bone = drawable.skeleton.bones[2]
+    template_model = drawable.drawable_models_high[0]
+    template_bound = lod.archetype.bounds.children[0]
+    template_group = lod.groups[0]
+    template_child = lod.children[0]
+
+    drawable.skeleton.bones = drawable.skeleton.bones[:2]
+    fragment.bones_transforms = fragment.bones_transforms[:2]
+    drawable.drawable_models_high = []
+    lod.archetype.bounds.children = []
+    lod.transforms = []
+    lod.groups = []
+    lod.children = []
+
+    num_children = scaled(FRAGMENT_NUM_CHILDREN, scale)
+    for i in range(num_children):
+        name = f"child_{i}"
+        bone_index = i + 2
+        translation = Vector(((i % 20) * 2.5, (i // 20) * 2.5, 0))
+
+        bone: Bone = copy.deepcopy(template_bone)
+        bone.name = name
+        bone.tag = 1000 + i
+        bone.index = bone_index
+        bone.sibling_index = bone_index + 1 if i < num_children - 1 else -1
+        bone.translation = translation
+        drawable.skeleton.bones.append(bone)
+
+        fragment.bones_transforms.append(BoneTransform("Item", Matrix(Matrix.Translation(translation)[:3])))
+
+        model: DrawableModel = copy.deepcopy(template_model)
+        model.bone_index = bone_index
+        drawable.drawable_models_high.append(model)
+
+        # Physics matrices are stored transposed
+        bound = copy.deepcopy(template_bound)
+        bound.composite_transform = Matrix.Translation(translation).transposed()
+        lod.archetype.bounds.children.append(bound)
+
+        lod.transforms.append(Transform("Item", Matrix.Translation(translation).transposed()))
+
+        group = copy.deepcopy(template_group)
+        group.name = name
+        lod.groups.append(group)
+
+        child = copy.deepcopy(template_child)
+        child.group_index = i
+        child.bone_tag = bone.tag
+        lod.children.append(child)
+
+    return fragment
+
+
+def read_fragment(filepath: str) -> Fragment:
+    fragment = Fragment.parse_xml_file(filepath)
+    decode_geometries(fragment.drawable)
+
+    return fragment
+
+
+def create_map_data(scale: float = 1.0) -> CMapData:
+    """Map data with ``MAP_DATA_NUM_ENTITIES`` entities"""
+    rng = np.random.default_rng(0)
+    num_entities = scaled(MAP_DATA_NUM_ENTITIES, scale)
+    positions = rng.uniform((-4000, -4000, 0), (4000, 4000, 200), (num_entities, 3)).tolist()
+
+    map_data = CMapData()
+    map_data.name = "benchmark_map"
+
+    for i, position in enumerate(positions):
+        entity = Entity()
+        entity.archetype_name = f"prop_benchmark_{i % 100}"
+        entity.guid = i + 1
+        entity.position = Vector(position)
+        entity.rotation = Quaternion()
+        entity.scale_xy = 1
+        entity.scale_z = 1
+        entity.lod_dist = 100 + i % 200
+        entity.lod_level = "LODTYPES_DEPTH_ORPHANHD"
+        entity.priority_level = "PRI_REQUIRED"
+        entity.ambient_occlusion_multiplier = 255
+        entity.artificial_ambient_occlusion = 255
+        map_data.entities.append(entity)
+
+    map_data.streaming_extents_min = map_data.entities_extents_min = Vector((-4000, -4000, 0))
+    map_data.streaming_extents_max = map_data.entities_extents_max = Vector((4000, 4000, 200))
+
+    return map_data
+
+
+def read_map_data(filepath: str) -> CMapData:
+    with use_entity_tables():
+        return CMapData.parse_xml_file(filepath)
+
+
+def create_channel(channel_type: type, **values) -> ChannelsList.Channel:
+    channel = channel_type()
+    for name, value in values.items():
+        setattr(channel, name, value)
+
+    return channel
+
+
+def create_clip_dictionary(scale: float = 1.0) -> ClipDictionary:
+    """Clip dictionary with a single clip animating the position and rotation of ``CLIP_DICTIONARY_NUM_BONES``
+    bones"""
+    rng = np.random.default_rng(0)
+    num_bones = scaled(CLIP_DICTIONARY_NUM_BONES, scale)
+    num_frames = CLIP_DICTIONARY_NUM_FRAMES
+    duration = (num_frames - 1) / 30
+
+    animation = Animation()
+    animation.hash = "benchmark_anim"
+    animation.frame_count = num_frames
+    animation.sequence_frame_limit = num_frames
+    animation.duration = duration
+    sequence = Animation.SequenceList.Sequence()
+    sequence.hash = "benchmark_sequence"
+    sequence.frame_count = num_frames
+    animation.sequences = [sequence]
+
+    for i in range(num_bones):
+        # Animated position and constant rotation
+        for track, bone_format in ((0, 0), (1, 1)):
+            bone_id = Animation.BoneIdList.BoneId()
+            bone_id.bone_id = i
+            bone_id.track = track
+            bone_id.format = bone_format
+            animation.bone_ids.append(bone_id)
+
+        position = Animation.SequenceDataList.SequenceData()
+        for _ in range(3):
+            values = rng.uniform(-1, 1, num_frames).astype(np.float32)
+            position.channels.append(create_channel(ChannelsList.RawFloat, values=values))
+        sequence.sequence_data.append(position)
+
+        rotation = Animation.SequenceDataList.SequenceData()
+        rotation.channels.append(create_channel(ChannelsList.StaticQuaternion, value=Quaternion()))
+        sequence.sequence_data.append(rotation)
+
+    clip = ClipsList.ClipAnimation()
+    clip.hash = "benchmark_clip"
+    clip.name = "pack:/benchmark_clip.clip"
+    clip.animation_hash = animation.hash
+    clip.end_time = duration
+    clip.rate = 1.0
+
+    clip_dictionary = ClipDictionary()
+    clip_dictionary.clips = [clip]
+    clip_dictionary.animations = [animation]
+
+    return clip_dictionary
+
+
+def create_bvh_bound(scale: float = 1.0) -> BoundFile:
+    """Bound file with a single BVH of ``BVH_NUM_POLYS`` triangles"""
+    num_polys = scaled(BVH_NUM_POLYS, scale)
+    # Two triangles per grid cell
+    positions, indices = create_grid(int(np.ceil(np.sqrt(num_polys / 2))) + 1)
+    positions *= 100
+    positions[:, 2] = np.sin(positions[:, 0] / 10) * np.cos(positions[:, 1] / 10)
+    triangles = indices.reshape((-1, 3))[:num_polys].tolist()
+
+    bvh = BoundGeometryBVH()
+    bvh.composite_transform = Matrix()
+    bvh.box_min = Vector(positions.min(axis=0).tolist())
+    bvh.box_max = Vector(positions.max(axis=0).tolist())
+    bvh.materials = [Material()]
+    bvh.vertices = positions
+
+    for v1, v2, v3 in triangles:
+        poly = PolyTriangle()
+        poly.v1 = v1
+        poly.v2 = v2
+        poly.v3 = v3
+        bvh.polygons.append(poly)
+
+    bound_file = BoundFile()
+    bound_file.composite.children = [bvh]
+
+    return bound_file
+
+
+BENCHMARK_ASSETS = (
+    BenchmarkAsset("benchmark_skinned", YDR.file_extension, create_skinned_drawable, read_drawable),
+    BenchmarkAsset("benchmark_fragment", YFT.file_extension, create_fragment, read_fragment),
+    BenchmarkAsset("benchmark_map", YMAP.file_extension, create_map_data, read_map_data),
+    BenchmarkAsset("benchmark_clips", YCD.file_extension, create_clip_dictionary, ClipDictionary.parse_xml_file),
+    BenchmarkAsset("benchmark_bvh", YBN.file_extension, create_bvh_bound, BoundFile.parse_xml_file),
+)
+
+
+def write_assets(directory: str, scale: float = 1.0, overwrite: bool = False) -> dict[str, str]:
+    """Generate the benchmark assets in ``directory``. Files generated before at the same scale are kept unless
+    ``overwrite`` is set. Returns the file paths by file type."""
+    os.makedirs(directory, exist_ok=True)
+
+    info_filepath = os.path.join(directory, ASSETS_INFO_FILE_NAME)
+    try:
+        with open(info_filepath, "r") as f:
+            overwrite = overwrite or json.load(f)["scale"] != scale
+    except (OSError, ValueError, KeyError):
+        overwrite = True
+
+    filepaths = {}
+    for asset in BENCHMARK_ASSETS:
+        filepath = asset.get_filepath(directory)
+        if overwrite or not os.path.exists(filepath):
+            print(f"Generating '{filepath}'...")
+            asset.create(scale).write_xml_file(filepath)
+
+        filepaths[asset.file_type] = filepath
+
+    with open(info_filepath, "w") as f:
+        json.dump({"scale": scale}, f)
+
+    return filepaths
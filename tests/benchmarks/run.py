@@ -0,0 +1,215 @@
+"""
+Benchmarks of the XML read and write paths, and of the full import and export, on large synthetic assets (see
+``assets``). Results are saved as JSON and can be compared against the results of an earlier run, flagging the
+benchmarks that got slower by more than a threshold.
+
+Run it from Blender in background mode, with the add-on enabled. ``sollumz`` is the module name the add-on is
+installed as:
+
+    blender -b --python-exit-code 1 --python-expr "import sollumz.tests.benchmarks.run as run; run.main()" -- \\
+        [--output <file>] [--baseline <file>] [--threshold 0.1] [--scale 1.0] [--repeat 3] \\
+        [--assets-dir <dir>] [--only ydr,ymap] [--xml-only]
+
+Save the results of a run before making changes and pass them as ``--baseline`` afterwards. Blender exits with
+code 1 if any benchmark regressed or failed.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import traceback
+from datetime import datetime
+from typing import Any, Callable, NamedTuple, Optional
+from .assets import BENCHMARK_ASSETS, BenchmarkAsset, write_assets
+
+
+RESULTS_FILE_NAME = "benchmark_results.json"
+DEFAULT_ASSETS_DIR = os.path.join(tempfile.gettempdir(), "sollumz_benchmark_assets")
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline_time: float
+    time: float
+
+    @property
+    def ratio(self) -> float:
+        return self.time / self.baseline_time if self.baseline_time > 0 else 1.0
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio > 1 + threshold
+
+
+def is_blender_available() -> bool:
+    try:
+        import bpy
+    except ImportError:
+        return False
+
+    return True
+
+
+def get_timings(times: list[float]) -> dict[str, Any]:
+    return {"min": min(times), "median": statistics.median(times), "times": times}
+
+
+def measure(func: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return get_timings(times)
+
+
+def run_xml_benchmarks(asset: BenchmarkAsset, filepath: str, output_dir: str, repeat: int) -> dict[str, Any]:
+    """Time reading ``filepath`` and writing the object read back to ``output_dir``"""
+    results = {"read": measure(lambda: asset.read(filepath), repeat)}
+
+    obj = asset.read(filepath)
+    output_filepath = os.path.join(output_dir, os.path.basename(filepath))
+    results["write"] = measure(lambda: obj.write_xml_file(output_filepath), repeat)
+
+    return results
+
+
+def run_blender_benchmarks(filepath: str, output_dir: str, repeat: int) -> dict[str, Any]:
+    """Time importing ``filepath`` and exporting the imported objects to ``output_dir``"""
+    from ...batch import BatchJob, run_job
+
+    import_times = []
+    export_times = []
+    for _ in range(repeat):
+        gc.collect()
+        job = BatchJob(filepath)
+        run_job(job, output_dir)
+
+        if not job.succeeded:
+            raise RuntimeError("\n".join(job.errors))
+
+        import_times.append(job.import_time)
+        export_times.append(job.export_time)
+
+    return {"import": get_timings(import_times), "export": get_timings(export_times)}
+
+
+def run_benchmarks(assets_dir: str, scale: float = 1.0, repeat: int = 3, file_types: Optional[list[str]] = None,
+                   include_blender: bool = True) -> dict[str, Any]:
+    """Run the benchmarks of the assets in ``assets_dir``, generating them first if needed. Returns the results."""
+    filepaths = write_assets(assets_dir, scale)
+    include_blender = include_blender and is_blender_available()
+
+    benchmarks = {}
+    errors = {}
+    with tempfile.TemporaryDirectory(prefix="sollumz_benchmark_") as output_dir:
+        for asset in BENCHMARK_ASSETS:
+            if file_types and asset.file_type not in file_types:
+                continue
+
+            filepath = filepaths[asset.file_type]
+            print(f"Benchmarking '{filepath}'...")
+
+            try:
+                results = run_xml_benchmarks(asset, filepath, output_dir, repeat)
+                if include_blender:
+                    results.update(run_blender_benchmarks(filepath, output_dir, repeat))
+            except Exception:
+                errors[asset.file_type] = traceback.format_exc()
+                print(errors[asset.file_type])
+                continue
+
+            for phase, timings in results.items():
+                benchmarks[f"{asset.file_type}.{phase}"] = timings
+
+    results = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "scale": scale,
+        "repeat": repeat,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": benchmarks,
+        "errors": errors,
+    }
+
+    if include_blender:
+        import bpy
+        results["blender_version"] = bpy.app.version_string
+
+    return results
+
+
+def compare_results(results: dict[str, Any], baseline: dict[str, Any]) -> list[Comparison]:
+    """Compare the best times of the benchmarks in both ``results`` and ``baseline``"""
+    if results.get("scale") != baseline.get("scale"):
+        print(f"Warning: comparing results of scale {results.get('scale')} against a baseline of scale "
+              f"{baseline.get('scale')}!")
+
+    baseline_benchmarks = baseline["benchmarks"]
+
+    return [
+        Comparison(name, baseline_benchmarks[name]["min"], timings["min"])
+        for name, timings in results["benchmarks"].items()
+        if name in baseline_benchmarks
+    ]
+
+
+def print_comparisons(comparisons: list[Comparison], threshold: float):
+    print(f"{'Benchmark':<16} {'Baseline':>10} {'Current':>10} {'Change':>8}")
+    for comparison in comparisons:
+        flag = "  REGRESSION" if comparison.is_regression(threshold) else ""
+        print(f"{comparison.name:<16} {comparison.baseline_time:>9.3f}s {comparison.time:>9.3f}s "
+              f"{comparison.ratio - 1:>+8.1%}{flag}")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="sollumz.tests.benchmarks.run",
+                                     description="Benchmark reading, writing, importing and exporting large assets")
+    parser.add_argument("--output", default=RESULTS_FILE_NAME, help="JSON file to save the results to")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Slowdown relative to the baseline that counts as a regression, e.g. 0.1 for 10%%")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier of the size of the generated assets")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of times each benchmark is run")
+    parser.add_argument("--assets-dir", default=DEFAULT_ASSETS_DIR,
+                        help="Directory to generate the assets in, reused by later runs of the same scale")
+    parser.add_argument("--only", help="Comma-separated file types to benchmark, e.g. 'ydr,ymap'. Defaults to all")
+    parser.add_argument("--xml-only", action="store_true", help="Skip the import and export benchmarks")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None):
+    """Entry point, reads the arguments after '--' from the Blender command line if ``argv`` isn't given"""
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    args = parse_args(argv)
+    file_types = [file_type.strip().lower() for file_type in args.only.split(",")] if args.only else None
+
+    results = run_benchmarks(args.assets_dir, args.scale, args.repeat, file_types, not args.xml_only)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"Results written to '{args.output}'")
+
+    failed = bool(results["errors"])
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+
+        comparisons = compare_results(results, baseline)
+        print_comparisons(comparisons, args.threshold)
+        failed = failed or any(comparison.is_regression(args.threshold) for comparison in comparisons)
+
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,79 @@
+import os
+import pytest
+from .. import sollumz_preferences
+from ..batch import apply_settings, get_input_filepaths, get_job_output_directory, parse_setting, restore_settings
+from ..sollumz_preferences import get_export_settings
+
+
+class Settings:
+    __annotations__ = {"apply_transforms": bool, "export_lods": set}
+
+    def __init__(self):
+        self.apply_transforms = False
+        self.export_lods = {"sollumz_export_main_lods"}
+
+
+def test_batch_parse_setting():
+    assert parse_setting("apply_transforms=True") == ("apply_transforms", True)
+    assert parse_setting(" xml_cache_max_size = 512") == ("xml_cache_max_size", 512)
+    assert parse_setting("export_lods={'sollumz_export_very_high'}") == ("export_lods", {"sollumz_export_very_high"})
+    # Strings can be given without quotes
+    assert parse_setting("mode=SOME_ENUM") == ("mode", "SOME_ENUM")
+
+    with pytest.raises(ValueError):
+        parse_setting("apply_transforms")
+
+
+def test_batch_apply_settings():
+    settings = Settings()
+
+    prev_values = apply_settings(settings, ["apply_transforms=True", "export_lods={'sollumz_export_very_high'}"])
+    assert settings.apply_transforms is True
+    assert settings.export_lods == {"sollumz_export_very_high"}
+
+    restore_settings(settings, prev_values)
+    assert settings.apply_transforms is False
+    assert settings.export_lods == {"sollumz_export_main_lods"}
+
+    with pytest.raises(ValueError):
+        apply_settings(settings, ["unknown_setting=1"])
+
+
+def test_batch_settings_not_saved(tmp_path, monkeypatch):
+    prefs_path = tmp_path / sollumz_preferences.PREFS_FILE_NAME
+    prefs_path.write_text("[main]\n")
+    monkeypatch.setattr(sollumz_preferences, "get_prefs_path", lambda: str(prefs_path))
+
+    settings = get_export_settings()
+    prev_value = settings.apply_transforms
+
+    prev_values = apply_settings(settings, [f"apply_transforms={not prev_value}"])
+    assert settings.apply_transforms is not prev_value
+
+    restore_settings(settings, prev_values)
+    assert settings.apply_transforms is prev_value
+    assert prefs_path.read_text() == "[main]\n"
+
+
+def test_batch_get_input_filepaths(tmp_path):
+    for filename in ("b.ydr.xml", "a.yft.xml", "notes.txt", os.path.join("sub", "c.ydr.xml")):
+        filepath = tmp_path / filename
+        filepath.parent.mkdir(exist_ok=True)
+        filepath.write_text("")
+
+    directory = str(tmp_path)
+
+    assert get_input_filepaths(directory, None, False) == [
+        os.path.join(directory, "a.yft.xml"), os.path.join(directory, "b.ydr.xml")]
+    assert get_input_filepaths(directory, ["ydr"], True) == [
+        os.path.join(directory, "b.ydr.xml"), os.path.join(directory, "sub", "c.ydr.xml")]
+
+
+def test_batch_get_job_output_directory(tmp_path):
+    input_directory = str(tmp_path / "in")
+    output_directory = str(tmp_path / "out")
+
+    assert get_job_output_directory(os.path.join(input_directory, "a.ydr.xml"),
+                                    input_directory, output_directory) == output_directory
+    assert get_job_output_directory(os.path.join(input_directory, "sub", "deeper", "a.ydr.xml"),
+                                    input_directory, output_directory) == os.path.join(output_directory, "sub", "deeper")
@@ -0,0 +1,55 @@
+from .. import logger
+
+
+class ReportCollector:
+    def __init__(self):
+        self.reports = []
+
+    def report(self, level, msg):
+        self.reports.append((next(iter(level)), msg))
+
+
+def test_logger_buffered_deduplicates():
+    collector = ReportCollector()
+
+    with logger.buffered_logging(collector):
+        for _ in range(1000):
+            logger.warning("Vertex has more than 4 weights")
+        logger.error("Missing shader")
+
+        assert collector.reports == []
+
+    assert collector.reports[0] == ("WARNING", "Vertex has more than 4 weights (x1000)")
+    assert collector.reports[1] == ("ERROR", "Missing shader")
+    assert collector.reports[2][0] == "INFO"
+    assert "1001 messages" in collector.reports[2][1]
+
+
+def test_logger_buffered_limits_reports(tmp_path):
+    collector = ReportCollector()
+    log_filepath = tmp_path / "sollumz.log"
+
+    with logger.buffered_logging(collector, str(log_filepath), max_reported=5):
+        for i in range(20):
+            logger.warning(f"Warning {i}")
+        logger.error("Error")
+
+    assert [msg for _, msg in collector.reports[:6]] == [f"Warning {i}" for i in range(5)] + ["Error"]
+    assert collector.reports[6][0] == "WARNING"
+    assert "15 not shown" in collector.reports[6][1]
+    assert str(log_filepath) in collector.reports[6][1]
+
+    log_lines = log_filepath.read_text().splitlines()
+    assert len(log_lines) == 22
+    assert log_lines[-1].endswith("ERROR: Error")
+
+
+def test_logger_unbuffered_reports_immediately():
+    collector = ReportCollector()
+    logger.set_logging_operator(collector)
+
+    try:
+        logger.info("Imported")
+        assert collector.reports == [("INFO", "Imported")]
+    finally:
+        logger.set_logging_operator(None)
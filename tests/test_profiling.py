@@ -0,0 +1,54 @@
+import json
+from ..profiling import Profile, count, get_active_profile, span, use_profile
+
+
+@span("decorated")
+def decorated_phase():
+    count("vertices", 10)
+
+
+def test_profiling_breakdown():
+    profile = Profile()
+
+    with use_profile(profile):
+        with span("export"):
+            for _ in range(2):
+                decorated_phase()
+            with span("write"):
+                count("bytes", 100)
+                count("bytes", 50)
+
+    assert get_active_profile() is None
+
+    breakdown = {phase.path: phase for phase in profile.get_breakdown()}
+
+    assert list(breakdown) == [("export",), ("export", "decorated"), ("export", "write")]
+    assert breakdown[("export", "decorated")].calls == 2
+    assert breakdown[("export", "decorated")].counters == {"vertices": 20}
+    assert breakdown[("export", "write")].counters == {"bytes": 150}
+    assert breakdown[("export",)].self_time <= breakdown[("export",)].total_time
+    assert "decorated" in profile.format_breakdown()
+
+
+def test_profiling_chrome_trace(tmp_path):
+    profile = Profile()
+
+    with use_profile(profile), span("import"):
+        decorated_phase()
+
+    trace_path = tmp_path / "trace.json"
+    profile.write_chrome_trace(str(trace_path))
+    events = [event for event in json.loads(trace_path.read_text())["traceEvents"] if event["ph"] == "X"]
+
+    assert [event["name"] for event in events] == ["import", "decorated"]
+    assert events[1]["args"] == {"vertices": 10}
+    assert events[0]["dur"] >= events[1]["dur"]
+
+
+def test_profiling_inactive():
+    decorated_phase()
+
+    with span("unprofiled"):
+        count("vertices")
+
+    assert get_active_profile() is None
@@ -47,3 +47,15 @@ def test_find_shader_base_name(filename: str, expected: str):
 def test_find_shader_base_name_unknown_returns_none(filename: str):
     shader = ShaderManager.find_shader_base_name(filename)
     assert shader is None
+
+
+def test_find_shader_filenames_share_base_shader():
+    default = ShaderManager.find_shader("default.sps")
+    cutout = ShaderManager.find_shader("cutout.sps")
+
+    assert default.filename == "default.sps"
+    assert cutout.filename == "cutout.sps"
+    assert default.render_bucket == 0
+    assert cutout.render_bucket == 3
+    assert cutout.parameters is default.parameters
+    assert ShaderManager.find_shader("hash_18ad1594") is default
@@ -0,0 +1,63 @@
+import numpy as np
+from numpy.testing import assert_equal
+from ..ydr.vertex_buffer_builder import dedupe_and_get_indices, get_top_four_groups
+
+
+def test_top_four_groups_keeps_group_order():
+    group_counts = np.array([2, 0, 4], dtype=np.int32)
+    group_inds = np.array([3, 1, 0, 2, 5, 4], dtype=np.int32)
+    group_weights = np.array([0.25, 0.75, 0.1, 0.2, 0.3, 0.4], dtype=np.float32)
+
+    vgroup_slots, weight_slots = get_top_four_groups(group_counts, group_inds, group_weights)
+
+    assert_equal(vgroup_slots, [[3, 1, -1, -1], [-1, -1, -1, -1], [0, 2, 5, 4]])
+    assert_equal(weight_slots, np.array([[0.25, 0.75, 0, 0], [0, 0, 0, 0], [0.1, 0.2, 0.3, 0.4]], dtype=np.float32))
+
+
+def test_top_four_groups_keeps_largest_weights():
+    group_counts = np.array([6, 1], dtype=np.int32)
+    group_inds = np.array([0, 1, 2, 3, 4, 5, 7], dtype=np.int32)
+    group_weights = np.array([0.1, 0.5, 0.05, 0.3, 0.2, 0.4, 1.0], dtype=np.float32)
+
+    vgroup_slots, weight_slots = get_top_four_groups(group_counts, group_inds, group_weights)
+
+    assert_equal(vgroup_slots, [[1, 3, 4, 5], [7, -1, -1, -1]])
+    assert_equal(weight_slots, np.array([[0.5, 0.3, 0.2, 0.4], [1.0, 0, 0, 0]], dtype=np.float32))
+
+
+def create_vertices(positions, normals, uvs):
+    vertex_arr = np.zeros(len(positions), dtype=[("Position", np.float32, 3), ("Normal", np.float32, 3),
+                                                 ("TexCoord0", np.float32, 2)])
+    vertex_arr["Position"] = positions
+    vertex_arr["Normal"] = normals
+    vertex_arr["TexCoord0"] = uvs
+    return vertex_arr
+
+
+def test_dedupe_keeps_first_use_order():
+    vertex_arr = create_vertices(
+        positions=[(5, 0, 0), (1, 0, 0), (5, 0, 0), (0, 0, 0), (1, 0, 0), (5, 0, 0), (0, 0, 0)],
+        normals=[(0, 0, 1), (0, 0, 1), (0, 0, 1), (0, 0, 0.0), (0, 0, 1), (0, 0, 1), (0, 0, -0.0)],
+        uvs=[(0, 0)] * 7,
+    )
+
+    vertices, indices = dedupe_and_get_indices(vertex_arr)
+
+    assert_equal(vertices["Position"], [(5, 0, 0), (1, 0, 0), (0, 0, 0)])
+    assert_equal(indices, [0, 1, 0, 2, 1, 0, 2])
+    assert indices.dtype == np.uint32
+
+
+def test_dedupe_with_tolerance():
+    vertex_arr = create_vertices(
+        positions=[(0, 0, 0)] * 3 + [(0, 0, 0.00001)],
+        normals=[(0, 0, 1), (0, 0, 1.00001), (0, 0.1, 0.99), (0, 0, 1)],
+        uvs=[(0.5, 0.5), (0.500001, 0.5), (0.5, 0.5), (0.5, 0.5)],
+    )
+
+    vertices, indices = dedupe_and_get_indices(vertex_arr)
+    assert_equal(indices, [0, 1, 2, 3])
+
+    vertices, indices = dedupe_and_get_indices(vertex_arr, tolerance=0.0001)
+    assert_equal(indices, [0, 0, 1, 2])
+    assert_equal(vertices["Normal"][0], (0, 0, 1))
@@ -0,0 +1,50 @@
+import numpy as np
+from numpy.testing import assert_equal
+from ..ydr.vertex_cache import calc_acmr, optimize_vertex_cache, reorder_vertices_by_first_use
+
+
+def create_grid(side: int):
+    xs, ys = np.meshgrid(np.arange(side), np.arange(side))
+    vertex_arr = np.zeros(side * side, dtype=[("Position", np.float32, 3)])
+    vertex_arr["Position"][:, 0] = xs.ravel()
+    vertex_arr["Position"][:, 1] = ys.ravel()
+
+    tris = []
+    for y in range(side - 1):
+        for x in range(side - 1):
+            i = y * side + x
+            tris.append((i, i + 1, i + side))
+            tris.append((i + 1, i + side + 1, i + side))
+
+    return vertex_arr, np.array(tris, dtype=np.uint32)
+
+
+def get_triangle_positions(vertex_arr, indices) -> set:
+    return {tuple(map(tuple, vertex_arr["Position"][tri])) for tri in indices.reshape((-1, 3))}
+
+
+def test_calc_acmr():
+    assert calc_acmr(np.array([0, 1, 2, 2, 1, 3], dtype=np.uint32)) == 2.0
+    assert calc_acmr(np.array([0, 1, 2, 3, 4, 5], dtype=np.uint32), cache_size=2) == 3.0
+
+
+def test_optimize_vertex_cache():
+    vertex_arr, tris = create_grid(40)
+    indices = tris[np.random.default_rng(0).permutation(len(tris))].ravel()
+
+    for reduce_overdraw in (False, True):
+        new_vertex_arr, new_indices = optimize_vertex_cache(vertex_arr, indices, reduce_overdraw)
+
+        assert calc_acmr(new_indices) < calc_acmr(indices) / 2
+        assert get_triangle_positions(new_vertex_arr, new_indices) == get_triangle_positions(vertex_arr, indices)
+        assert new_indices.dtype == np.uint32
+
+
+def test_reorder_vertices_by_first_use():
+    vertex_arr = np.zeros(4, dtype=[("Position", np.float32, 3)])
+    vertex_arr["Position"][:, 0] = [0, 1, 2, 3]
+
+    new_vertex_arr, new_indices = reorder_vertices_by_first_use(vertex_arr, np.array([3, 1, 2, 2, 1, 0], dtype=np.uint32))
+
+    assert_equal(new_vertex_arr["Position"][:, 0], [3, 1, 2, 0])
+    assert_equal(new_indices, [0, 1, 2, 2, 1, 3])
@@ -1,6 +1,23 @@
+import io
+import os
+import time
+from copy import copy
 import pytest
-from ..cwxml.element import get_str_type, ElementTree, ValueProperty
-from ..cwxml.ymap import HexColorProperty
+import numpy as np
+from xml.etree import ElementTree as ET
+from .shared import SOLLUMZ_TEST_ASSETS_DIR
+from .test_logger import ReportCollector
+from ..cwxml.element import get_str_type, indent, ElementTree, ValueProperty, AttributeProperty
+from ..cwxml.ymap import HexColorProperty, CMapData, EntityTable, use_entity_tables
+from ..cwxml.drawable import Drawable, DrawableDictionary, DrawableSpan, VertexBuffer, IndexBuffer
+from ..cwxml.bound import VerticesProperty, VertexColorProperty, OctantsProperty
+from ..cwxml.fragment import BoneTransform, Fragment, Transform
+from ..cwxml.clipdictionary import ClipDictionary, ValuesBuffer, FramesBuffer
+from ..cwxml import cache as xml_cache
+from ..cwxml.cache import STALE_ENTRY_AGE, XmlCache, get_source_hash, use_cache
+from ..cwxml.parallel import PreparsedFiles, XmlWriterPool, can_use_worker_processes, parse_xml_files_in_processes, use_writer
+from ..tools.utils import np_arr_to_str_chunks
+from .. import logger
 
 
 @pytest.mark.parametrize("string, expected", (
@@ -15,6 +32,23 @@ def test_xml_bool(string, expected):
     assert get_str_type(string) == expected
 
 
+@pytest.mark.parametrize("default, string, expected", (
+    (0, "12", 12),
+    (0, "1.5", 1.5),
+    (0.0, "3", 3.0),
+    (False, "TRUE", True),
+    ("NULL", "7", "7"),
+    (None, "7", 7),
+    (None, "name", "name"),
+))
+def test_xml_attribute_typed_value(default, string, expected):
+    attr = AttributeProperty("attr", default)
+    attr.value = string
+
+    assert attr.value == expected
+    assert type(attr.value) is type(expected)
+
+
 @pytest.mark.parametrize("bool_value, expected", (
     (True, "true"),
     (False, "false"),
@@ -32,6 +66,135 @@ def test_xml_bool_output(bool_value: bool, expected: str):
     assert xml.find("v").attrib["value"] == expected
 
 
+class SchemaChild(ElementTree):
+    tag_name = "Child"
+
+    def __init__(self):
+        self.version = AttributeProperty("version", 0)
+        self.v = ValueProperty("v")
+
+
+class DoubledChild(SchemaChild):
+    @classmethod
+    def from_xml(cls, element: ET.Element):
+        new = super().from_xml(element)
+        new.v *= 2
+        return new
+
+
+class SchemaData(ElementTree):
+    tag_name = "Data"
+
+    def __init__(self):
+        self.version = AttributeProperty("version", 0)
+        self.child = SchemaChild()
+        self.v = ValueProperty("v")
+
+
+class ExtendedData(SchemaData):
+    def __init__(self):
+        super().__init__()
+        self.child = DoubledChild()
+        self.extra = ValueProperty("Extra")
+
+
+def test_xml_schema_tag_mismatch_skips_attributes():
+    data = SchemaData.from_xml(ET.fromstring('<Other version="3"><v value="1" /></Other>'))
+
+    assert data.version == 0
+    assert data.v == 1
+
+
+def test_xml_schema_ignores_unknown_and_repeated_children():
+    data = SchemaData.from_xml(ET.fromstring('<Data><Unknown value="5" /><v value="1" /><v value="2" /></Data>'))
+
+    assert data.v == 1
+    assert list(data._elements) == ["version", "child", "v"]
+
+
+def test_xml_schema_reads_attributes_of_own_tag_only():
+    xml = '<Data unknown="1"><v value="1" version="3" /><Child version="4"><v value="2" /></Child></Data>'
+    data = SchemaData.from_xml(ET.fromstring(xml))
+
+    assert data.version == 0
+    assert data.child.version == 4
+    assert data.child.v == 2
+    assert "unknown" not in vars(data)
+
+
+def test_xml_schema_subclass_overrides():
+    xml = b'<Data version="1"><Child><v value="2" /></Child><Extra value="7" /></Data>'
+
+    assert SchemaData.get_schema().children["Child"] == ("child", SchemaChild)
+    assert ExtendedData.get_schema().children["Child"] == ("child", DoubledChild)
+    assert "Extra" not in SchemaData.get_schema().children
+
+    for data in (ExtendedData.from_xml(ET.fromstring(xml)), ExtendedData.parse_xml_file(io.BytesIO(xml))):
+        assert type(data.child) is DoubledChild
+        assert data.child.v == 4
+        assert data.extra == 7
+        assert data.version == 1
+
+    data = SchemaData.from_xml(ET.fromstring(xml))
+    assert type(data.child) is SchemaChild
+    assert data.child.v == 2
+    assert "extra" not in data._elements
+
+
+class TypedData(ElementTree):
+    tag_name = "Data"
+    type = "Typed"
+
+    def __init__(self):
+        self.type = AttributeProperty("type", self.type)
+        self.child = SchemaChild()
+        self.v = ValueProperty("v")
+
+
+def test_xml_property_stored_once():
+    data = TypedData()
+    data.v = 3
+    data.get_element("v").value = 7
+
+    assert data.v == 7
+    assert data.to_xml().find("v").get("value") == "7"
+
+    data.v = 5
+    assert data.get_element("v").value == 5
+
+
+def test_xml_property_keeps_class_attribute():
+    data = TypedData()
+    data.type = "Other"
+
+    assert TypedData.type == "Typed"
+    assert TypedData().type == "Typed"
+    assert data.type == "Other"
+    assert data.to_xml().get("type") == "Other"
+
+
+def test_xml_copy_has_own_properties():
+    data = TypedData()
+    data.v = 1
+    data_copy = copy(data)
+    data_copy.v = 2
+
+    assert data.v == 1
+    assert data_copy.v == 2
+    assert data_copy.child is data.child
+
+
+def test_xml_schema_abstract_class():
+    class AbstractData(ElementTree):
+        pass
+
+    schema = AbstractData.get_schema()
+
+    assert schema.child_types is None
+    assert AbstractData.streamed_child_types() is None
+    assert schema.children == {}
+
+
 @pytest.mark.parametrize("argb_hex, expected_rgba", (
     ("0x00FF0000", (1.0, 0.0, 0.0, 0.0)),
     ("0x0000FF00", (0.0, 1.0, 0.0, 0.0)),
@@ -52,3 +215,440 @@ def test_argb_hex_to_rgba(argb_hex, expected_rgba):
 ))
 def test_rgba_to_argb_hex(rgba, expected_argb_hex):
     assert HexColorProperty.rgba_to_argb_hex(rgba) == expected_argb_hex
+
+
+@pytest.mark.parametrize("cls, file_name", (
+    (Drawable, "sollumz_cube.ydr.xml"),
+    (ClipDictionary, "roundtrip_anim.ycd.xml"),
+))
+def test_xml_streamed_read_matches_tree_read(cls, file_name):
+    path = SOLLUMZ_TEST_ASSETS_DIR.joinpath(file_name)
+
+    streamed = cls.from_xml_file(str(path))
+    from_tree = cls.from_xml(ET.parse(path).getroot())
+
+    assert ET.tostring(streamed.to_xml()) == ET.tostring(from_tree.to_xml())
+
+
+@pytest.mark.parametrize("cls, file_name", (
+    (Drawable, "sollumz_cube.ydr.xml"),
+    (ClipDictionary, "roundtrip_anim.ycd.xml"),
+))
+def test_xml_streamed_write_matches_tree_write(cls, file_name, tmp_path):
+    obj = cls.from_xml_file(str(SOLLUMZ_TEST_ASSETS_DIR.joinpath(file_name)))
+
+    element = obj.to_xml()
+    indent(element)
+    ET.ElementTree(element).write(tmp_path / "tree.xml", encoding="UTF-8", xml_declaration=True)
+    obj.write_xml(tmp_path / "streamed.xml")
+
+    assert (tmp_path / "streamed.xml").read_bytes() == (tmp_path / "tree.xml").read_bytes()
+
+
+def test_xml_vertex_buffer_data_decoded_on_access():
+    drawable = Drawable.from_xml_file(str(SOLLUMZ_TEST_ASSETS_DIR.joinpath("sollumz_cube.ydr.xml")))
+    geom = drawable.drawable_models_high[0].geometries[0]
+
+    assert geom.vertex_buffer._data is None
+    assert geom.index_buffer._data is None
+
+    assert len(geom.vertex_buffer.data) > 0
+    assert len(geom.index_buffer.data) > 0
+    assert geom.vertex_buffer._data_str is None
+    assert geom.index_buffer._data_str is None
+
+
+@pytest.mark.parametrize("data_str", (
+    "\n  1.0 2.0 3.0   255 0 0 255\n  4.0 5.0 6.0   1 2 3 4\n",
+    "\n  1.0 2.0 3.0\n  255 0 0 255\n  4.0 5.0 6.0   1 2 3\n  4\n",
+))
+def test_xml_vertex_buffer_load_data(data_str):
+    vertex_buffer = VertexBuffer()
+    vertex_buffer.layout = ["Position", "Colour0"]
+    vertex_buffer._load_data_from_str(data_str)
+
+    assert vertex_buffer.data["Position"].tolist() == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    assert vertex_buffer.data["Colour0"].tolist() == [[255, 0, 0, 255], [1, 2, 3, 4]]
+
+
+@pytest.mark.parametrize("num_rows, chunk_rows", (
+    (0, 4),
+    (3, 4),
+    (4, 4),
+    (9, 4),
+))
+def test_np_arr_to_str_chunks(num_rows, chunk_rows):
+    arr = np.arange(num_rows * 3, dtype=np.float32).reshape((num_rows, 3)) / 3
+    fmt = "%.7f %.7f %.0u"
+
+    expected = "\n".join(fmt % tuple(row) for row in arr)
+
+    assert "\n".join(np_arr_to_str_chunks(arr, fmt, chunk_rows)) == expected
+
+
+@pytest.mark.parametrize("num_inds", (0, 5, 24, 100))
+def test_xml_index_buffer_streamed_write(num_inds, tmp_path):
+    index_buffer = IndexBuffer()
+    index_buffer.data = np.arange(num_inds, dtype=np.uint32)
+
+    element = index_buffer.to_xml()
+    indent(element)
+    ET.ElementTree(element).write(tmp_path / "tree.xml", encoding="UTF-8", xml_declaration=True)
+    index_buffer.write_xml(tmp_path / "streamed.xml")
+
+    assert (tmp_path / "streamed.xml").read_bytes() == (tmp_path / "tree.xml").read_bytes()
+
+
+def test_xml_vertex_buffer_without_data_write(tmp_path):
+    vertex_buffer = VertexBuffer()
+
+    element = vertex_buffer.to_xml()
+    assert element.find("Data") is None
+
+    indent(element)
+    ET.ElementTree(element).write(tmp_path / "tree.xml", encoding="UTF-8", xml_declaration=True)
+    vertex_buffer.write_xml(tmp_path / "streamed.xml")
+
+    assert (tmp_path / "streamed.xml").read_bytes() == (tmp_path / "tree.xml").read_bytes()
+
+
+def test_xml_vertices_property():
+    element = ET.Element("Vertices")
+    element.text = "\n 1.5, -2.0, 0.1\n 3.0, 4.25, -0.0\n"
+
+    vertices = VerticesProperty.from_xml(element)
+
+    assert vertices.value.dtype == np.float32
+    assert vertices.value.shape == (2, 3)
+    assert vertices.to_xml().text == "\n1.5, -2.0, 0.10000000149011612\n3.0, 4.25, -0.0\n"
+    assert VerticesProperty().to_xml() is None
+
+
+def test_xml_vertex_color_property():
+    element = ET.Element("VertexColours")
+    element.text = "\n 255, 0, 12, 255\n 1, 2, 3, 4\n"
+
+    vertex_colors = VertexColorProperty.from_xml(element)
+
+    assert vertex_colors.value.dtype == np.uint8
+    assert vertex_colors.value.tolist() == [[255, 0, 12, 255], [1, 2, 3, 4]]
+    assert vertex_colors.to_xml().text == "\n255, 0, 12, 255\n1, 2, 3, 4\n"
+    assert VertexColorProperty().to_xml() is None
+
+
+def test_xml_octants_property():
+    element = ET.Element("Octants")
+    element.text = "\n 1, 2,3\n\n4,5\n"
+
+    octants = OctantsProperty.from_xml(element)
+    offsets, indices = octants.value
+
+    assert offsets.tolist() == [0, 3, 3, 5]
+    assert indices.tolist() == [1, 2, 3, 4, 5]
+    assert octants.to_xml().text == "1,2,3\n4,5"
+
+
+@pytest.mark.parametrize("num_values", (0, 3, 10, 23))
+def test_xml_channel_buffers(num_values):
+    values = ValuesBuffer()
+    values.value = np.linspace(0.0, 1.0, num_values, dtype=np.float32)
+    frames = FramesBuffer()
+    frames.value = np.arange(num_values, dtype=np.uint32)
+
+    values_text = values.to_xml().text
+    frames_text = frames.to_xml().text
+
+    # Rows of 10 values, each followed by a space except the last
+    expected_frames_text = " \n".join(" ".join(str(i) for i in range(start, min(start + 10, num_values)))
+                                      for start in range(0, num_values, 10))
+    if num_values and num_values % 10 == 0:
+        expected_frames_text += "\n"
+    assert frames_text == expected_frames_text
+
+    values_element = ET.Element("Values")
+    values_element.text = values_text
+    frames_element = ET.Element("Frames")
+    frames_element.text = frames_text
+    assert np.array_equal(ValuesBuffer.from_xml(values_element).value, values.value)
+    assert np.array_equal(FramesBuffer.from_xml(frames_element).value, frames.value)
+
+
+YMAP_ENTITIES_XML = """<?xml version='1.0' encoding='UTF-8'?>
+<CMapData>
+  <name>test</name>
+  <entities>
+    <Item type="CEntityDef">
+      <archetypeName>prop_a</archetypeName>
+      <flags value="1572864" />
+      <guid value="3" />
+      <position x="1.5" y="-2.25" z="0.1" />
+      <rotation x="0.0" y="0.0" z="0.7071068" w="0.7071068" />
+      <scaleXY value="1" />
+      <scaleZ value="1.5" />
+      <parentIndex value="-1" />
+      <lodDist value="100" />
+      <childLodDist value="0" />
+      <lodLevel>LODTYPES_DEPTH_ORPHANHD</lodLevel>
+      <numChildren value="0" />
+      <priorityLevel>PRI_REQUIRED</priorityLevel>
+      <extensions>
+        <Item type="CExtensionDefLightEffect">
+          <name>light</name>
+          <offsetPosition x="0" y="1" z="2" />
+        </Item>
+      </extensions>
+      <ambientOcclusionMultiplier value="255" />
+      <artificialAmbientOcclusion value="255" />
+      <tintValue value="0" />
+    </Item>
+    <Item type="CEntityDef">
+      <archetypeName>prop_b</archetypeName>
+      <position x="3" y="4" z="5" />
+      <rotation x="0" y="0" z="0" w="1" />
+      <lodDist value="25.5" />
+    </Item>
+  </entities>
+</CMapData>
+"""
+
+
+def test_xml_entity_table_matches_entity_list(tmp_path):
+    xml_path = tmp_path / "test.ymap.xml"
+    xml_path.write_text(YMAP_ENTITIES_XML)
+
+    ymap = CMapData.from_xml_file(str(xml_path))
+    with use_entity_tables():
+        ymap_table = CMapData.from_xml_file(str(xml_path))
+
+    table = ymap_table.entities
+    assert isinstance(table, EntityTable)
+    assert len(table) == 2
+    assert table.get_strings("archetype_name") == ["prop_a", "prop_b"]
+    assert table.data["lod_dist"].tolist() == [100.0, 25.5]
+
+    # Rows convert back to the same Entity objects, and write the same XML
+    for entity, table_entity in zip(ymap.entities, table):
+        assert ET.tostring(table_entity.to_xml()) == ET.tostring(entity.to_xml())
+
+    ymap.write_xml(str(tmp_path / "list.xml"))
+    ymap_table.write_xml(str(tmp_path / "table.xml"))
+    assert (tmp_path / "table.xml").read_bytes() == (tmp_path / "list.xml").read_bytes()
+
+    table_from_entities = EntityTable.from_entities(ymap.entities)
+    assert np.array_equal(table_from_entities.data, table.data)
+    assert table_from_entities.get_strings("priority_level") == table.get_strings("priority_level")
+
+    extents_min, extents_max = table.get_extents()
+    assert extents_min.tolist() == [1.5, -2.25, np.float32(0.1)]
+    assert extents_max.tolist() == [3.0, 4.0, 5.0]
+
+
+def test_xml_drawable_dictionary_indexed_read(tmp_path):
+    xml_path = tmp_path / "test.ydd.xml"
+    ydd = DrawableDictionary()
+    for name in ("first", "second", "third"):
+        drawable = Drawable.from_xml_file(str(SOLLUMZ_TEST_ASSETS_DIR.joinpath("sollumz_cube.ydr.xml")))
+        drawable.name = name
+        ydd.append(drawable)
+    ydd.write_xml(str(xml_path))
+
+    indexed = DrawableDictionary.from_xml_file_indexed(str(xml_path))
+    assert indexed.names == ["first", "second", "third"]
+    assert all(isinstance(drawable, DrawableSpan) for drawable in indexed._value)
+
+    # Only the accessed drawable is read
+    assert indexed[1].name == "second"
+    assert [isinstance(drawable, DrawableSpan) for drawable in indexed._value] == [True, False, True]
+
+    eager = DrawableDictionary.from_xml_file(str(xml_path))
+    assert ET.tostring(indexed.to_xml()) == ET.tostring(eager.to_xml())
+
+
+def test_xml_drawable_dictionary_indexed_has_skeleton(tmp_path):
+    xml_path = tmp_path / "test.ydd.xml"
+    ydd = DrawableDictionary()
+    for name, asset in (("no_skeleton", "sollumz_cube.ydr.xml"), ("skeleton", "sollumz_cube.yft.xml")):
+        asset_path = str(SOLLUMZ_TEST_ASSETS_DIR.joinpath(asset))
+        drawable = Drawable.from_xml_file(asset_path) if asset.endswith(".ydr.xml") else Fragment.from_xml_file(
+            asset_path).drawable
+        drawable.name = name
+        ydd.append(drawable)
+    ydd.write_xml(str(xml_path))
+
+    indexed = DrawableDictionary.from_xml_file_indexed(str(xml_path))
+    assert [indexed.has_skeleton(i) for i in range(len(indexed))] == [False, True]
+    assert all(isinstance(drawable, DrawableSpan) for drawable in indexed._value)
+
+    eager = DrawableDictionary.from_xml_file(str(xml_path))
+    assert [eager.has_skeleton(i) for i in range(len(eager))] == [False, True]
+
+
+def test_xml_parse_paths():
+    path = str(SOLLUMZ_TEST_ASSETS_DIR.joinpath("sollumz_cube.yft.xml"))
+
+    fragment = Fragment.from_xml_file(path)
+    skeleton_only = Fragment.parse_xml_file_paths(path, ("Drawable/Skeleton",))
+
+    assert ET.tostring(skeleton_only.drawable.skeleton.to_xml()) == ET.tostring(fragment.drawable.skeleton.to_xml())
+    assert fragment.drawable.drawable_models_high
+    assert not skeleton_only.drawable.drawable_models_high
+    assert not skeleton_only.drawable.name
+
+
+def test_xml_fragment_transforms_roundtrip(tmp_path):
+    path = SOLLUMZ_TEST_ASSETS_DIR.joinpath("sollumz_cube.yft.xml")
+    fragment = Fragment.from_xml_file(str(path))
+
+    assert all(isinstance(t, BoneTransform) for t in fragment.bones_transforms)
+    assert all(isinstance(t, Transform) for t in fragment.physics.lod1.transforms)
+
+    out_path = tmp_path / "sollumz_cube.yft.xml"
+    fragment.write_xml_file(str(out_path))
+    written = Fragment.from_xml_file(str(out_path))
+
+    expected = ET.parse(path).getroot()
+    actual = ET.parse(out_path).getroot()
+    for tag in ("BoneTransforms", "Physics/LOD1/Transforms"):
+        expected_rows = [item.text.split() for item in expected.find(tag)]
+        actual_rows = [item.text.split() for item in actual.find(tag)]
+        assert np.allclose(np.array(actual_rows, dtype=float), np.array(expected_rows, dtype=float))
+
+    assert len(written.bones_transforms) == len(fragment.bones_transforms)
+
+
+def test_xml_cache(tmp_path):
+    xml_path = tmp_path / "sollumz_cube.ydr.xml"
+    xml_path.write_bytes(SOLLUMZ_TEST_ASSETS_DIR.joinpath("sollumz_cube.ydr.xml").read_bytes())
+    expected = ET.tostring(Drawable.parse_xml_file(str(xml_path)).to_xml())
+
+    cache = XmlCache(str(tmp_path / "cache"), 1 << 30)
+    entry_dir = cache.get_entry_dir(Drawable, str(xml_path))
+
+    with use_cache(cache):
+        parsed = Drawable.from_xml_file(str(xml_path))
+        cached = Drawable.from_xml_file(str(xml_path))
+
+    assert os.path.isdir(entry_dir)
+    assert ET.tostring(parsed.to_xml()) == expected
+    assert ET.tostring(cached.to_xml()) == expected
+
+    # Evicted once over the size limit
+    cache.max_size = 0
+    cache.evict()
+    assert not os.path.exists(entry_dir)
+
+
+def test_xml_cache_evict_keeps_entries_being_written(tmp_path):
+    cache = XmlCache(str(tmp_path), 1 << 30)
+    writing_dir = tmp_path / "entry.1234.tmp"
+    incomplete_dir = tmp_path / "entry"
+    stale_dir = tmp_path / "stale.5678.tmp"
+    for entry_dir in (writing_dir, incomplete_dir, stale_dir):
+        entry_dir.mkdir()
+
+    stale_time = time.time() - STALE_ENTRY_AGE - 60
+    os.utime(stale_dir, (stale_time, stale_time))
+
+    cache.evict()
+
+    assert writing_dir.exists()
+    assert incomplete_dir.exists()
+    assert not stale_dir.exists()
+
+
+def test_xml_cache_key_depends_on_cwxml_code(tmp_path, monkeypatch):
+    xml_path = str(SOLLUMZ_TEST_ASSETS_DIR.joinpath("sollumz_cube.ydr.xml"))
+    cache = XmlCache(str(tmp_path), 1 << 30)
+    entry_dir = cache.get_entry_dir(Drawable, xml_path)
+
+    monkeypatch.setattr(xml_cache, "get_cache_version", lambda: "changed")
+
+    assert cache.get_entry_dir(Drawable, xml_path) != entry_dir
+
+
+def test_xml_cache_source_hash(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "notes.txt").write_text("a")
+    source_hash = get_source_hash(str(tmp_path))
+
+    (tmp_path / "notes.txt").write_text("b")
+    assert get_source_hash(str(tmp_path)) == source_hash
+
+    (tmp_path / "a.py").write_text("x = 2\n")
+    assert get_source_hash(str(tmp_path)) != source_hash
+
+
+def test_xml_cache_write_failure_logged(tmp_path, monkeypatch):
+    xml_path = str(SOLLUMZ_TEST_ASSETS_DIR.joinpath("sollumz_cube.ydr.xml"))
+    cache = XmlCache(str(tmp_path), 1 << 30)
+
+    def fail_write(*args):
+        raise OSError("Disk full")
+
+    monkeypatch.setattr(XmlCache, "_write_entry", fail_write)
+    collector = ReportCollector()
+
+    with logger.buffered_logging(collector):
+        drawable = cache.load(Drawable, xml_path)
+
+    assert drawable.drawable_models_high
+    assert collector.reports == [("WARNING", f"Failed to cache '{xml_path}': Disk full")]
+
+
+@pytest.mark.skipif(not can_use_worker_processes(), reason="Worker processes are not supported on this platform")
+def test_xml_parse_in_processes_skips_cache(tmp_path):
+    xml_path = str(SOLLUMZ_TEST_ASSETS_DIR.joinpath("sollumz_cube.ydr.xml"))
+    expected = ET.tostring(Drawable.parse_xml_file(xml_path).to_xml())
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+
+    with use_cache(XmlCache(str(cache_dir), 1 << 30)):
+        results = list(parse_xml_files_in_processes(Drawable.from_xml_file, [xml_path, xml_path]))
+
+    assert [error for _, _, error in results] == [None, None]
+    assert all(ET.tostring(obj.to_xml()) == expected for _, obj, _ in results)
+    # Only the main process writes to the cache
+    assert list(cache_dir.iterdir()) == []
+
+
+def read_drawable_and_count_models(filepath: str):
+    drawable = Drawable.from_xml_file(filepath)
+    return drawable, [(drawable, len(drawable.drawable_models_high))]
+
+
+@pytest.mark.skipif(not can_use_worker_processes(), reason="Worker processes are not supported on this platform")
+def test_xml_preparsed_files_prepared_data(tmp_path):
+    xml_path = str(SOLLUMZ_TEST_ASSETS_DIR.joinpath("sollumz_cube.ydr.xml"))
+    preparsed = PreparsedFiles()
+
+    for filepath, (obj, prepared), error in parse_xml_files_in_processes(read_drawable_and_count_models,
+                                                                          [xml_path, xml_path]):
+        assert error is None
+        preparsed.add(filepath, obj, prepared)
+
+    with use_cache(preparsed):
+        drawable = Drawable.from_xml_file(xml_path)
+
+    assert preparsed.pop_prepared(Drawable()) is None
+    assert preparsed.pop_prepared(drawable) == len(drawable.drawable_models_high)
+    assert preparsed.pop_prepared(drawable) is None
+
+
+@pytest.mark.skipif(not can_use_worker_processes(), reason="Worker processes are not supported on this platform")
+def test_xml_writer_pool(tmp_path):
+    drawable = Drawable.from_xml_file(str(SOLLUMZ_TEST_ASSETS_DIR.joinpath("sollumz_cube.ydr.xml")))
+    drawable.write_xml(str(tmp_path / "direct.ydr.xml"))
+
+    pool = XmlWriterPool(max_workers=2, max_pending=1)
+    try:
+        with use_writer(pool):
+            drawable.write_xml(str(tmp_path / "pool.ydr.xml"))
+            drawable.write_xml(str(tmp_path / "missing" / "pool.ydr.xml"))
+
+        written = dict(pool.pop_finished(wait_all=True))
+    finally:
+        pool.shutdown()
+
+    assert written[str(tmp_path / "pool.ydr.xml")] is None
+    assert isinstance(written[str(tmp_path / "missing" / "pool.ydr.xml")], FileNotFoundError)
+    assert (tmp_path / "pool.ydr.xml").read_bytes() == (tmp_path / "direct.ydr.xml").read_bytes()
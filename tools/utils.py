@@ -2,7 +2,7 @@ import os
 import numpy
 from numpy.typing import NDArray
 from math import sqrt
-from typing import Iterable, Tuple
+from typing import Iterable, Iterator, Tuple
 from mathutils import Vector, Quaternion, Matrix
 
 
@@ -189,17 +189,29 @@ def get_filename(filepath: str):
 
 def np_arr_to_str(arr: NDArray, fmt: str):
     """Convert numpy array to formatted string (faster than np.savetxt)"""
-    n_fmt_chars = fmt.count('%')
+    return '\n'.join(np_arr_to_str_chunks(arr, fmt))
 
-    if arr.ndim == 1 and n_fmt_chars == 1:
-        fmt = ' '.join([fmt] * arr.size)
-    else:
-        if n_fmt_chars == 1:
-            fmt = ' '.join([fmt] * arr.shape[1])
 
-        fmt = '\n'.join([fmt] * arr.shape[0])
+def np_arr_to_str_chunks(arr: NDArray, fmt: str, chunk_rows: int = 4096) -> Iterator[str]:
+    """Convert numpy array to formatted strings of at most ``chunk_rows`` rows each. Joining the chunks with newlines
+    gives the ``np_arr_to_str`` string. A 1D array is formatted as a single row."""
+    if arr.ndim == 1:
+        arr = arr.reshape((1, -1))
+
+    if fmt.count('%') == 1:
+        fmt = ' '.join([fmt] * arr.shape[1])
+
+    num_rows = len(arr)
+    chunk_fmt = '\n'.join([fmt] * min(chunk_rows, num_rows))
+
+    for start in range(0, num_rows, chunk_rows):
+        chunk = arr[start:start + chunk_rows]
+
+        if len(chunk) < chunk_rows and start > 0:
+            chunk_fmt = '\n'.join([fmt] * len(chunk))
 
-    return fmt % tuple(arr.ravel())
+        # tolist gives python scalars, which format much faster than numpy scalars
+        yield chunk_fmt % tuple(chunk.ravel().tolist())
 
 
 def get_matrix_without_scale(matrix: Matrix) -> Matrix:
@@ -30,7 +30,7 @@ from ..tools.meshhelper import (get_bound_center_from_bounds, calculate_volume,
                                 get_combined_bound_box)
 from ..sollumz_properties import MaterialType, SOLLUMZ_UI_NAMES, SollumType, BOUND_POLYGON_TYPES
 from ..sollumz_preferences import get_export_settings
-from .. import logger
+from .. import logger, profiling
 from .properties import CollisionMatFlags, get_collision_mat_raw_flags, BoundFlags
 
 T_Bound = TypeVar("T_Bound", bound=Bound)
@@ -40,6 +40,7 @@ T_PolyCylCap = TypeVar("T_PolyCylCap", bound=PolyCylinder | PolyCapsule)
 MAX_VERTICES = 32767
 
 
+@profiling.span("export_ybn")
 def export_ybn(obj: bpy.types.Object, filepath: str) -> bool:
     export_settings = get_export_settings()
 
@@ -53,6 +54,7 @@ def export_ybn(obj: bpy.types.Object, filepath: str) -> bool:
     return True
 
 
+@profiling.span("create_composite_xml")
 def create_composite_xml(
     obj: bpy.types.Object,
     auto_calc_inertia: bool = False,
@@ -214,35 +216,35 @@ def create_bound_geom_xml_data(geom_xml: BoundGeometry | BoundGeometryBVH, obj:
 
 def center_verts_to_geometry(geom_xml: BoundGeometry | BoundGeometryBVH):
     """Position verts such that the origin is at their center of geometry. Returns the center of geometry."""
-    verts = np.array([tuple(v) for v in geom_xml.vertices], dtype=np.float32)
+    verts = geom_xml.vertices
 
-    geom_center = Vector(np.average(verts, axis=0))
-    geom_xml.vertices = [
-        Vector(vert) - geom_center for vert in geom_xml.vertices]
+    geom_center = np.average(verts, axis=0)
+    geom_xml.vertices = verts - geom_center
 
     if isinstance(geom_xml, BoundGeometry):
-        geom_xml.vertices_2 = [
-            Vector(vert) - geom_center for vert in geom_xml.vertices_2]
+        geom_xml.vertices_2 = geom_xml.vertices_2 - geom_center
 
     return Vector(geom_center)
 
 
+@profiling.span("create_bound_xml_polys")
 def create_bound_xml_polys(geom_xml: BoundGeometry | BoundGeometryBVH, obj: bpy.types.Object):
     # Create mappings of vertices and materials by index to build the new geom_xml vertices
     ind_by_vert: dict[tuple, int] = {}
     ind_by_mat: dict[bpy.types.Material, int] = {}
+    vertices: list[tuple[float, float, float]] = []
+    vertex_colors: list[tuple[int, int, int, int]] = []
 
     def get_vert_index(vert: Vector, vert_color: Optional[tuple[int, int, int, int]] = None):
         default_vert_color = (255, 255, 255, 255)
 
         # These are safety checks in case the user mixed poly primitives and poly meshes with color attributes
         # This doesn't occur in original .ybns, if they have vertex colors, only poly triangles (meshes) are used.
-        if vert_color is not None and len(geom_xml.vertex_colors) != len(geom_xml.vertices):
+        if vert_color is not None and len(vertex_colors) != len(vertices):
             # This vertex has color but previous ones didn't, assign a default color to all previous vertices
-            for _ in range(len(geom_xml.vertex_colors), len(geom_xml.vertices)):
-                geom_xml.vertex_colors.append(default_vert_color)
+            vertex_colors.extend([default_vert_color] * (len(vertices) - len(vertex_colors)))
 
-        if vert_color is None and len(geom_xml.vertex_colors) != 0:
+        if vert_color is None and len(vertex_colors) != 0:
             # There are already vertex colors in this geometry, assign a default color
             vert_color = default_vert_color
 
@@ -255,9 +257,9 @@ def create_bound_xml_polys(geom_xml: BoundGeometry | BoundGeometryBVH, obj: bpy.
 
         vert_ind = len(ind_by_vert)
         ind_by_vert[vertex_id] = vert_ind
-        geom_xml.vertices.append(Vector(vert))
+        vertices.append(vertex_id[:3])
         if vert_color is not None:
-            geom_xml.vertex_colors.append(vert_color)
+            vertex_colors.append(vert_color)
 
         return vert_ind
 
@@ -276,13 +278,18 @@ def create_bound_xml_polys(geom_xml: BoundGeometry | BoundGeometryBVH, obj: bpy.
     # If the bound object is a mesh, just convert its mesh data into triangles
     if isinstance(geom_xml, BoundGeometry):
         create_bound_geom_xml_triangles(obj, geom_xml, get_vert_index, get_mat_index)
-        return
+    else:
+        # For empty bound objects with children, create the bound polygons from its children
+        for child in obj.children_recursive:
+            if child.sollum_type not in BOUND_POLYGON_TYPES:
+                continue
+            create_bound_xml_poly_shape(child, geom_xml, get_vert_index, get_mat_index)
 
-    # For empty bound objects with children, create the bound polygons from its children
-    for child in obj.children_recursive:
-        if child.sollum_type not in BOUND_POLYGON_TYPES:
-            continue
-        create_bound_xml_poly_shape(child, geom_xml, get_vert_index, get_mat_index)
+    geom_xml.vertices = np.array(vertices, dtype=np.float32).reshape((-1, 3))
+    geom_xml.vertex_colors = np.array(vertex_colors, dtype=np.uint8).reshape((-1, 4))
+
+    profiling.count("vertices", len(vertices))
+    profiling.count("polygons", len(geom_xml.polygons))
 
 
 def create_bound_geom_xml_triangles(obj: bpy.types.Object, geom_xml: BoundGeometry, get_vert_index: Callable[[Vector], int], get_mat_index: Callable[[bpy.types.Material], int]):
@@ -27,13 +27,16 @@ from ..tools.meshhelper import create_box, create_color_attr, create_disc
 from ..tools.utils import get_direction_of_vectors, get_distance_of_vectors, abs_vector
 from ..tools.blenderhelper import create_blender_object, create_empty_object
 from mathutils import Matrix, Vector
+from .. import profiling
 
 
+@profiling.span("import_ybn")
 def import_ybn(filepath):
     ybn_xml: BoundFile = YBN.from_xml_file(filepath)
     return create_bound_composite(ybn_xml.composite, os.path.basename(filepath.replace(YBN.file_extension, "")))
 
 
+@profiling.span("create_bound_composite")
 def create_bound_composite(composite_xml: BoundComposite, name: Optional[str] = None):
     obj = create_empty_object(SollumType.BOUND_COMPOSITE, name)
     set_bound_properties(composite_xml, obj)
@@ -149,6 +152,7 @@ def create_bound_disc(bound_xml: BoundChild):
     return obj
 
 
+@profiling.span("create_bound_geometry")
 def create_bound_geometry(geom_xml: BoundGeometry):
     materials = create_geometry_materials(geom_xml)
     triangles = get_poly_triangles(geom_xml.polygons)
@@ -164,6 +168,7 @@ def create_bound_geometry(geom_xml: BoundGeometry):
     return geom_obj
 
 
+@profiling.span("create_bvh_obj")
 def create_bvh_obj(bvh_xml: BoundGeometryBVH):
     bvh_obj = create_empty_object(SollumType.BOUND_GEOMETRYBVH)
     set_bound_child_properties(bvh_xml, bvh_obj)
@@ -243,10 +248,10 @@ def init_poly_obj(poly, sollum_type, materials):
 def create_poly_box(poly, materials, vertices):
     obj = init_poly_obj(poly, SollumType.BOUND_POLY_BOX, materials)
 
-    v1 = vertices[poly.v1]
-    v2 = vertices[poly.v2]
-    v3 = vertices[poly.v3]
-    v4 = vertices[poly.v4]
+    v1 = Vector(vertices[poly.v1])
+    v2 = Vector(vertices[poly.v2])
+    v3 = Vector(vertices[poly.v3])
+    v4 = Vector(vertices[poly.v4])
     center = (v1 + v2 + v3 + v4) * 0.25
 
     # Get edges from the 4 opposing corners of the box
@@ -315,13 +320,13 @@ def create_poly_box(poly, materials, vertices):
 def create_poly_sphere(poly, materials, vertices):
     sphere = init_poly_obj(poly, SollumType.BOUND_POLY_SPHERE, materials)
     sphere.bound_radius = poly.radius
-    sphere.location = vertices[poly.v]
+    sphere.location = Vector(vertices[poly.v])
     return sphere
 
 def create_poly_capsule(poly, materials, vertices):
     capsule = init_poly_obj(poly, SollumType.BOUND_POLY_CAPSULE, materials)
-    v1 = vertices[poly.v1]
-    v2 = vertices[poly.v2]
+    v1 = Vector(vertices[poly.v1])
+    v2 = Vector(vertices[poly.v2])
     rot = get_direction_of_vectors(v1, v2)
     capsule.bound_radius = poly.radius * 2
     capsule.bound_length = ((v1 - v2).length + (poly.radius * 2)) / 2
@@ -333,8 +338,8 @@ def create_poly_capsule(poly, materials, vertices):
 
 def create_poly_cylinder(poly, materials, vertices):
     cylinder = init_poly_obj(poly, SollumType.BOUND_POLY_CYLINDER, materials)
-    v1 = vertices[poly.v1]
-    v2 = vertices[poly.v2]
+    v1 = Vector(vertices[poly.v1])
+    v2 = Vector(vertices[poly.v2])
 
     rot = get_direction_of_vectors(v1, v2)
 
@@ -363,9 +368,9 @@ def get_poly_triangles(polys: list[Polygon]):
 
 
 def create_bound_mesh_data(
-    vertices: list[Vector],
+    vertices: NDArray[np.float32],
     triangles: list[PolyTriangle],
-    vertex_colors: Optional[list[tuple[int, int, int, int]]],
+    vertex_colors: Optional[NDArray[np.uint8]],
     materials: list[bpy.types.Material]
 ) -> bpy.types.Mesh:
     mesh = bpy.data.meshes.new(SOLLUMZ_UI_NAMES[SollumType.BOUND_GEOMETRY])
@@ -393,32 +398,28 @@ def apply_bound_geom_materials(mesh: bpy.types.Mesh, triangles: list[PolyTriangl
 
 
 def get_bound_geom_mesh_data(
-    vertices: list[Vector],
+    vertices: NDArray[np.float32],
     triangles: list[PolyTriangle],
-    vertex_colors: Optional[list[tuple[int, int, int, int]]]
-) -> tuple[list, list, Optional[NDArray]]:
-    def _color_to_float(color_int: tuple[int, int, int, int]):
-        return (color_int[0] / 255, color_int[1] / 255, color_int[2] / 255, color_int[3] / 255)
-
-    verts = []
-    verts_dict = {}
-    faces = []
-    colors = [] if vertex_colors else None
-
-    for poly in triangles:
-        face = []
-        for v in [vertices[poly.v1], vertices[poly.v2], vertices[poly.v3]]:
-            v_tuple = tuple(v)
-            if v_tuple not in verts_dict:
-                verts_dict[v_tuple] = len(verts)
-                verts.append(v)
-            face.append(verts_dict[v_tuple])
-        faces.append(face)
-
-        if colors is not None:
-            colors.extend(_color_to_float(vertex_colors[v]) for v in [poly.v1, poly.v2, poly.v3])
-
-    return verts, faces, np.array(colors, dtype=np.float64) if colors is not None else None
+    vertex_colors: Optional[NDArray[np.uint8]]
+) -> tuple[NDArray, NDArray, Optional[NDArray]]:
+    corner_inds = np.array([(poly.v1, poly.v2, poly.v3) for poly in triangles], dtype=np.int64).reshape(-1)
+    corner_positions = vertices[corner_inds]
+
+    # Merge corners at the same position into one vertex, numbered in the order they are first used
+    unique_positions, first_corners, corner_verts = np.unique(
+        corner_positions, axis=0, return_index=True, return_inverse=True)
+    order = np.argsort(first_corners)
+    vert_by_unique = np.empty_like(order)
+    vert_by_unique[order] = np.arange(len(order))
+
+    verts = unique_positions[order]
+    faces = vert_by_unique[corner_verts.reshape(-1)].reshape((-1, 3))
+    colors = None
+
+    if vertex_colors is not None and len(vertex_colors) > 0:
+        colors = np.asarray(vertex_colors, dtype=np.float64)[corner_inds] / 255
+
+    return verts, faces, colors
 
 
 def set_bound_geometry_properties(geom_xml: BoundGeometry, geom_obj: bpy.types.Object):
@@ -2,6 +2,7 @@ import bpy
 from mathutils import Vector, Quaternion
 import math
 import struct
+import numpy as np
 from ..cwxml import clipdictionary as ycdxml
 from ..sollumz_properties import SollumType
 from ..tools import jenkhash
@@ -21,7 +22,7 @@ from ..tools.animationhelper import (
 )
 from .properties import ClipAttribute, ClipTag, calculate_final_uv_transform_matrix
 
-from .. import logger
+from .. import logger, profiling
 
 
 def parse_uv_transform_data_path(data_path: str) -> tuple[int, str]:
@@ -237,18 +238,18 @@ def build_values_channel(
 
         min_value, quantum = get_quantum_and_min_val(uniq_values)
 
-        channel.values = uniq_values
+        channel.values = np.array(uniq_values, dtype=np.float32)
         channel.offset = min_value
         channel.quantum = quantum
 
-        for value in values:
-            channel.frames.append(uniq_values.index(value))
+        index_by_value = {value: i for i, value in enumerate(uniq_values)}
+        channel.frames = np.array([index_by_value[value] for value in values], dtype=np.uint32)
     else:
         channel = ycdxml.ChannelsList.QuantizeFloat()
 
         min_value, quantum = get_quantum_and_min_val(values)
 
-        channel.values = values
+        channel.values = np.array(values, dtype=np.float32)
         channel.offset = min_value
         channel.quantum = quantum
 
@@ -338,6 +339,7 @@ def sequence_data_from_frames_data(
     return sequence_data
 
 
+@profiling.span("animation_from_object")
 def animation_from_object(animation_obj: bpy.types.Object) -> ycdxml.Animation:
     animation = ycdxml.Animation()
 
@@ -465,6 +467,7 @@ def clip_tag_calc_signature(tag: ClipTag) -> int:
     return signature
 
 
+@profiling.span("clip_from_object")
 def clip_from_object(clip_obj: bpy.types.Object) -> ycdxml.Clip:
     clip_properties = clip_obj.clip_properties
 
@@ -554,6 +557,7 @@ def clip_dictionary_from_object(obj: bpy.types.Object) -> ycdxml.ClipDictionary:
     return clip_dictionary
 
 
+@profiling.span("export_ycd")
 def export_ycd(obj: bpy.types.Object, filepath: str) -> bool:
     clip_dictionary_from_object(obj).write_xml(filepath)
     return True
@@ -4,8 +4,10 @@ from ..ydr.ydrexport import create_drawable_xml, write_embedded_textures
 from ..tools import jenkhash
 from ..sollumz_properties import SollumType
 from ..sollumz_preferences import get_export_settings
+from .. import profiling
 
 
+@profiling.span("export_ydd")
 def export_ydd(ydd_obj: bpy.types.Object, filepath: str) -> bool:
     export_settings = get_export_settings()
 
@@ -17,6 +19,7 @@ def export_ydd(ydd_obj: bpy.types.Object, filepath: str) -> bool:
     return True
 
 
+@profiling.span("create_ydd_xml")
 def create_ydd_xml(ydd_obj: bpy.types.Object, exclude_skeleton: bool = False):
     ydd_xml = DrawableDictionary()
 
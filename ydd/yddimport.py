@@ -1,7 +1,7 @@
 import bpy
 import os
-from typing import Optional
-from ..cwxml.drawable import YDD, DrawableDictionary, Skeleton
+from typing import Iterator, Optional
+from ..cwxml.drawable import YDD, Drawable, DrawableDictionary, Skeleton
 from ..cwxml.fragment import YFT, Fragment
 from ..ydr.ydrimport import create_drawable_obj, create_drawable_skel, apply_rotation_limits
 from ..sollumz_properties import SollumType
@@ -9,25 +9,53 @@ from ..sollumz_preferences import get_import_settings
 from ..tools.blenderhelper import create_empty_object, create_blender_object
 from ..tools.utils import get_filename
 
-from .. import logger
+from .. import logger, profiling
 
 
-def import_ydd(filepath: str):
+@profiling.span("import_ydd")
+def import_ydd(filepath: str, drawable_names: Optional[set[str]] = None):
+    """Import the drawable dictionary at ``filepath``. If ``drawable_names`` is given and not empty, only the
+    drawables with those names are read and imported."""
     import_settings = get_import_settings()
 
-    ydd_xml = YDD.from_xml_file(filepath)
+    if not drawable_names:
+        drawable_names = None
+
+    if drawable_names is None:
+        ydd_xml = YDD.from_xml_file(filepath)
+    else:
+        ydd_xml = YDD.from_xml_file_indexed(filepath)
+
+        for name in sorted(drawable_names.difference(ydd_xml.names)):
+            logger.warning(f"Drawable '{name}' not found in '{filepath}'.")
 
     if import_settings.import_ext_skeleton:
         skel_yft = load_external_skeleton(filepath)
 
         if skel_yft is not None and skel_yft.drawable.skeleton is not None:
-            return create_ydd_obj_ext_skel(ydd_xml, filepath, skel_yft)
+            return create_ydd_obj_ext_skel(ydd_xml, filepath, skel_yft, drawable_names)
+
+    return create_ydd_obj(ydd_xml, filepath, drawable_names)
 
-    return create_ydd_obj(ydd_xml, filepath)
 
+def iter_picked_drawables(ydd_xml: DrawableDictionary, drawable_names: Optional[set[str]]) -> Iterator[Drawable]:
+    """Iterate the drawables in ``ydd_xml`` named in ``drawable_names``, or all of them if it is None"""
+    if drawable_names is None:
+        yield from ydd_xml
+        return
+
+    for i, name in enumerate(ydd_xml.names):
+        if name in drawable_names:
+            yield ydd_xml[i]
 
+
+# Parts of the external skeleton yft used by the import, the rest of the file is skipped
+EXTERNAL_SKELETON_PATHS = ("Drawable/Skeleton", "Drawable/Joints")
+
+
+@profiling.span("load_external_skeleton")
 def load_external_skeleton(ydd_filepath: str) -> Optional[Fragment]:
-    """Read first yft at ydd_filepath into a Fragment"""
+    """Read the skeleton of the first yft at ydd_filepath into a Fragment"""
     directory = os.path.dirname(ydd_filepath)
 
     yft_filepath = get_first_yft_path(directory)
@@ -39,21 +67,39 @@ def load_external_skeleton(ydd_filepath: str) -> Optional[Fragment]:
 
     logger.info(f"Using '{yft_filepath}' as external skeleton...")
 
-    return YFT.from_xml_file(yft_filepath)
+    return YFT.from_xml_file_paths(yft_filepath, EXTERNAL_SKELETON_PATHS)
+
 
+# Maps directories to their modification time and the first yft in them
+_first_yft_paths: dict[str, tuple[int, Optional[str]]] = {}
 
-def get_first_yft_path(directory: str):
+
+def get_first_yft_path(directory: str) -> Optional[str]:
+    # Adding or removing files changes the modification time of the directory
+    mtime_ns = os.stat(directory).st_mtime_ns
+    cached = _first_yft_paths.get(directory)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    yft_filepath = None
     for filepath in os.listdir(directory):
         if filepath.endswith(".yft.xml"):
-            return os.path.join(directory, filepath)
+            yft_filepath = os.path.join(directory, filepath)
+            break
+
+    _first_yft_paths[directory] = (mtime_ns, yft_filepath)
+
+    return yft_filepath
 
 
-def create_ydd_obj_ext_skel(ydd_xml: DrawableDictionary, filepath: str, external_skel: Fragment):
+@profiling.span("create_ydd_obj_ext_skel")
+def create_ydd_obj_ext_skel(ydd_xml: DrawableDictionary, filepath: str, external_skel: Fragment,
+                            drawable_names: Optional[set[str]] = None):
     """Create ydd object with an external skeleton."""
     name = get_filename(filepath)
     dict_obj = create_armature_parent(name, external_skel)
 
-    for drawable_xml in ydd_xml:
+    for drawable_xml in iter_picked_drawables(ydd_xml, drawable_names):
         external_bones = None
         external_armature = None
 
@@ -70,18 +116,27 @@ def create_ydd_obj_ext_skel(ydd_xml: DrawableDictionary, filepath: str, external
     return dict_obj
 
 
-def create_ydd_obj(ydd_xml: DrawableDictionary, filepath: str):
+@profiling.span("create_ydd_obj")
+def create_ydd_obj(ydd_xml: DrawableDictionary, filepath: str, drawable_names: Optional[set[str]] = None):
 
     name = get_filename(filepath)
     dict_obj = create_empty_object(SollumType.DRAWABLE_DICTIONARY, name)
 
-    ydd_skel = find_first_skel(ydd_xml)
+    # Drawables without bones use the first skeleton in the dictionary, which can be in a drawable that was not
+    # picked. Only looked up when needed so the other drawables are not read.
+    ydd_skel = None
+    ydd_skel_found = False
+
+    for drawable_xml in iter_picked_drawables(ydd_xml, drawable_names):
+        external_bones = None
+
+        if not drawable_xml.skeleton.bones:
+            if not ydd_skel_found:
+                ydd_skel = find_first_skel(ydd_xml)
+                ydd_skel_found = True
 
-    for drawable_xml in ydd_xml:
-        if not drawable_xml.skeleton.bones and ydd_skel is not None:
-            external_bones = ydd_skel.bones
-        else:
-            external_bones = None
+            if ydd_skel is not None:
+                external_bones = ydd_skel.bones
 
         drawable_obj = create_drawable_obj(
             drawable_xml, filepath, external_bones=external_bones)
@@ -105,7 +160,7 @@ def create_armature_parent(name: str, skel_yft: Fragment):
 
 
 def find_first_skel(ydd_xml: DrawableDictionary) -> Optional[Skeleton]:
-    """Find first skeleton in ``ydd_xml``"""
-    for drawable_xml in ydd_xml:
-        if drawable_xml.skeleton.bones:
-            return drawable_xml.skeleton
+    """Find first skeleton in ``ydd_xml``. Only the drawable with the skeleton is read from indexed dictionaries."""
+    for i in range(len(ydd_xml)):
+        if ydd_xml.has_skeleton(i):
+            return ydd_xml[i].skeleton
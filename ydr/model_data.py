@@ -44,9 +44,16 @@ def get_model_data(drawable_xml: Drawable) -> list[ModelData]:
 
 
 def get_model_data_split_by_group(drawable_xml: Drawable) -> list[ModelData]:
-    model_datas = get_model_data(drawable_xml)
+    return split_models_by_group(get_model_data(drawable_xml), drawable_xml.skeleton.bones)
 
-    return [split_data for model_data in model_datas for split_data in split_model_by_group(model_data, drawable_xml.skeleton.bones)]
+
+def split_models_by_group(model_datas: list[ModelData], bones: list[Bone]) -> list[ModelData]:
+    return [split_data for model_data in model_datas for split_data in split_model_by_group(model_data, bones)]
+
+
+def is_model_data_of(model_datas: list[ModelData], drawable_xml: Drawable) -> bool:
+    """Whether ``model_datas`` still matches the DrawableModels of ``drawable_xml``"""
+    return {model_data.bone_index: model_data.xml_lods for model_data in model_datas} == get_lod_model_xmls(drawable_xml)
 
 
 def split_model_by_group(model_data: ModelData, bones: list[Bone]) -> list[ModelData]:
@@ -35,11 +35,11 @@ class ShaderMaterial(NamedTuple):
 
 shadermats = []
 
-for shader in ShaderManager._shaders.values():
-    name = shader.filename.replace(".sps", "").upper()
+for filename in ShaderManager.get_shader_filenames():
+    name = filename.replace(".sps", "").upper()
 
     shadermats.append(ShaderMaterial(
-        name, name.replace("_", " "), shader.filename))
+        name, name.replace("_", " "), filename))
 
 
 def try_get_node(node_tree: bpy.types.NodeTree, name: str) -> Optional[bpy.types.Node]:
@@ -43,12 +43,112 @@ def remove_unused_uvs(vertex_arr: NDArray, used_texcoords: set[str]) -> NDArray:
     return vertex_arr[new_names]
 
 
-def dedupe_and_get_indices(vertex_arr: NDArray) -> Tuple[NDArray, NDArray[np.uint32]]:
-    """Remove duplicate vertices from the buffer and get the new vertex indices in triangle order (used for IndexBuffer). Returns vertices, indices."""
-    vertex_arr, unique_indices, inverse_indices = np.unique(
-        vertex_arr, axis=0, return_index=True, return_inverse=True)
+def get_vertex_weld_keys(vertex_arr: NDArray, tolerance: float = 0.0) -> NDArray[np.uint32]:
+    """Get the bytes of each vertex as rows of 32-bit words, equal for the vertices that should be welded. Normals and
+    UVs are snapped to a grid of ``tolerance`` size, if given."""
+    names = vertex_arr.dtype.names
+    key_arr = np.empty(len(vertex_arr), dtype=[(name, vertex_arr.dtype.fields[name][0]) for name in names])
+
+    for name in names:
+        values = vertex_arr[name]
 
-    return vertex_arr, np.arange(len(unique_indices), dtype=np.uint32)[inverse_indices]
+        if values.dtype.base == np.float32:
+            if tolerance > 0 and (name == "Normal" or name.startswith("TexCoord")):
+                values = np.round(values / tolerance) * tolerance
+            # +0.0 so -0.0 welds with 0.0
+            values = values + np.float32(0.0)
+
+        key_arr[name] = values
+
+    return key_arr.view(np.uint32).reshape((len(vertex_arr), -1))
+
+
+def hash_rows(rows: NDArray[np.uint32]) -> NDArray[np.uint64]:
+    """64-bit FNV-1a style hash of each row"""
+    hashes = np.full(len(rows), 0xCBF29CE484222325, dtype=np.uint64)
+    prime = np.uint64(0x100000001B3)
+    for i in range(rows.shape[1]):
+        hashes ^= rows[:, i]
+        hashes *= prime
+
+    return hashes
+
+
+def dedupe_and_get_indices(vertex_arr: NDArray, tolerance: float = 0.0) -> Tuple[NDArray, NDArray[np.uint32]]:
+    """Remove duplicate vertices from the buffer and get the new vertex indices in triangle order (used for IndexBuffer).
+    Vertices keep the order they are first used in. With ``tolerance``, vertices with normals and UVs closer than it
+    are welded too, keeping the values of the first one. Returns vertices, indices."""
+    keys = get_vertex_weld_keys(vertex_arr, tolerance)
+    rows = keys.view(np.dtype((np.void, keys.shape[1] * keys.itemsize))).ravel()
+
+    # Group by hash, which is a single 64-bit sort instead of a field by field one, then check that all vertices in a
+    # group are equal. A hash collision falls back to grouping by the vertex bytes.
+    _, first_indices, inverse_indices = np.unique(hash_rows(keys), return_index=True, return_inverse=True)
+    if not np.array_equal(rows, rows[first_indices][inverse_indices]):
+        _, first_indices, inverse_indices = np.unique(rows, return_index=True, return_inverse=True)
+
+    # np.unique orders the vertices by value, restore first-use order
+    order = np.argsort(first_indices)
+    new_indices = np.empty(len(order), dtype=np.uint32)
+    new_indices[order] = np.arange(len(order), dtype=np.uint32)
+
+    return vertex_arr[first_indices[order]], new_indices[inverse_indices.ravel()]
+
+
+def get_vertex_group_weights(mesh: bpy.types.Mesh) -> Tuple[NDArray[np.int32], NDArray[np.int32], NDArray[np.float32]]:
+    """Get the vertex group weights of all vertices in a single pass. Returns the number of groups of each vertex
+    and the group indices and weights of all vertices, concatenated in vertex order."""
+    vertex_groups = [vert.groups for vert in mesh.vertices]
+    group_counts = np.fromiter((len(groups) for groups in vertex_groups), dtype=np.int32, count=len(vertex_groups))
+    elements = np.array([(grp.group, grp.weight) for groups in vertex_groups for grp in groups],
+                        dtype=np.float64).reshape((-1, 2))
+
+    return group_counts, elements[:, 0].astype(np.int32), elements[:, 1].astype(np.float32)
+
+
+def get_top_four_groups(group_counts: NDArray[np.int32], group_inds: NDArray[np.int32],
+                        group_weights: NDArray[np.float32]) -> Tuple[NDArray[np.int32], NDArray[np.float32]]:
+    """Get the 4 vertex group slots of each vertex, as returned by ``get_vertex_group_weights``. Vertices with more
+    than 4 groups keep the 4 with the largest weights. Slots keep the order of the groups in the vertex, and empty
+    slots have group -1 and weight 0. Returns group indices, weights."""
+    num_verts = len(group_counts)
+    vgroup_slots = np.full((num_verts, 4), -1, dtype=np.int32)
+    weight_slots = np.zeros((num_verts, 4), dtype=np.float32)
+
+    if num_verts == 0 or len(group_inds) == 0:
+        return vgroup_slots, weight_slots
+
+    vert_starts = np.cumsum(group_counts) - group_counts
+    elem_verts = np.repeat(np.arange(num_verts), group_counts)
+    elem_positions = np.arange(len(group_inds)) - vert_starts[elem_verts]
+
+    in_slots = elem_positions < 4
+    vgroup_slots[elem_verts[in_slots], elem_positions[in_slots]] = group_inds[in_slots]
+    weight_slots[elem_verts[in_slots], elem_positions[in_slots]] = group_weights[in_slots]
+
+    # Vertices with more than 4 groups are rare, only those are laid out with all their groups
+    over_verts = np.flatnonzero(group_counts > 4)
+    if len(over_verts) == 0:
+        return vgroup_slots, weight_slots
+
+    over_row = np.full(num_verts, -1, dtype=np.int64)
+    over_row[over_verts] = np.arange(len(over_verts))
+    over_elems = over_row[elem_verts] >= 0
+    rows = over_row[elem_verts[over_elems]]
+    cols = elem_positions[over_elems]
+
+    max_count = int(group_counts[over_verts].max())
+    over_groups = np.full((len(over_verts), max_count), -1, dtype=np.int32)
+    over_weights = np.full((len(over_verts), max_count), -np.inf, dtype=np.float32)
+    over_groups[rows, cols] = group_inds[over_elems]
+    over_weights[rows, cols] = group_weights[over_elems]
+
+    # Largest 4 weights, back in group order
+    top_cols = np.sort(np.argpartition(-over_weights, 3, axis=1)[:, :4], axis=1)
+    vgroup_slots[over_verts] = np.take_along_axis(over_groups, top_cols, axis=1)
+    weight_slots[over_verts] = np.take_along_axis(over_weights, top_cols, axis=1)
+
+    return vgroup_slots, weight_slots
 
 
 class VertexBufferBuilder:
@@ -131,19 +231,16 @@ class VertexBufferBuilder:
 
     def _get_weights_indices(self) -> Tuple[NDArray[np.uint32], NDArray[np.uint32]]:
         """Get all BlendWeights and BlendIndices."""
-        num_verts = len(self.mesh.vertices)
-        bone_by_vgroup = self._bone_by_vgroup
-
-        ind_arr = np.zeros((num_verts, 4), dtype=np.uint32)
-        weights_arr = np.zeros((num_verts, 4), dtype=np.float32)
+        group_counts, group_inds, group_weights = get_vertex_group_weights(self.mesh)
+        vgroup_slots, weights_arr = get_top_four_groups(group_counts, group_inds, group_weights)
 
-        for i, vert in enumerate(self.mesh.vertices):
-            for j, grp in enumerate(vert.groups):
-                if j > 3:
-                    break
+        bone_by_vgroup = self._bone_by_vgroup
+        bone_lookup = np.zeros(max(bone_by_vgroup.keys(), default=-1) + 2, dtype=np.uint32)
+        for vgroup_ind, bone_ind in bone_by_vgroup.items():
+            bone_lookup[vgroup_ind] = bone_ind
 
-                weights_arr[i][j] = grp.weight
-                ind_arr[i][j] = bone_by_vgroup[grp.group]
+        # Empty slots are -1, which is the last lookup entry (bone 0)
+        ind_arr = bone_lookup[vgroup_slots]
 
         weights_arr = self._normalize_weights(weights_arr)
         weights_arr, ind_arr = self._sort_weights_inds(weights_arr, ind_arr)
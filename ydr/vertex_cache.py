@@ -0,0 +1,169 @@
+"""
+Triangle and vertex reordering of index buffers for the post-transform vertex cache, with Tipsify (Sander, Nehab and
+Barczak, "Fast Triangle Reordering for Vertex Locality and Reduced Overdraw", 2007). Triangles are emitted in fans
+around the vertices still in the cache, the clusters it produces can then be sorted to draw outer faces first, and
+vertices are renumbered in the order they are first used.
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+from typing import Tuple
+
+CACHE_SIZE = 16
+
+
+def calc_acmr(indices: NDArray[np.uint32], cache_size: int = CACHE_SIZE) -> float:
+    """Average cache miss ratio, the number of vertices transformed per triangle with a FIFO cache of ``cache_size``.
+    1.0 or less is very good, 3.0 is the worst."""
+    num_tris = len(indices) // 3
+    if num_tris == 0:
+        return 0.0
+
+    cache_time = {}
+    time = 0
+    for v in indices.tolist():
+        if time - cache_time.get(v, -cache_size - 1) > cache_size:
+            cache_time[v] = time
+            time += 1
+
+    return time / num_tris
+
+
+def get_vertex_triangles(tris: NDArray[np.uint32], num_verts: int) -> list[list[int]]:
+    """Get the triangles that use each vertex"""
+    tri_of_corner = np.repeat(np.arange(len(tris)), 3)
+    corner_verts = tris.ravel()
+    order = np.argsort(corner_verts, kind="stable")
+    splits = np.cumsum(np.bincount(corner_verts, minlength=num_verts))[:-1]
+
+    return [tri_inds.tolist() for tri_inds in np.split(tri_of_corner[order], splits)]
+
+
+def tipsify(indices: NDArray[np.uint32], num_verts: int,
+            cache_size: int = CACHE_SIZE) -> Tuple[NDArray[np.uint32], list[int]]:
+    """Reorder the triangles of ``indices`` for the vertex cache. Returns the new indices and the index of the first
+    triangle of each cluster, where the cache is reset by jumping to an unrelated part of the mesh."""
+    tris = indices.reshape((-1, 3))
+    tri_verts = tris.tolist()
+    vertex_tris = get_vertex_triangles(tris, num_verts)
+    live_tris = [len(tri_inds) for tri_inds in vertex_tris]
+    cache_time = [0] * num_verts
+    emitted = [False] * len(tri_verts)
+
+    new_tris = []
+    cluster_starts = []
+    dead_ends = []
+    time = cache_size + 1
+    cursor = 0
+    fan_vert = next((v for v in range(num_verts) if live_tris[v] > 0), -1)
+    new_cluster = True
+
+    while fan_vert >= 0:
+        if new_cluster:
+            cluster_starts.append(len(new_tris))
+
+        candidates = []
+        for tri_ind in vertex_tris[fan_vert]:
+            if emitted[tri_ind]:
+                continue
+
+            emitted[tri_ind] = True
+            tri = tri_verts[tri_ind]
+            new_tris.append(tri)
+
+            for v in tri:
+                dead_ends.append(v)
+                candidates.append(v)
+                live_tris[v] -= 1
+
+                if time - cache_time[v] > cache_size:
+                    cache_time[v] = time
+                    time += 1
+
+        # Next fan around the candidate that stays longest in the cache after its remaining triangles are emitted
+        fan_vert = -1
+        best_priority = -1
+        for v in candidates:
+            if live_tris[v] <= 0:
+                continue
+
+            priority = 0
+            if time - cache_time[v] + 2 * live_tris[v] <= cache_size:
+                priority = time - cache_time[v]
+
+            if priority > best_priority:
+                best_priority = priority
+                fan_vert = v
+
+        new_cluster = fan_vert < 0
+        if fan_vert >= 0:
+            continue
+
+        # Dead end, try recently used vertices first, then any vertex left
+        while dead_ends:
+            v = dead_ends.pop()
+            if live_tris[v] > 0:
+                fan_vert = v
+                break
+
+        while fan_vert < 0 and cursor < num_verts:
+            if live_tris[cursor] > 0:
+                fan_vert = cursor
+            cursor += 1
+
+    if not new_tris:
+        return np.empty(0, dtype=np.uint32), []
+
+    return np.array(new_tris, dtype=np.uint32).ravel(), cluster_starts
+
+
+def sort_clusters_for_overdraw(indices: NDArray[np.uint32], positions: NDArray[np.float32],
+                               cluster_starts: list[int]) -> NDArray[np.uint32]:
+    """Sort the triangle clusters from ``tipsify`` so the ones facing away from the center of the mesh are drawn
+    first. These are more likely to occlude the rest, reducing overdraw."""
+    tris = indices.reshape((-1, 3))
+    if len(cluster_starts) < 2:
+        return indices
+
+    corners = positions[tris].astype(np.float64)
+    tri_normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    # Area-weighted, the cross product length is twice the triangle area
+    tri_areas = np.linalg.norm(tri_normals, axis=1)
+    tri_centroids = corners.mean(axis=1)
+    mesh_centroid = (tri_centroids * tri_areas[:, None]).sum(axis=0) / max(tri_areas.sum(), 1e-12)
+
+    starts = np.array(cluster_starts)
+    cluster_normals = np.add.reduceat(tri_normals, starts)
+    cluster_centroids = np.add.reduceat(tri_centroids * tri_areas[:, None], starts)
+    cluster_areas = np.add.reduceat(tri_areas, starts)
+    cluster_centroids /= np.maximum(cluster_areas, 1e-12)[:, None]
+
+    scores = np.einsum("ij,ij->i", cluster_centroids - mesh_centroid, cluster_normals)
+    cluster_order = np.argsort(-scores, kind="stable")
+
+    ends = np.append(starts[1:], len(tris))
+    return np.concatenate([tris[starts[i]:ends[i]] for i in cluster_order]).ravel()
+
+
+def reorder_vertices_by_first_use(vertex_arr: NDArray, indices: NDArray[np.uint32]) -> Tuple[NDArray, NDArray[np.uint32]]:
+    """Renumber the vertices in the order the triangles use them. Unused vertices are removed. Returns vertices,
+    indices."""
+    used_verts, first_uses = np.unique(indices, return_index=True)
+    order = used_verts[np.argsort(first_uses)]
+
+    new_indices = np.empty(len(vertex_arr), dtype=np.uint32)
+    new_indices[order] = np.arange(len(order), dtype=np.uint32)
+
+    return vertex_arr[order], new_indices[indices]
+
+
+def optimize_vertex_cache(vertex_arr: NDArray, indices: NDArray[np.uint32],
+                          reduce_overdraw: bool = False) -> Tuple[NDArray, NDArray[np.uint32]]:
+    """Reorder the triangles for the vertex cache and, if ``reduce_overdraw``, the clusters of triangles for
+    overdraw. Then renumber the vertices by first use. Returns vertices, indices."""
+    indices, cluster_starts = tipsify(indices, len(vertex_arr))
+
+    if reduce_overdraw:
+        indices = sort_clusters_for_overdraw(indices, vertex_arr["Position"], cluster_starts)
+
+    return reorder_vertices_by_first_use(vertex_arr, indices)
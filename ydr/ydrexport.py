@@ -50,12 +50,14 @@ from ..ybn.ybnexport import create_composite_xml, create_bound_xml
 from .properties import get_model_properties
 from .render_bucket import RenderBucket
 from .vertex_buffer_builder import VertexBufferBuilder, dedupe_and_get_indices, remove_arr_field, remove_unused_colors, get_bone_by_vgroup, remove_unused_uvs
+from .vertex_cache import calc_acmr, optimize_vertex_cache
 from .lights import create_xml_lights
 from ..cwxml.shader import ShaderManager, ShaderDef, ShaderParameterFloatVectorDef, ShaderParameterType
 
-from .. import logger
+from .. import logger, profiling
 
 
+@profiling.span("export_ydr")
 def export_ydr(drawable_obj: bpy.types.Object, filepath: str) -> bool:
     export_settings = get_export_settings()
 
@@ -67,6 +69,7 @@ def export_ydr(drawable_obj: bpy.types.Object, filepath: str) -> bool:
     return True
 
 
+@profiling.span("create_drawable_xml")
 def create_drawable_xml(drawable_obj: bpy.types.Object, armature_obj: Optional[bpy.types.Object] = None, materials: Optional[list[bpy.types.Material]] = None, auto_calc_volume: bool = False, auto_calc_inertia: bool = False, apply_transforms: bool = False):
     """Create a ``Drawable`` cwxml object. Optionally specify an external ``armature_obj`` if ``drawable_obj`` is not an armature."""
     drawable_xml = Drawable()
@@ -117,6 +120,7 @@ def create_drawable_xml(drawable_obj: bpy.types.Object, armature_obj: Optional[b
     return drawable_xml
 
 
+@profiling.span("create_model_xmls")
 def create_model_xmls(drawable_xml: Drawable, drawable_obj: bpy.types.Object, materials: list[bpy.types.Material], bones: Optional[list[bpy.types.Bone]] = None):
     model_objs = get_model_objs(drawable_obj)
 
@@ -176,12 +180,13 @@ def create_model_xml(model_obj: bpy.types.Object, lod_level: LODLevel, materials
 
     set_model_xml_properties(model_obj, lod_level, bones, model_xml)
 
-    obj_eval = get_evaluated_obj(model_obj)
-    mesh_eval = obj_eval.to_mesh()
-    triangulate_mesh(mesh_eval)
+    with profiling.span("evaluate_mesh"):
+        obj_eval = get_evaluated_obj(model_obj)
+        mesh_eval = obj_eval.to_mesh()
+        triangulate_mesh(mesh_eval)
 
-    if transforms_to_apply is not None:
-        mesh_eval.transform(transforms_to_apply)
+        if transforms_to_apply is not None:
+            mesh_eval.transform(transforms_to_apply)
 
     geometries = create_geometries_xml(
         mesh_eval, materials, bones, model_obj.vertex_groups)
@@ -230,6 +235,7 @@ def set_model_xml_properties(model_obj: bpy.types.Object, lod_level: LODLevel, b
         model_xml.matrix_count = len(bones)
 
 
+@profiling.span("create_geometries_xml")
 def create_geometries_xml(mesh_eval: bpy.types.Mesh, materials: list[bpy.types.Material], bones: Optional[list[bpy.types.Bone]] = None, vertex_groups: Optional[list[bpy.types.VertexGroup]] = None) -> list[Geometry]:
     if len(mesh_eval.loops) == 0:
         logger.warning(
@@ -247,8 +253,11 @@ def create_geometries_xml(mesh_eval: bpy.types.Mesh, materials: list[bpy.types.M
 
     bone_by_vgroup = get_bone_by_vgroup(
         vertex_groups, bones) if bones and vertex_groups else None
+    export_settings = get_export_settings()
 
-    total_vert_buffer = VertexBufferBuilder(mesh_eval, bone_by_vgroup).build()
+    with profiling.span("build_vertex_buffer"):
+        total_vert_buffer = VertexBufferBuilder(mesh_eval, bone_by_vgroup).build()
+        profiling.count("loops", len(total_vert_buffer))
 
     for mat_index, loop_inds in loop_inds_by_mat.items():
         material = materials[mat_index]
@@ -268,7 +277,20 @@ def create_geometries_xml(mesh_eval: bpy.types.Mesh, materials: list[bpy.types.M
         if not normal_required:
             vert_buffer = remove_arr_field("Normal", vert_buffer)
 
-        vert_buffer, ind_buffer = dedupe_and_get_indices(vert_buffer)
+        with profiling.span("dedupe_and_get_indices"):
+            vert_buffer, ind_buffer = dedupe_and_get_indices(vert_buffer, export_settings.weld_tolerance)
+            profiling.count("vertices", len(vert_buffer))
+            profiling.count("triangles", len(ind_buffer) // 3)
+
+        if export_settings.optimize_vertex_cache:
+            with profiling.span("optimize_vertex_cache"):
+                acmr_before = calc_acmr(ind_buffer)
+                vert_buffer, ind_buffer = optimize_vertex_cache(
+                    vert_buffer, ind_buffer, export_settings.reduce_overdraw)
+                acmr_after = calc_acmr(ind_buffer)
+
+            logger.info(f"Drawable Model '{mesh_eval.original.name}' material '{material.name}': vertex cache miss "
+                        f"ratio {acmr_before:.3f} -> {acmr_after:.3f}")
 
         geom_xml = Geometry()
 
@@ -591,6 +613,7 @@ def split_vert_buffers(
     return (tuple(split_vert_arrs), tuple(split_ind_arrs))
 
 
+@profiling.span("create_shader_group_xml")
 def create_shader_group_xml(materials: list[bpy.types.Material], drawable_xml: Drawable):
     shaders = get_shaders_from_blender(materials)
     texture_dictionary = texture_dictionary_from_materials(materials)
@@ -659,6 +682,7 @@ def set_texture_flags(node: bpy.types.ShaderNodeTexImage, texture: Texture):
     return texture
 
 
+@profiling.span("create_skeleton_xml")
 def create_skeleton_xml(armature_obj: bpy.types.Object, apply_transforms: bool = False):
     if armature_obj.type != "ARMATURE" or not armature_obj.pose.bones:
         return None
@@ -891,6 +915,7 @@ def set_drawable_xml_extents(drawable_xml: Drawable):
     drawable_xml.bounding_box_max = bbmax
 
 
+@profiling.span("create_embedded_collision_xmls")
 def create_embedded_collision_xmls(drawable_obj: bpy.types.Object, drawable_xml: Drawable, auto_calc_volume: bool = False, auto_calc_inertia: bool = False):
     for child in drawable_obj.children:
         bound_xml = None
@@ -917,6 +942,7 @@ def set_drawable_xml_properties(drawable_obj: bpy.types.Object, drawable_xml: Dr
     drawable_xml.lod_dist_vlow = drawable_obj.drawable_properties.lod_dist_vlow
 
 
+@profiling.span("write_embedded_textures")
 def write_embedded_textures(drawable_obj: bpy.types.Object, filepath: str):
     materials = get_sollumz_materials(drawable_obj)
     directory = os.path.dirname(filepath)
@@ -13,15 +13,18 @@ from ..cwxml.bound import BoundChild
 from ..tools.blenderhelper import add_child_of_bone_constraint, create_empty_object, create_blender_object, join_objects, add_armature_modifier, parent_objs
 from ..tools.utils import get_filename
 from ..shared.shader_nodes import SzShaderNodeParameter
-from .model_data import ModelData, get_model_data, get_model_data_split_by_group
+from ..cwxml.cache import get_active_cache
+from ..cwxml.parallel import PreparsedFiles
+from .model_data import ModelData, get_model_data, is_model_data_of, split_models_by_group
 from .mesh_builder import MeshBuilder
 from ..lods import LODLevels
 from .lights import create_light_objs
 from .properties import DrawableModelProperties
 from .render_bucket import RenderBucket
-from .. import logger
+from .. import logger, profiling
 
 
+@profiling.span("import_ydr")
 def import_ydr(filepath: str):
     import_settings = get_import_settings()
 
@@ -34,6 +37,7 @@ def import_ydr(filepath: str):
     return create_drawable_obj(ydr_xml, filepath, name)
 
 
+@profiling.span("create_drawable_obj")
 def create_drawable_obj(drawable_xml: Drawable, filepath: str, name: Optional[str] = None, split_by_group: bool = False, external_armature: Optional[bpy.types.Object] = None, external_bones: Optional[list[Bone]] = None, materials: Optional[list[bpy.types.Material]] = None):
     """Create a drawable object. ``split_by_group`` will split each Drawable Model by vertex group. ``external_armature`` allows for bones to be rigged to an armature object that is not the parent drawable."""
     name = name or drawable_xml.name
@@ -70,16 +74,32 @@ def create_drawable_obj(drawable_xml: Drawable, filepath: str, name: Optional[st
     return drawable_obj
 
 
+def load_model_data(drawable_xml: Drawable, split_by_group: bool = False) -> list[ModelData]:
+    """Get the ModelData of each DrawableModel. Uses the data prepared with the parsed file in a worker process if
+    there is any and the models haven't changed since."""
+    with profiling.span("get_model_data"):
+        preparsed = get_active_cache()
+        model_datas = preparsed.pop_prepared(drawable_xml) if isinstance(preparsed, PreparsedFiles) else None
+
+        if model_datas is None or not is_model_data_of(model_datas, drawable_xml):
+            model_datas = get_model_data(drawable_xml)
+
+        if split_by_group:
+            model_datas = split_models_by_group(model_datas, drawable_xml.skeleton.bones)
+
+    return model_datas
+
+
 def create_drawable_models(drawable_xml: Drawable, materials: list[bpy.types.Material], model_names: Optional[str] = None):
-    model_datas = get_model_data(drawable_xml)
+    model_datas = load_model_data(drawable_xml)
+
     model_names = model_names or SOLLUMZ_UI_NAMES[SollumType.DRAWABLE_MODEL]
 
     return [create_model_obj(model_data, materials, name=model_names) for model_data in model_datas]
 
 
 def create_rigged_drawable_models(drawable_xml: Drawable, materials: list[bpy.types.Material], drawable_obj: bpy.types.Object, armature_obj: bpy.types.Object, split_by_group: bool = False):
-    model_datas = get_model_data(
-        drawable_xml) if not split_by_group else get_model_data_split_by_group(drawable_xml)
+    model_datas = load_model_data(drawable_xml, split_by_group)
 
     set_skinned_model_properties(drawable_obj, drawable_xml)
 
@@ -119,15 +139,18 @@ def create_lod_meshes(model_data: ModelData, model_obj: bpy.types.Object, materi
         mesh_name = f"{model_obj.name}_{SOLLUMZ_UI_NAMES[lod_level].lower().replace(' ', '_')}"
 
         try:
-            mesh_builder = MeshBuilder(
-                mesh_name,
-                mesh_data.vert_arr,
-                mesh_data.ind_arr,
-                mesh_data.mat_inds,
-                materials
-            )
-
-            lod_mesh = mesh_builder.build()
+            with profiling.span("build_mesh"):
+                mesh_builder = MeshBuilder(
+                    mesh_name,
+                    mesh_data.vert_arr,
+                    mesh_data.ind_arr,
+                    mesh_data.mat_inds,
+                    materials
+                )
+
+                lod_mesh = mesh_builder.build()
+                profiling.count("vertices", len(mesh_data.vert_arr))
+                profiling.count("triangles", len(mesh_data.ind_arr) // 3)
         except:
             logger.error(
                 f"Error occured during creation of mesh '{mesh_name}'! Is the mesh data valid?\n{traceback.format_exc()}")
@@ -142,7 +165,8 @@ def create_lod_meshes(model_data: ModelData, model_obj: bpy.types.Object, materi
         is_skinned = "BlendWeights" in mesh_data.vert_arr.dtype.names
 
         if is_skinned and bones is not None:
-            mesh_builder.create_vertex_groups(model_obj, bones)
+            with profiling.span("create_vertex_groups"):
+                mesh_builder.create_vertex_groups(model_obj, bones)
 
     lod_levels.set_highest_lod_active()
 
@@ -183,6 +207,7 @@ def set_drawable_model_properties(model_props: DrawableModelProperties, model_xm
     model_props.render_mask = model_xml.render_mask
 
 
+@profiling.span("create_drawable_armature")
 def create_drawable_armature(drawable_xml: Drawable, name: str):
     drawable_obj = create_armature_obj_from_skel(
         drawable_xml.skeleton, name, SollumType.DRAWABLE)
@@ -217,6 +242,7 @@ def create_drawable_empty(name: str, drawable_xml: Drawable):
     return drawable_obj
 
 
+@profiling.span("shadergroup_to_materials")
 def shadergroup_to_materials(shader_group: ShaderGroup, filepath: str):
     materials = []
 
@@ -442,6 +468,7 @@ def create_limit_pos_bone_constraint(trans_limit: BoneLimit, pose_bone: bpy.type
     constraint.min_z = trans_limit.min.z
 
 
+@profiling.span("create_embedded_collisions")
 def create_embedded_collisions(bounds_xml: list[BoundChild], drawable_obj: bpy.types.Object):
     col_name = f"{drawable_obj.name}.col"
     bound_objs: list[bpy.types.Object] = []
@@ -463,6 +490,7 @@ def create_embedded_collisions(bounds_xml: list[BoundChild], drawable_obj: bpy.t
         bound_obj.parent = drawable_obj
 
 
+@profiling.span("create_drawable_lights")
 def create_drawable_lights(drawable_xml: Drawable, drawable_obj: bpy.types.Object, armature_obj: Optional[bpy.types.Object] = None):
     lights = create_light_objs(drawable_xml.lights, armature_obj)
     lights.parent = drawable_obj
@@ -1,5 +1,6 @@
 import bpy
 from typing import Optional, Tuple
+from copy import copy
 from collections import defaultdict
 from itertools import combinations
 from mathutils import Matrix, Vector
@@ -24,7 +25,7 @@ from ..sollumz_preferences import get_export_settings
 from ..ybn.ybnexport import has_col_mats, bound_geom_has_mats, get_bound_extents
 from ..ydr.ydrexport import create_drawable_xml, write_embedded_textures, get_bone_index, create_model_xml, append_model_xml, set_drawable_xml_extents
 from ..ydr.lights import create_xml_lights
-from .. import logger
+from .. import logger, profiling
 from .properties import (
     LODProperties, FragArchetypeProperties, GroupProperties, PAINT_LAYER_VALUES,
     GroupFlagBit, get_glass_type_index,
@@ -32,6 +33,7 @@ from .properties import (
 )
 
 
+@profiling.span("export_yft")
 def export_yft(frag_obj: bpy.types.Object, filepath: str) -> bool:
     export_settings = get_export_settings()
     frag_xml = create_fragment_xml(frag_obj, export_settings.auto_calculate_inertia,
@@ -60,6 +62,7 @@ def export_yft(frag_obj: bpy.types.Object, filepath: str) -> bool:
     return True
 
 
+@profiling.span("create_fragment_xml")
 def create_fragment_xml(frag_obj: bpy.types.Object, auto_calc_inertia: bool = False, auto_calc_volume: bool = False, apply_transforms: bool = False):
     """Create an XML parsable Fragment object. Returns the XML object and the hi XML object (if hi lods are present)."""
     frag_xml = Fragment()
@@ -135,6 +138,7 @@ def set_paint_layer_shader_params(materials: list[bpy.types.Material], shader_gr
             param.x, param.y, param.z, param.w = (2, value, value, 0)
 
 
+@profiling.span("create_hi_frag_xml")
 def create_hi_frag_xml(frag_obj: bpy.types.Object, frag_xml: Fragment, apply_transforms: bool = False):
     hi_obj = frag_obj.copy()
     hi_obj.name = f"{remove_number_suffix(hi_obj.name)}_hi"
@@ -154,8 +158,7 @@ def create_hi_frag_xml(frag_obj: bpy.types.Object, frag_xml: Fragment, apply_tra
     materials = get_sollumz_materials(hi_obj)
     hi_drawable = create_frag_drawable_xml(hi_obj, materials, apply_transforms)
 
-    hi_frag_xml = Fragment()
-    hi_frag_xml.__dict__ = frag_xml.__dict__.copy()
+    hi_frag_xml = copy(frag_xml)
     hi_frag_xml.drawable = hi_drawable
     hi_frag_xml.vehicle_glass_windows = None
 
@@ -306,6 +309,7 @@ def frag_has_collisions(frag_obj: bpy.types.Object):
     return any(child.sollum_type == SollumType.BOUND_COMPOSITE for child in frag_obj.children)
 
 
+@profiling.span("create_frag_physics_xml")
 def create_frag_physics_xml(frag_obj: bpy.types.Object, frag_xml: Fragment, materials: list[bpy.types.Material], auto_calc_inertia: bool = False, auto_calc_volume: bool = False):
     lod_props: LODProperties = frag_obj.fragment_properties.lod_properties
     drawable_xml = frag_xml.drawable
@@ -713,6 +717,7 @@ def create_phys_child_drawable(child_xml: PhysicsChild, materials: list[bpy.type
     return drawable_xml
 
 
+@profiling.span("create_vehicle_windows_xml")
 def create_vehicle_windows_xml(frag_obj: bpy.types.Object, frag_xml: Fragment, materials: list[bpy.types.Material]):
     """Create all the vehicle windows for ``frag_xml``. Must be ran after the drawable and physics children have been created."""
     child_id_by_bone_tag: dict[str, int] = {
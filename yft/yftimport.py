@@ -16,11 +16,12 @@ from ..cwxml.fragment import YFT, Fragment, PhysicsLOD, PhysicsGroup, PhysicsChi
 from ..cwxml.drawable import Drawable, Bone
 from ..ydr.ydrimport import apply_translation_limits, create_armature_obj_from_skel, create_drawable_skel, apply_rotation_limits, create_joint_constraints, create_light_objs, create_drawable_obj, create_drawable_as_asset, shadergroup_to_materials, create_drawable_models
 from ..ybn.ybnimport import create_bound_object, set_bound_properties
-from .. import logger
+from .. import logger, profiling
 from .properties import LODProperties, FragArchetypeProperties, GlassTypes, PAINT_LAYER_VALUES, FragmentTemplateAsset
 from ..tools.blenderhelper import get_child_of_bone
 
 
+@profiling.span("import_yft")
 def import_yft(filepath: str):
     import_settings = get_import_settings()
 
@@ -50,6 +51,7 @@ def parse_hi_yft(yft_filepath: str) -> Fragment | None:
             f"Could not find _hi yft for {os.path.basename(yft_filepath)}! Make sure there is a file named '{os.path.basename(hi_path)}' in the same directory!")
 
 
+@profiling.span("create_fragment_obj")
 def create_fragment_obj(frag_xml: Fragment, filepath: str, split_by_group: bool = False, hi_xml: Optional[Fragment] = None):
     frag_obj = create_frag_armature(frag_xml)
 
@@ -143,6 +145,7 @@ def get_mat_paint_layer(mat: bpy.types.Material):
     return VehiclePaintLayer.NOT_PAINTABLE
 
 
+@profiling.span("create_phys_lod")
 def create_phys_lod(frag_xml: Fragment, frag_obj: bpy.types.Object):
     """Create the Fragment.Physics.LOD1 data-block. (Currently LOD1 is only supported)"""
     lod_xml = frag_xml.physics.lod1
@@ -170,6 +173,7 @@ def set_all_bone_physics_properties(armature: bpy.types.Armature, frag_xml: Frag
         set_group_properties(group_xml, bone)
 
 
+@profiling.span("create_frag_collisions")
 def create_frag_collisions(frag_xml: Fragment, frag_obj: bpy.types.Object) -> bpy.types.Object | None:
     bounds_xml = frag_xml.physics.lod1.archetype.bounds
 
@@ -224,6 +228,7 @@ def add_col_bone_constraint(bound_obj: bpy.types.Object, frag_obj: bpy.types.Obj
     return constraint
 
 
+@profiling.span("create_phys_child_meshes")
 def create_phys_child_meshes(frag_xml: Fragment, frag_obj: bpy.types.Object, drawable_obj: bpy.types.Object, materials: list[bpy.types.Material]):
     """Create all Fragment.Physics.LOD1.Children meshes. (Only LOD1 currently supported)"""
     lod_xml = frag_xml.physics.lod1
@@ -267,6 +272,7 @@ def create_phys_child_models(drawable_xml: Drawable, frag_obj: bpy.types.Object,
     return child_objs
 
 
+@profiling.span("create_vehicle_windows")
 def create_vehicle_windows(frag_xml: Fragment, frag_obj: bpy.types.Object, materials: list[bpy.types.Material]):
     for window_xml in frag_xml.vehicle_glass_windows:
         window_bone = get_window_bone(
@@ -11,7 +11,7 @@ from ..tools.meshhelper import get_bound_center_from_bounds, get_extents, get_di
 from ..sollumz_properties import SOLLUMZ_UI_NAMES, SollumType
 from ..tools.utils import get_min_vector, get_max_vector
 from ..sollumz_preferences import get_export_settings
-from .. import logger
+from .. import logger, profiling
 
 
 def box_from_obj(obj):
@@ -151,6 +151,7 @@ def calculate_cargen_orient(obj):
     return 5 * math.sin(angle), 5 * math.cos(angle)
 
 
+@profiling.span("ymap_from_object")
 def ymap_from_object(obj):
     ymap = CMapData()
     max_int = (2**31) - 1
@@ -246,6 +247,7 @@ def ymap_from_object(obj):
     return ymap
 
 
+@profiling.span("export_ymap")
 def export_ymap(obj: bpy.types.Object, filepath: str) -> bool:
     ymap = ymap_from_object(obj)
     ymap.write_xml(filepath)
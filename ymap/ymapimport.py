@@ -1,14 +1,15 @@
 import binascii
 import struct
 import math
+from collections import defaultdict
 import bpy
 from mathutils import Vector, Euler
 from ..sollumz_helper import duplicate_object_with_children, set_object_collection
 from ..tools.ymaphelper import add_occluder_material, get_cargen_mesh
 from ..sollumz_properties import SollumType
 from ..sollumz_preferences import get_import_settings
-from ..cwxml.ymap import CMapData, OccludeModel, YMAP
-from .. import logger
+from ..cwxml.ymap import CMapData, Entity, EntityTable, OccludeModel, YMAP, use_entity_tables
+from .. import logger, profiling
 
 # TODO: Make better?
 
@@ -54,6 +55,20 @@ def apply_entity_properties(obj, entity):
     obj.scale = Vector((entity.scale_xy, entity.scale_xy, entity.scale_z))
 
 
+def get_entity_inds_by_name(entities: list[Entity] | EntityTable) -> dict[str, list[int]]:
+    if isinstance(entities, EntityTable):
+        names = entities.get_strings("archetype_name")
+    else:
+        names = [entity.archetype_name for entity in entities]
+
+    entity_inds_by_name = defaultdict(list)
+    for entity_ind, name in enumerate(names):
+        entity_inds_by_name[name].append(entity_ind)
+
+    return entity_inds_by_name
+
+
+@profiling.span("entity_to_obj")
 def entity_to_obj(ymap_obj: bpy.types.Object, ymap: CMapData):
     group_obj = bpy.data.objects.new("Entities", None)
     group_obj.sollum_type = SollumType.YMAP_ENTITY_GROUP
@@ -66,11 +81,12 @@ def entity_to_obj(ymap_obj: bpy.types.Object, ymap: CMapData):
 
     found = False
     if ymap.entities:
+        entity_inds_by_name = get_entity_inds_by_name(ymap.entities)
         for obj in bpy.context.collection.all_objects:
-            for entity in ymap.entities:
-                if entity.archetype_name == obj.name and obj.name in bpy.context.view_layer.objects:
+            for entity_ind in entity_inds_by_name.get(obj.name, ()):
+                if obj.name in bpy.context.view_layer.objects:
                     found = True
-                    apply_entity_properties(obj, entity)
+                    apply_entity_properties(obj, ymap.entities[entity_ind])
         if found:
             logger.info(f"Succesfully imported: {ymap.name}.ymap")
             return True
@@ -83,6 +99,7 @@ def entity_to_obj(ymap_obj: bpy.types.Object, ymap: CMapData):
         return False
 
 
+@profiling.span("instanced_entity_to_obj")
 def instanced_entity_to_obj(ymap_obj: bpy.types.Object, ymap: CMapData):
     group_obj = bpy.data.objects.new("Entities", None)
     group_obj.sollum_type = SollumType.YMAP_ENTITY_GROUP
@@ -101,25 +118,28 @@ def instanced_entity_to_obj(ymap_obj: bpy.types.Object, ymap: CMapData):
         for obj in bpy.context.view_layer.objects:
             existing_objects.append(obj)
 
+        entity_inds_by_name = get_entity_inds_by_name(ymap.entities)
+        found_entity_inds = set()
+
         for obj in existing_objects:
-            for entity in ymap.entities:
-                if entity.archetype_name == obj.name:
-                    if obj.sollum_type == SollumType.DRAWABLE or obj.sollum_type == SollumType.FRAGMENT:
-                        new_obj = duplicate_object_with_children(obj)
-                        apply_entity_properties(new_obj, entity)
-                        new_obj.parent = group_obj
-                        count += 1
-                        entity.found = True
-                    else:
-                        logger.error(
-                            f"Cannot use your '{obj.name}' object because it is not a 'Drawable' type!")
+            for entity_ind in entity_inds_by_name.get(obj.name, ()):
+                if obj.sollum_type == SollumType.DRAWABLE or obj.sollum_type == SollumType.FRAGMENT:
+                    new_obj = duplicate_object_with_children(obj)
+                    apply_entity_properties(new_obj, ymap.entities[entity_ind])
+                    new_obj.parent = group_obj
+                    count += 1
+                    found_entity_inds.add(entity_ind)
+                else:
+                    logger.error(
+                        f"Cannot use your '{obj.name}' object because it is not a 'Drawable' type!")
 
         # Creating empty entity if no object was found for reference, and notify user
         import_settings = get_import_settings()
 
         if not import_settings.ymap_skip_missing_entities:
-            for entity in ymap.entities:
-                if entity.found is None:
+            for entity_ind in range(entities_amount):
+                if entity_ind not in found_entity_inds:
+                    entity = ymap.entities[entity_ind]
                     empty_obj = bpy.data.objects.new(
                         entity.archetype_name + " (not found)", None)
                     empty_obj.parent = group_obj
@@ -232,6 +252,7 @@ def cargen_to_obj(obj: bpy.types.Object, ymap: CMapData):
         cargen_obj.parent = group_obj
 
 
+@profiling.span("ymap_to_obj")
 def ymap_to_obj(ymap: CMapData):
     ymap_obj = bpy.data.objects.new(ymap.name, None)
     ymap_obj.sollum_type = SollumType.YMAP
@@ -293,8 +314,11 @@ def ymap_to_obj(ymap: CMapData):
     return ymap_obj
 
 
+@profiling.span("import_ymap")
 def import_ymap(filepath):
-    ymap_xml: CMapData = YMAP.from_xml_file(filepath)
+    # Entities are only read one at a time when creating their objects, keep them in a table until then
+    with use_entity_tables():
+        ymap_xml: CMapData = YMAP.from_xml_file(filepath)
     found = False
     for obj in bpy.context.scene.objects:
         if obj.sollum_type == SollumType.YMAP and obj.name == ymap_xml.name: